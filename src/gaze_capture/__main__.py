@@ -1,13 +1,16 @@
 import asyncio
-import threading
 import logging
 import nats
 from nats.errors import NoServersError
 
 from gaze_capture.core.manager import EyeTrackingManager
+from gaze_capture.core.metrics import MetricsServer
+from gaze_capture.core.process import ProcessManager
+from gaze_capture.sinks.journal import recover_journals
 from gaze_capture.ui.main_window import GazeCaptureApp
 from gaze_capture.configs.app import AppSettings, LoggingConfig
 from gaze_capture.controllers import TobiiController, DummyController
+from gaze_capture.utils.engine import start_engine
 
 logger = logging.getLogger(__name__)
 
@@ -58,20 +61,28 @@ def main():
     settings = AppSettings()
     setup_logger(settings.logging)
 
-    # Create the high-performance background loop
-    loop = asyncio.new_event_loop()
-    
-    # Start the loop in a dedicated thread
-    thread = threading.Thread(target=loop.run_forever, name="AsyncioEngine", daemon=True)
-    thread.start()
+    # Create the high-performance background loop, running in a dedicated thread
+    loop = start_engine(settings.engine)
+
+    # Journals left behind by a crash are compacted to Parquet off the main thread
+    recover_journals(settings.data_dir, settings.parquet.compaction_rows, settings.parquet.writer)
 
     # Wait for NATS to connect synchronously before starting the app
     future = asyncio.run_coroutine_threadsafe(setup_nats(settings.nats_host), loop)
     nc = future.result()
 
     # Instantiate components
-    controller = TobiiController() if not settings.use_dummy_mode else DummyController()
-    manager = EyeTrackingManager(controller, settings, loop, nc)
+    if settings.engine.isolate:
+        # The engine process finds the tracker itself and runs the pipeline away from the UI
+        manager = ProcessManager(settings, loop, setup_nats)
+    else:
+        controller = TobiiController() if not settings.use_dummy_mode else DummyController()
+        manager = EyeTrackingManager(controller, settings, loop, nc)
+
+    # Optional local metrics endpoint, served from the engine loop
+    metrics = MetricsServer(settings.metrics, manager, nc)
+    if settings.metrics.enabled:
+        asyncio.run_coroutine_threadsafe(metrics.start(), loop).result()
 
     # Start UI on the Main Thread
     app = GazeCaptureApp(manager)
@@ -79,6 +90,7 @@ def main():
     try:
         app.mainloop()
     finally:
+        asyncio.run_coroutine_threadsafe(metrics.stop(), loop).result()
         asyncio.run_coroutine_threadsafe(nc.drain(), loop).result()
         loop.call_soon_threadsafe(loop.stop)
         logger.info("Application closed.")
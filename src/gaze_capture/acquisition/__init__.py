@@ -1,3 +1,4 @@
 from .tobii import TobiiSource
 from .dummy import DummySource
+from .replay import ReplaySource, open_recording, read_recording, table_to_batch
 from .base import GazeSource
\ No newline at end of file
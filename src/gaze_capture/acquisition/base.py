@@ -1,18 +1,43 @@
+import time
 from abc import ABC, abstractmethod
-from asyncio import Queue, Event
-from typing import final
+from asyncio import Event
+from typing import Any, Callable, final
 
-from ..models import GazeData
-from ..utils.types import _END, EndToken
+from ..configs import SourceConfig
+from ..models import GazeData, GazeBatch
+from ..utils.queues import SampleQueue
+from ..utils.tracing import LatencyTracer
+from ..utils.types import _END
 
 class GazeSource(ABC):
     """
     Abstract Base Class for Data Acquisition.
     Responsible for bridging Hardware Callbacks -> Asyncio Queue.
+    Items are either single `GazeData` frames or columnar `GazeBatch` blocks.
     """
-    def __init__(self, screen_width: int, screen_height: int):
-        self.output_queue: Queue[GazeData | EndToken] = Queue()
+    def __init__(self, screen_width: int, screen_height: int, cfg: SourceConfig | None = None):
+        self.cfg = cfg or SourceConfig()
+
+        # Bounded by samples, overflow is resolved by policy and accounted
+        self.output_queue = SampleQueue(
+            capacity=self.cfg.queue_capacity,
+            policy=self.cfg.overflow_policy,
+            block_timeout_s=self.cfg.block_timeout_ms / 1_000,
+        )
         self._stop_event = Event()
+
+        # Set once timestamps can be trusted and data is flowing
+        self.time_sync_ready = Event()
+        self.startup_s: float | None = None
+        self._run_started: float = 0.0
+
+        # Nominal sample rate once known (None = unknown, rate SLOs are skipped)
+        self.expected_hz: float | None = None
+
+        # Clock of `system_timestamp_us` (None = not live, latency is not traced)
+        self.now_us: Callable[[], int] | None = None
+        self.tracer: LatencyTracer | None = None
+
         self.screen_width = screen_width
         self.screen_height = screen_height
 
@@ -29,11 +54,25 @@ class GazeSource(ABC):
         """
         Public entry point. Wraps run() to guarantee End-of-Stream signal.
         """
+        self._run_started = time.perf_counter()
         try:
             await self._collect_data()
         finally:
             await self.output_queue.put(_END)
 
+    def _mark_ready(self) -> None:
+        """Called by subclasses once synchronised and streaming."""
+        self.startup_s = time.perf_counter() - self._run_started
+        self.time_sync_ready.set()
+
+    def _trace(self, checkpoint: str, item: GazeData | GazeBatch) -> None:
+        if self.tracer is not None:
+            self.tracer.record(checkpoint, item)
+
+    def stats(self) -> dict[str, Any]:
+        """Per-session counters, extended by subclasses with hardware specifics."""
+        return {"startup_s": self.startup_s, "queue": self.output_queue.stats()}
+
     @final
     async def stop(self) -> None:
         """
@@ -1,23 +1,63 @@
 import time
 import math
+import random
 import asyncio
 import logging
 
 from gaze_capture.models.gaze import GazeData
 from .base import GazeSource
+from .synthetic import GazeSynthesizer
+from ..configs import SourceConfig
 
 logger = logging.getLogger(__name__)
 
 class DummySource(GazeSource):
     """
     Simulated Source for Testing.
+    "circle" emits one frame per sleep, "synthetic" emits realistic batches
+    at up to thousands of Hz for load testing.
     """
-    def __init__(self, screen_width: int, screen_height: int, frequency: int = 120):
-        super().__init__(screen_width, screen_height)
+    def __init__(self, screen_width: int, screen_height: int, frequency: int = 120, cfg: SourceConfig | None = None):
+        super().__init__(screen_width, screen_height, cfg)
         self.frequency = frequency
+        self.expected_hz = float(frequency)
+        self.now_us = lambda: time.monotonic_ns() // 1_000
 
     async def _collect_data(self) -> None:
-        logger.info(f"Starting Dummy Source @ {self.frequency}Hz")
+        logger.info(f"Starting Dummy Source ({self.cfg.dummy_mode}) @ {self.frequency}Hz")
+        self._mark_ready()
+
+        if self.cfg.dummy_mode == "synthetic":
+            await self._run_synthetic()
+        else:
+            await self._run_circle()
+
+    async def _run_synthetic(self) -> None:
+        """
+        Emits every sample due since the previous emission as one batch.
+        With burstiness > 0, emissions randomly stall for up to 10 periods
+        and then catch up, like a congested USB/SDK delivery.
+        """
+        synth = GazeSynthesizer(self.frequency, self.screen_width, self.screen_height)
+        rng = random.Random()
+        period_s = self.cfg.dummy_batch_ms / 1_000
+        t0 = time.monotonic()
+        emitted = 0
+
+        while not self._stop_event.is_set():
+            stall = period_s
+            if rng.random() < self.cfg.dummy_burstiness:
+                stall *= rng.uniform(2, 10)
+            await asyncio.sleep(stall)
+
+            due = int((time.monotonic() - t0) * self.frequency) - emitted
+            if due > 0:
+                batch = synth.generate(due)
+                await self.output_queue.put(batch)
+                self._trace("enqueue", batch)
+                emitted += due
+
+    async def _run_circle(self) -> None:
         interval_ns = 1_000_000_000 // self.frequency
         t0_ns = time.monotonic_ns()
         frame = 0
@@ -66,6 +106,7 @@ class DummySource(GazeSource):
             )
             
             await self.output_queue.put(model)
+            self._trace("enqueue", model)
             
             # Sleep
             frame += 1
@@ -0,0 +1,192 @@
+from typing import Any, Callable
+
+import numpy as np
+
+from ..models import GazeBatch
+
+def gaze_midpoint(
+    lx: np.ndarray,
+    ly: np.ndarray,
+    rx: np.ndarray,
+    ry: np.ndarray,
+    l_valid: np.ndarray,
+    r_valid: np.ndarray,
+    screen_width: int,
+    screen_height: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized midpoint, screen-bounds check and pixel rounding.
+    Returns (mid_x, mid_y, x_px, y_px, px_valid), mid is NaN when no eye is valid.
+    Matches `midpoint_scalar` bit for bit.
+    """
+    # Average when both eyes are valid, otherwise fall back to the valid one
+    both = l_valid & r_valid
+    mid_x = np.where(both, (lx + rx) / 2, np.where(l_valid, lx, np.where(r_valid, rx, np.nan)))
+    mid_y = np.where(both, (ly + ry) / 2, np.where(l_valid, ly, np.where(r_valid, ry, np.nan)))
+
+    # Must be inside screen limits (NaN compares False)
+    px_valid = (0. <= mid_x) & (mid_x < 1.) & (0. <= mid_y) & (mid_y < 1.)
+
+    # Truncate like int(), zeroing invalid rows first to avoid casting NaN
+    x_px = (np.where(px_valid, mid_x, 0.) * screen_width).astype(np.int32)
+    y_px = (np.where(px_valid, mid_y, 0.) * screen_height).astype(np.int32)
+    return mid_x, mid_y, x_px, y_px, px_valid
+
+def midpoint_scalar(
+    lx: float | None,
+    ly: float | None,
+    rx: float | None,
+    ry: float | None,
+    screen_width: int,
+    screen_height: int,
+) -> tuple[float | None, float | None, int | None, int | None]:
+    """Reference scalar implementation (per-sample), an eye is valid when not None."""
+    l_valid, r_valid = lx is not None, rx is not None
+
+    # Calculate midpoint
+    if l_valid and r_valid:
+        mid_x = (lx + rx) / 2
+        mid_y = (ly + ry) / 2
+    elif l_valid:
+        mid_x, mid_y = lx, ly
+    elif r_valid:
+        mid_x, mid_y = rx, ry
+    else:
+        mid_x, mid_y = None, None
+
+    #  Must be inside screen limits
+    mid_x_valid = mid_x is not None and 0. <= mid_x < 1.
+    mid_y_valid = mid_y is not None and 0. <= mid_y < 1.
+
+    # Round to nearest pixel
+    if mid_x_valid and mid_y_valid:
+        return mid_x, mid_y, int(mid_x * screen_width), int(mid_y * screen_height)
+    return mid_x, mid_y, None, None
+
+def batch_from_dicts(
+    samples: list[dict[str, Any]],
+    screen_width: int,
+    screen_height: int,
+    to_utc_ms: Callable[[np.ndarray], np.ndarray],
+) -> GazeBatch:
+    """
+    Builds a `GazeBatch` from Tobii `as_dictionary=True` samples in one pass per column.
+    Invalid eyes/pupils/origins are masked to NaN regardless of what the SDK reported.
+    """
+    def col(key: str) -> np.ndarray:
+        return np.array([d[key] for d in samples], dtype=np.float64)
+
+    def valid(key: str) -> np.ndarray:
+        return np.array([d[key] for d in samples], dtype=bool)
+
+    return _assemble_batch(
+        screen_width, screen_height, to_utc_ms,
+        device_ts=np.array([d["device_time_stamp"] for d in samples], dtype=np.int64),
+        system_ts=np.array([d["system_time_stamp"] for d in samples], dtype=np.int64),
+        l_valid=valid("left_gaze_point_validity"),
+        r_valid=valid("right_gaze_point_validity"),
+        l_point=col("left_gaze_point_on_display_area"),
+        r_point=col("right_gaze_point_on_display_area"),
+        l_3d=col("left_gaze_point_in_user_coordinate_system"),
+        r_3d=col("right_gaze_point_in_user_coordinate_system"),
+        l_pupil_valid=valid("left_pupil_validity"),
+        r_pupil_valid=valid("right_pupil_validity"),
+        l_pupil=col("left_pupil_diameter"),
+        r_pupil=col("right_pupil_diameter"),
+        l_origin_valid=valid("left_gaze_origin_validity"),
+        r_origin_valid=valid("right_gaze_origin_validity"),
+        l_origin=col("left_gaze_origin_in_user_coordinate_system"),
+        r_origin=col("right_gaze_origin_in_user_coordinate_system"),
+    )
+
+def batch_from_objects(
+    samples: list[Any],
+    screen_width: int,
+    screen_height: int,
+    to_utc_ms: Callable[[np.ndarray], np.ndarray],
+) -> GazeBatch:
+    """
+    Builds a `GazeBatch` from Tobii `as_dictionary=False` samples (`tr.GazeData` objects).
+    Fields are read through the SDK's eye/point/pupil/origin accessors, no dict lookups.
+    """
+    left = [s.left_eye for s in samples]
+    right = [s.right_eye for s in samples]
+    l_point, r_point = [e.gaze_point for e in left], [e.gaze_point for e in right]
+    l_pupil, r_pupil = [e.pupil for e in left], [e.pupil for e in right]
+    l_origin, r_origin = [e.gaze_origin for e in left], [e.gaze_origin for e in right]
+
+    def col(values: list) -> np.ndarray:
+        return np.array(values, dtype=np.float64)
+
+    def valid(parts: list) -> np.ndarray:
+        return np.array([p.validity for p in parts], dtype=bool)
+
+    return _assemble_batch(
+        screen_width, screen_height, to_utc_ms,
+        device_ts=np.array([s.device_time_stamp for s in samples], dtype=np.int64),
+        system_ts=np.array([s.system_time_stamp for s in samples], dtype=np.int64),
+        l_valid=valid(l_point),
+        r_valid=valid(r_point),
+        l_point=col([p.position_on_display_area for p in l_point]),
+        r_point=col([p.position_on_display_area for p in r_point]),
+        l_3d=col([p.position_in_user_coordinates for p in l_point]),
+        r_3d=col([p.position_in_user_coordinates for p in r_point]),
+        l_pupil_valid=valid(l_pupil),
+        r_pupil_valid=valid(r_pupil),
+        l_pupil=col([p.diameter for p in l_pupil]),
+        r_pupil=col([p.diameter for p in r_pupil]),
+        l_origin_valid=valid(l_origin),
+        r_origin_valid=valid(r_origin),
+        l_origin=col([o.position_in_user_coordinates for o in l_origin]),
+        r_origin=col([o.position_in_user_coordinates for o in r_origin]),
+    )
+
+def _assemble_batch(
+    screen_width: int,
+    screen_height: int,
+    to_utc_ms: Callable[[np.ndarray], np.ndarray],
+    *,
+    device_ts: np.ndarray,
+    system_ts: np.ndarray,
+    l_valid: np.ndarray,
+    r_valid: np.ndarray,
+    l_point: np.ndarray,
+    r_point: np.ndarray,
+    l_3d: np.ndarray,
+    r_3d: np.ndarray,
+    l_pupil_valid: np.ndarray,
+    r_pupil_valid: np.ndarray,
+    l_pupil: np.ndarray,
+    r_pupil: np.ndarray,
+    l_origin_valid: np.ndarray,
+    r_origin_valid: np.ndarray,
+    l_origin: np.ndarray,
+    r_origin: np.ndarray,
+) -> GazeBatch:
+    """Masks raw SDK columns by their validity flags and derives the midpoint."""
+    l_point = np.where(l_valid[:, None], l_point, np.nan)
+    r_point = np.where(r_valid[:, None], r_point, np.nan)
+    lx, ly, rx, ry = l_point[:, 0], l_point[:, 1], r_point[:, 0], r_point[:, 1]
+
+    mid_x, mid_y, x_px, y_px, px_valid = gaze_midpoint(lx, ly, rx, ry, l_valid, r_valid, screen_width, screen_height)
+
+    return GazeBatch(
+        timestamp_ms=to_utc_ms(system_ts),
+        device_timestamp_us=device_ts,
+        system_timestamp_us=system_ts,
+        gaze_x_px=x_px,
+        gaze_y_px=y_px,
+        gaze_px_valid=px_valid,
+        gaze_x_norm=mid_x,
+        gaze_y_norm=mid_y,
+        left_x_norm=lx,
+        left_y_norm=ly,
+        right_x_norm=rx,
+        right_y_norm=ry,
+        left_pupil_mm=np.where(l_pupil_valid, l_pupil, np.nan),
+        right_pupil_mm=np.where(r_pupil_valid, r_pupil, np.nan),
+        left_3d_mm=np.where(l_valid[:, None], l_3d, np.nan),
+        right_3d_mm=np.where(r_valid[:, None], r_3d, np.nan),
+        left_origin_mm=np.where(l_origin_valid[:, None], l_origin, np.nan),
+        right_origin_mm=np.where(r_origin_valid[:, None], r_origin, np.nan),
+    )
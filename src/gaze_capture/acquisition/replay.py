@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, Final
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .base import GazeSource
+from ..configs import SourceConfig
+from ..models import GazeBatch
+from ..sinks.journal import JOURNAL_SUFFIX, read_journal
+from ..sinks.parquet import SCHEMA_VERSION_KEY
+
+logger = logging.getLogger(__name__)
+
+class ReplaySource(GazeSource):
+    """
+    Streams a recorded `eye_tracker__*.parquet` file (or segment directory) back into the pipeline.
+
+    Row groups are read lazily from memory-mapped files and emitted in chunks
+    paced by `device_ts_us`: `speed` 1.0 is real time, N is N times faster and
+    0 is as fast as possible (then paced only by queue backpressure).
+    Recorded timestamps are replayed unchanged.
+    """
+    _CHUNK_MS: Final[float] = 16.0 # Pacing granularity when speed > 0
+    _FAST_CHUNK_ROWS: Final[int] = 1024 # Emission size when speed == 0
+
+    def __init__(
+        self,
+        path: Path,
+        screen_width: int,
+        screen_height: int,
+        speed: float = 1.0,
+        cfg: SourceConfig | None = None,
+    ) -> None:
+        super().__init__(screen_width, screen_height, cfg)
+        self.path = Path(path)
+        self.speed = speed
+        self._rows_replayed = 0
+
+    async def _collect_data(self) -> None:
+        files = [await asyncio.to_thread(pq.ParquetFile, path, memory_map=True) for path in recording_files(self.path)]
+        rows, groups = sum(pf.metadata.num_rows for pf in files), sum(pf.num_row_groups for pf in files)
+        logger.info(f"Replaying {self.path} ({rows:,} rows, {groups} row groups in {len(files)} files) at speed {self.speed or 'max'}")
+        self._mark_ready()
+
+        t0_wall: float | None = None
+        t0_dev: int = 0
+
+        for pf, rg in ((pf, rg) for pf in files for rg in range(pf.num_row_groups)):
+            if self._stop_event.is_set():
+                break
+
+            batch = table_to_batch(await asyncio.to_thread(pf.read_row_group, rg))
+            if len(batch) == 0:
+                continue
+
+            if t0_wall is None:
+                t0_wall, t0_dev = time.monotonic(), int(batch.device_timestamp_us[0])
+                if self.speed > 0 and len(batch) > 1:
+                    self.expected_hz = self.speed * 1e6 / float(np.median(np.diff(batch.device_timestamp_us)))
+
+            for start, stop in self._chunks(batch):
+                if self._stop_event.is_set():
+                    return
+
+                if self.speed > 0:
+                    # Wait until the last row of the chunk is due
+                    due = t0_wall + (int(batch.device_timestamp_us[stop - 1]) - t0_dev) / 1e6 / self.speed
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                else:
+                    await self._wait_for_room()
+
+                await self.output_queue.put(batch.slice(start, stop))
+                self._rows_replayed += stop - start
+
+        logger.info(f"Replay finished: {self._rows_replayed:,} rows.")
+
+    def _chunks(self, batch: GazeBatch) -> list[tuple[int, int]]:
+        n = len(batch)
+        if self.speed <= 0:
+            bounds = list(range(0, n, self._FAST_CHUNK_ROWS)) + [n]
+        else:
+            # Split on device-time windows of _CHUNK_MS (scaled by speed)
+            dev = batch.device_timestamp_us
+            step_us = self._CHUNK_MS * 1_000 * self.speed
+            edges = np.arange(dev[0] + step_us, dev[-1] + step_us, step_us)
+            bounds = [0, *np.searchsorted(dev, edges, side="right").tolist(), n]
+        return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+    async def _wait_for_room(self) -> None:
+        """Backpressure for unpaced replay, so the overflow policy never drops replayed rows."""
+        queue = self.output_queue
+        while queue.capacity and queue.depth and queue.depth + self._FAST_CHUNK_ROWS > queue.capacity:
+            if self._stop_event.is_set():
+                return
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0)
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), "replay": {"path": str(self.path), "speed": self.speed, "rows": self._rows_replayed}}
+
+def schema_version(schema: pa.Schema) -> int:
+    """Recording schema version from the file metadata, files without the marker are v1."""
+    return int((schema.metadata or {}).get(SCHEMA_VERSION_KEY, b"1"))
+
+def recording_files(path: Path) -> list[Path]:
+    """The recorded file itself, or the closed segments of a segmented recording in order."""
+    path = Path(path)
+    return sorted(path.glob("part-*.parquet")) if path.is_dir() else [path]
+
+def open_recording(path: Path) -> ds.Dataset:
+    """
+    Opens a recording as a dataset. Segmented recordings are opened from their
+    `_metadata` summary (no per-segment footer reads), or from the closed
+    segments when the summary is missing or does not list every closed segment
+    (crash between a segment rename and the `_metadata` rewrite).
+    """
+    path = Path(path)
+    files = recording_files(path)
+    if path.is_dir() and (path / "_metadata").exists():
+        dataset = ds.parquet_dataset(path / "_metadata")
+        if sorted(Path(f).name for f in dataset.files) == [f.name for f in files]:
+            return dataset
+        logger.warning(f"{path}: _metadata does not match the closed segments, opening the segments instead")
+    return ds.dataset(files, format="parquet")
+
+def read_recording(path: Path) -> GazeBatch:
+    """
+    Reads a whole recording of either schema version (v1 or v2) into one `GazeBatch`:
+    a single file, a segment directory or a not yet compacted journal.
+    """
+    if Path(path).suffix == JOURNAL_SUFFIX:
+        batches = list(read_journal(path))
+        if not batches:
+            raise ValueError(f"{path}: journal holds no complete record batch")
+        table = pa.Table.from_batches(batches)
+    else:
+        table = open_recording(path).to_table()
+    version = schema_version(table.schema)
+    if version not in (1, 2):
+        raise ValueError(f"{path}: unsupported gaze schema version {version}")
+    return table_to_batch(table)
+
+def table_to_batch(table: pa.Table) -> GazeBatch:
+    """Converts a recorded table (ParquetSink schema v1 or v2) back into a `GazeBatch`."""
+    def ints(name: str) -> np.ndarray:
+        return table[name].cast(pa.int64()).to_numpy()
+
+    def floats(name: str) -> np.ndarray:
+        # Nulls become NaN when converting floating point columns
+        return table[name].to_numpy().astype(np.float64)
+
+    def vec3(name: str) -> np.ndarray:
+        # v1 stores a list<float32> column, v2 flat <name>_x/_y/_z columns
+        if name in table.column_names:
+            return _vec3(table[name])
+        return np.column_stack([floats(f"{name}_{axis}") for axis in "xyz"])
+
+    x_px, y_px = table["gaze_x_px"], table["gaze_y_px"]
+    return GazeBatch(
+        timestamp_ms=ints("timestamp_ms"),
+        device_timestamp_us=ints("device_ts_us"),
+        system_timestamp_us=ints("system_ts_us"),
+        gaze_x_px=x_px.fill_null(0).to_numpy().astype(np.int32),
+        gaze_y_px=y_px.fill_null(0).to_numpy().astype(np.int32),
+        gaze_px_valid=(x_px.is_valid().to_numpy() & y_px.is_valid().to_numpy()),
+        gaze_x_norm=floats("gaze_x_norm"),
+        gaze_y_norm=floats("gaze_y_norm"),
+        left_x_norm=floats("left_x_norm"),
+        left_y_norm=floats("left_y_norm"),
+        right_x_norm=floats("right_x_norm"),
+        right_y_norm=floats("right_y_norm"),
+        left_pupil_mm=floats("left_pupil_mm"),
+        right_pupil_mm=floats("right_pupil_mm"),
+        left_3d_mm=vec3("left_3d_mm"),
+        right_3d_mm=vec3("right_3d_mm"),
+        left_origin_mm=vec3("left_origin_mm"),
+        right_origin_mm=vec3("right_origin_mm"),
+    )
+
+def _vec3(column: pa.ChunkedArray) -> np.ndarray:
+    """`list<float32>` column to (n, 3) float64, null or malformed lists become NaN rows."""
+    arr = column.combine_chunks()
+    out = np.full((len(arr), 3), np.nan)
+    if len(arr) == 0:
+        return out
+
+    offsets = arr.offsets.to_numpy()
+    values = arr.values.to_numpy(zero_copy_only=False).astype(np.float64)
+    ok = arr.is_valid().to_numpy(zero_copy_only=False) & (np.diff(offsets) == 3)
+    out[ok] = values[offsets[:-1][ok, None] + np.arange(3)]
+    return out
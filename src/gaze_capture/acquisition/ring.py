@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+class SampleRing(Generic[T]):
+    """
+    Preallocated ring buffer bridging a hardware thread -> asyncio loop.
+
+    The producer thread only stores a reference and, at most once per batch,
+    wakes the event loop. The loop then drains everything in one callback.
+    Wakeups are coalesced: the first sample into an empty ring arms a timer
+    of `coalesce_s`, and reaching `high_water` samples forces an early drain.
+    """
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        on_drain: Callable[[list[T]], None],
+        capacity: int = 4096,
+        high_water: int = 64,
+        coalesce_s: float = 0.016,
+    ) -> None:
+        if not 0 < high_water <= capacity:
+            raise ValueError("high_water must be in (0, capacity].")
+
+        self._loop = loop
+        self._on_drain = on_drain
+        self._capacity = capacity
+        self._high_water = high_water
+        self._coalesce_s = coalesce_s
+
+        # Monotonic read/write counters, slot index is counter % capacity
+        self._slots: list[T | None] = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self._lock = threading.Lock()
+
+        # Wakeup state (guarded by _lock)
+        self._armed = False
+        self._urgent = False
+        self._timer: asyncio.TimerHandle | None = None
+
+        # Stats
+        self.total_pushed = 0
+        self.overflows = 0
+        self.wakeups = 0 # Producer -> loop `call_soon_threadsafe` calls
+        self.drains = 0
+        self.peak_fill = 0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def push(self, item: T) -> None:
+        """
+        Stores a sample. Safe to call from any thread, never blocks the producer.
+        When the ring is full the newest sample is dropped and counted.
+        """
+        with self._lock:
+            fill = self._tail - self._head
+            if fill >= self._capacity:
+                self.overflows += 1
+                return
+
+            self._slots[self._tail % self._capacity] = item
+            self._tail += 1
+            self.total_pushed += 1
+            fill += 1
+            if fill > self.peak_fill:
+                self.peak_fill = fill
+
+            # Decide on a wakeup while still holding the lock
+            if fill >= self._high_water and not self._urgent:
+                self._urgent = True
+                wakeup = self.drain
+            elif not self._armed:
+                self._armed = True
+                wakeup = self._arm
+            else:
+                return
+            self.wakeups += 1
+
+        self._loop.call_soon_threadsafe(wakeup)
+
+    def _arm(self) -> None:
+        """Loop-side: schedules the coalesced drain."""
+        if self._coalesce_s <= 0:
+            self.drain()
+        elif self._timer is None:
+            self._timer = self._loop.call_later(self._coalesce_s, self.drain)
+
+    def drain(self) -> None:
+        """Loop-side: hands every buffered sample to `on_drain` in one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        with self._lock:
+            head, tail = self._head, self._tail
+            self._head = tail
+            self._armed = self._urgent = False
+
+            if head == tail:
+                return
+
+            cap, slots = self._capacity, self._slots
+            start, end = head % cap, tail % cap
+            if start < end:
+                items = slots[start:end]
+            else:
+                items = slots[start:] + slots[:end]
+
+        self.drains += 1
+        self._on_drain(items)
+
+    def close(self) -> None:
+        """Loop-side: flushes pending samples and cancels any armed timer."""
+        self.drain()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pushed": self.total_pushed,
+            "overflows": self.overflows,
+            "wakeups": self.wakeups,
+            "drains": self.drains,
+            "peak_fill": self.peak_fill,
+        }
@@ -0,0 +1,160 @@
+import time
+
+import numpy as np
+
+from .kernels import gaze_midpoint
+from ..models import GazeBatch
+
+class GazeSynthesizer:
+    """
+    Vectorized generator of plausible binocular gaze.
+
+    Produces fixations (with tremor), main-sequence saccades (minimum-jerk profile),
+    blinks (both eyes lost), slowly varying pupils and head sway. State carries
+    over between calls, so consecutive batches form one continuous recording.
+    Every event is rendered as a slice of the batch, never sample by sample.
+    """
+    _DEG_PER_NORM: float = 35.0 # Rough visual angle spanned by the screen width
+
+    def __init__(
+        self,
+        frequency: int,
+        screen_width: int,
+        screen_height: int,
+        screen_mm: tuple[float, float] = (527.0, 296.0),
+        seed: int | None = None,
+    ) -> None:
+        self.frequency = frequency
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.screen_mm = screen_mm
+        self._rng = np.random.default_rng(seed)
+
+        # Clock anchors
+        self._t0_mono_us = time.monotonic_ns() // 1_000
+        self._t0_utc_ns = time.time_ns()
+        self._sample = 0
+
+        # Event state: current gaze position and the segment being rendered
+        self._pos = np.array([0.5, 0.5])
+        self._segment: tuple[str, int, np.ndarray, np.ndarray] | None = None
+        self._segment_left = 0
+        self._next_blink = self._blink_interval()
+
+    # --- Event scheduling ---
+
+    def _samples(self, seconds: float) -> int:
+        return max(1, int(round(seconds * self.frequency)))
+
+    def _blink_interval(self) -> int:
+        return self._samples(self._rng.uniform(2.0, 6.0))
+
+    def _next_segment(self) -> None:
+        """Picks the next event: a blink when due, otherwise alternating fixation/saccade."""
+        rng = self._rng
+        kind = self._segment[0] if self._segment else "saccade"
+
+        if self._next_blink <= 0:
+            n = self._samples(rng.uniform(0.1, 0.3))
+            self._segment = ("blink", n, self._pos, self._pos)
+            self._next_blink = self._blink_interval()
+
+        elif kind != "fixation":
+            n = self._samples(rng.lognormal(np.log(0.25), 0.4))
+            self._segment = ("fixation", n, self._pos, self._pos)
+
+        else:
+            target = np.clip(self._pos + rng.normal(0, 0.2, 2), 0.05, 0.95)
+            amplitude_deg = float(np.hypot(*(target - self._pos))) * self._DEG_PER_NORM
+            # Main sequence: ~21 ms + 2.2 ms per degree
+            n = self._samples(0.021 + 0.0022 * amplitude_deg)
+            self._segment = ("saccade", n, self._pos, target)
+            self._pos = target
+
+        self._segment_left = self._segment[1]
+
+    def _render_xy(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        """Renders up to `n` samples of gaze (n, 2) and blink mask for the rest of the batch."""
+        xy = np.empty((n, 2))
+        blink = np.zeros(n, dtype=bool)
+        rng = self._rng
+
+        i = 0
+        while i < n:
+            if self._segment_left <= 0:
+                self._next_segment()
+
+            kind, total, start, end = self._segment
+            k = min(self._segment_left, n - i)
+            done = total - self._segment_left
+
+            if kind == "saccade":
+                # Minimum-jerk position profile between start and end
+                t = (np.arange(done, done + k) + 1) / total
+                s = 10 * t**3 - 15 * t**4 + 6 * t**5
+                xy[i:i + k] = start + s[:, None] * (end - start)
+            else:
+                # Fixational tremor/drift around the current position
+                xy[i:i + k] = start + rng.normal(0, 0.0008, (k, 2))
+                blink[i:i + k] = kind == "blink"
+
+            self._segment_left -= k
+            self._next_blink -= k
+            i += k
+
+        return xy, blink
+
+    # --- Batch generation ---
+
+    def generate(self, n: int) -> GazeBatch:
+        rng = self._rng
+        idx = np.arange(self._sample, self._sample + n)
+        self._sample += n
+
+        elapsed_us = idx * 1_000_000 // self.frequency
+        xy, blink = self._render_xy(n)
+        seen = ~blink
+
+        # Small vergence offset between eyes plus independent sensor noise
+        left = np.where(seen[:, None], xy + [-0.004, 0] + rng.normal(0, 0.0004, (n, 2)), np.nan)
+        right = np.where(seen[:, None], xy + [0.004, 0] + rng.normal(0, 0.0004, (n, 2)), np.nan)
+        mid_x, mid_y, x_px, y_px, px_valid = gaze_midpoint(
+            left[:, 0], left[:, 1], right[:, 0], right[:, 1], seen, seen, self.screen_width, self.screen_height
+        )
+
+        # Pupils: slow oscillation + noise, lost during blinks
+        t_s = elapsed_us / 1e6
+        pupil = 3.5 + 0.3 * np.sin(2 * np.pi * t_s / 7.0)
+        left_pupil = np.where(seen, pupil + rng.normal(0, 0.02, n), np.nan)
+        right_pupil = np.where(seen, pupil + 0.1 + rng.normal(0, 0.02, n), np.nan)
+
+        # Head sway in user coordinates (mm), eyes ~64 mm apart at ~600 mm
+        sway = np.stack([5 * np.sin(t_s / 3.0), 3 * np.sin(t_s / 5.0), 600 + 10 * np.sin(t_s / 11.0)], axis=1)
+        left_origin = sway + [-32.0, 0.0, 0.0]
+        right_origin = sway + [32.0, 0.0, 0.0]
+
+        return GazeBatch(
+            timestamp_ms=(self._t0_utc_ns + elapsed_us * 1_000) // 1_000_000,
+            device_timestamp_us=elapsed_us,
+            system_timestamp_us=self._t0_mono_us + elapsed_us,
+            gaze_x_px=x_px,
+            gaze_y_px=y_px,
+            gaze_px_valid=px_valid,
+            gaze_x_norm=mid_x,
+            gaze_y_norm=mid_y,
+            left_x_norm=left[:, 0],
+            left_y_norm=left[:, 1],
+            right_x_norm=right[:, 0],
+            right_y_norm=right[:, 1],
+            left_pupil_mm=left_pupil,
+            right_pupil_mm=right_pupil,
+            left_3d_mm=self._on_screen_mm(left),
+            right_3d_mm=self._on_screen_mm(right),
+            left_origin_mm=left_origin,
+            right_origin_mm=right_origin,
+        )
+
+    def _on_screen_mm(self, xy: np.ndarray) -> np.ndarray:
+        """Normalized display coordinates to a screen plane at z=0 (NaN propagates)."""
+        w, h = self.screen_mm
+        return np.stack([(xy[:, 0] - 0.5) * w, (1 - xy[:, 1]) * h, np.zeros(len(xy)) * xy[:, 0]], axis=1)
@@ -4,8 +4,10 @@ from typing import Any, Final
 import tobii_research as tr
 
 from .base import GazeSource
-from ..models.gaze import GazeData
-from ..utils.clock import TimeProbe
+from .kernels import batch_from_dicts, batch_from_objects
+from .ring import SampleRing
+from ..configs import SourceConfig
+from ..utils.clock import ClockSync
 
 logger = logging.getLogger(__name__)
 
@@ -21,82 +23,80 @@ class TobiiSource(GazeSource):
         tracker: tr.EyeTracker,
         screen_width: int,
         screen_height: int,
-
+        cfg: SourceConfig | None = None,
     ) -> None:
-        super().__init__(screen_width, screen_height)
+        super().__init__(screen_width, screen_height, cfg)
+        cfg = self.cfg
         self.tracker = tracker
+        self.now_us = tr.get_system_time_stamp
         self._loop = asyncio.get_running_loop()
-        self._time_offset: TimeProbe | None = None
+        self._clock = ClockSync(
+            tr.get_system_time_stamp,
+            burst_size=cfg.clock_sync_burst,
+            interval_s=cfg.clock_sync_interval_s,
+            window=cfg.clock_sync_window,
+        )
 
-    def _callback(self, data: dict[str, Any]) -> None:
-        try:
-            # Extract validities
-            l_valid = data["left_gaze_point_validity"]
-            r_valid = data["right_gaze_point_validity"]
-            
-            # Extract coordinates
-            lx, ly = data["left_gaze_point_on_display_area"] if l_valid else (None, None)
-            rx, ry = data["right_gaze_point_on_display_area"] if r_valid else (None, None)
-            
-            # Calculate midpoint
-            if l_valid and r_valid:
-                mid_x = (lx + rx) / 2
-                mid_y = (ly + ry) / 2
-            elif l_valid:
-                mid_x, mid_y = lx, ly
-            elif r_valid:
-                mid_x, mid_y = rx, ry
-            else:
-                mid_x, mid_y = None, None
-
-            #  Must be inside screen limits
-            mid_x_valid = mid_x is not None and 0. <= mid_x < 1.
-            mid_y_valid = mid_y is not None and 0. <= mid_y < 1.
-            
-            # Round to nearest pixel
-            if mid_x_valid and mid_y_valid:
-                mid_x_px = int(mid_x * self.screen_width)
-                mid_y_px = int(mid_y * self.screen_height)
-            else:
-                mid_x_px, mid_y_px = None, None
-
-            # Create object
-            model = GazeData(
-                timestamp_ms=self._time_offset.to_utc_ms(data["system_time_stamp"]),
-                device_timestamp_us=data["device_time_stamp"],
-                system_timestamp_us=data["system_time_stamp"],
-                gaze_x_px=mid_x_px,
-                gaze_y_px=mid_y_px,
-                gaze_x_norm=mid_x,
-                gaze_y_norm=mid_y,
-                left_x_norm=lx,
-                left_y_norm=ly,
-                right_x_norm=rx,
-                right_y_norm=ry,
-                left_pupil_mm=data["left_pupil_diameter"] if data["left_pupil_validity"] else None,
-                right_pupil_mm=data["right_pupil_diameter"] if data["right_pupil_validity"] else None,
-                left_origin_mm=data["left_gaze_origin_in_user_coordinate_system"] if data["left_gaze_origin_validity"] else None,
-                right_origin_mm=data["right_gaze_origin_in_user_coordinate_system"] if data["right_gaze_origin_validity"] else None,
-                left_3d_mm=data["left_gaze_point_in_user_coordinate_system"] if l_valid else None,
-                right_3d_mm=data["right_gaze_point_in_user_coordinate_system"] if r_valid else None,
+        # SDK payload layout and its matching batch parser
+        self._as_dictionary = cfg.callback_mode == "dict"
+        self._parse_batch = batch_from_dicts if self._as_dictionary else batch_from_objects
+
+        # Batched handoff from the SDK thread, drained on the event loop
+        self._ring: SampleRing[dict[str, Any] | tr.GazeData] = SampleRing(
+            self._loop,
+            on_drain=self._enqueue_batch,
+            capacity=cfg.ring_capacity,
+            high_water=cfg.wakeup_high_water,
+            coalesce_s=cfg.wakeup_coalesce_ms / 1_000,
+        )
+
+    def _callback(self, data: dict[str, Any] | tr.GazeData) -> None:
+        # Runs on the SDK C-thread: only hand the raw sample over, processing is batched
+        self._ring.push(data)
+
+        if self.tracer is not None:
+            self.tracer.record_timestamp(
+                "callback", data["system_time_stamp"] if self._as_dictionary else data.system_time_stamp
             )
 
-            self._loop.call_soon_threadsafe(self.output_queue.put_nowait, model)
+    def _enqueue_batch(self, samples: list[dict[str, Any] | tr.GazeData]) -> None:
+        try:
+            batch = self._parse_batch(samples, self.screen_width, self.screen_height, self._clock.to_utc_ms)
+            self.output_queue.put_nowait(batch)
+            self._trace("enqueue", batch)
 
         except Exception as e:
-            # Log and continue to prevent crashing C-thread
-            logger.error(e)
+            logger.error(f"Failed to process {len(samples)} gaze samples: {e}")
 
     async def _collect_data(self) -> None:
-        self._time_offset = min(TimeProbe(tr.get_system_time_stamp) for _ in range(self._N_TIME_PROBES))
+        # Initial sync and SDK calls block for a while, keep them off the event loop
+        await asyncio.to_thread(self._clock.calibrate, self._N_TIME_PROBES)
+        sync_task = asyncio.create_task(self._clock.run(self._stop_event))
+        subscribed = False
 
         try:
             logger.info(f"Subscribing to {self.tracker.device_name} (Res: {self.screen_width}x{self.screen_height})")
-            self.tracker.subscribe_to(tr.EYETRACKER_GAZE_DATA, self._callback, as_dictionary=True)
+            await asyncio.to_thread(
+                self.tracker.subscribe_to, tr.EYETRACKER_GAZE_DATA, self._callback, as_dictionary=self._as_dictionary
+            )
+            subscribed = True
+            self.expected_hz = await asyncio.to_thread(self.tracker.get_gaze_output_frequency)
+            self._mark_ready()
+            logger.info(f"Tobii source ready in {self.startup_s * 1_000:.0f} ms")
 
             await self._stop_event.wait()
             logger.info("Stop event received, shutting down Tobii eye-tracker.")
         
         finally:
-            logger.info("Unsubscribing from gaze data stream...")
-            self.tracker.unsubscribe_from(tr.EYETRACKER_GAZE_DATA, self._callback)
\ No newline at end of file
+            if subscribed:
+                logger.info("Unsubscribing from gaze data stream...")
+                await asyncio.to_thread(self.tracker.unsubscribe_from, tr.EYETRACKER_GAZE_DATA, self._callback)
+
+            # Flush samples still waiting for a coalesced wakeup
+            self._ring.close()
+
+            sync_task.cancel()
+            await asyncio.gather(sync_task, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), "handoff": self._ring.stats(), "clock": self._clock.stats()}
\ No newline at end of file
@@ -1,12 +1,15 @@
 import asyncio
-import threading
 import logging
 import nats
 from nats.errors import NoServersError
 
 from gaze_capture.core.manager import EyeTrackingManager
+from gaze_capture.core.metrics import MetricsServer
+from gaze_capture.core.process import ProcessManager
+from gaze_capture.sinks.journal import recover_journals
 from gaze_capture.configs.app import AppSettings, LoggingConfig
 from gaze_capture.controllers import TobiiController, DummyController
+from gaze_capture.utils.engine import start_engine
 
 from gaze_capture.aware_command_center.services import GazeService, RemoteService
 from gaze_capture.aware_command_center.orchestrator import ExperimentOrchestrator
@@ -75,15 +78,21 @@ def main():
     setup_logger(settings.logging)
 
     # Create the high-performance background loop
-    loop = asyncio.new_event_loop()
-    threading.Thread(target=loop.run_forever, daemon=True).start()
+    loop = start_engine(settings.engine)
+
+    # Journals left behind by a crash are compacted to Parquet off the main thread
+    recover_journals(settings.data_dir, settings.parquet.compaction_rows, settings.parquet.writer)
 
     future = asyncio.run_coroutine_threadsafe(setup_nats(settings.nats_host), loop)
     nc = future.result()
 
     # Instantiate components
-    controller = TobiiController() if not settings.use_dummy_mode else DummyController()
-    eye_tracking_manager = EyeTrackingManager(controller, settings, loop, nc)
+    if settings.engine.isolate:
+        # The engine process finds the tracker itself and runs the pipeline away from the UI
+        eye_tracking_manager = ProcessManager(settings, loop, setup_nats)
+    else:
+        controller = TobiiController() if not settings.use_dummy_mode else DummyController()
+        eye_tracking_manager = EyeTrackingManager(controller, settings, loop, nc)
 
     # Define Services
     services = [
@@ -93,12 +102,18 @@ def main():
         RemoteService("Screen Recorder", loop, nc, "screen.health", "screen.cmds"),
     ]
 
+    # Optional local metrics endpoint, served from the engine loop
+    metrics = MetricsServer(settings.metrics, eye_tracking_manager, nc, services)
+    if settings.metrics.enabled:
+        asyncio.run_coroutine_threadsafe(metrics.start(), loop).result()
+
     orchestrator = ExperimentOrchestrator(settings, eye_tracking_manager, services)
     app = CommandCenterUI(orchestrator, loop)
     
     try:
         app.mainloop()
     finally:
+        asyncio.run_coroutine_threadsafe(metrics.stop(), loop).result()
         asyncio.run_coroutine_threadsafe(nc.drain(), loop).result()
         loop.call_soon_threadsafe(loop.stop)
         logger.info("Application closed.")
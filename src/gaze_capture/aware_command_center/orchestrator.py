@@ -257,8 +257,11 @@ class ExperimentOrchestrator:
         grouped_files: dict[str, list[Path]] = defaultdict(list)
 
         # Pass 1: Collect and group files by (parent_directory, X_part)
+        # Segmented recordings (`X__<ts>.parquet/` directories) are renamed as a whole, their segments keep their names
         for filepath in self.session_dir.rglob("*"):
-            if filepath.is_file():
+            if any("__" in parent.name for parent in filepath.relative_to(self.session_dir).parents):
+                continue
+            if filepath.is_file() or "__" in filepath.name:
                 x_part = filepath.stem.split("__")[0]
                 grouped_files[x_part].append(filepath)
 
@@ -308,7 +311,8 @@ class ExperimentOrchestrator:
             "external_sync": {
                 label: [dt.isoformat() for dt in dts]
                 for label, dts in self.external_start_times.items()
-            }
+            },
+            "gaze_recordings": self.gaze_manager.pop_recording_stats(),
         }
         with open(metadata_dir / "session.json", "w", encoding="utf-8") as f:
             json.dump(meta, f, indent=2)
@@ -2,7 +2,7 @@ import time
 
 from .base import BaseService, ServiceState
 from ...core.manager import EyeTrackingManager
-from ...core.state import AppState
+from ...core.state import AppState, RECORDING_STATES
 
 class GazeService(BaseService):
     """Stateless Adapter bridging EyeTrackingManager to the Service interface."""
@@ -18,7 +18,7 @@ class GazeService(BaseService):
         """Computed on-the-fly directly from the GazeManager."""
         app_state = self.manager.current_state
         
-        if app_state == AppState.RECORDING:
+        if app_state in RECORDING_STATES:
             # Catch the exact moment recording starts to reset the timer
             if not self._was_recording:
                 self._record_start_time = time.time()
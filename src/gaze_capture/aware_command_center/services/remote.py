@@ -35,6 +35,11 @@ class RemoteService(BaseService):
         self._watchdog_task = self.loop.create_task(self._watchdog())
         self._health_task = self.loop.create_task(self._subscribe_health())
 
+    @property
+    def heartbeat_age_s(self) -> float | None:
+        """Seconds since the last heartbeat, None if none was received yet."""
+        return time.time() - self._last_heartbeat if self._last_heartbeat else None
+
     async def _subscribe_health(self):
         """Listens for the 1Hz ping from the container."""
         async def cb(msg):
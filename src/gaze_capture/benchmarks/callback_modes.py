@@ -0,0 +1,78 @@
+"""
+Tobii callback payload modes: `as_dictionary=True` vs `tr.GazeData` objects.
+
+The SDK always receives a raw dict from its C layer and then either copies it
+(`dict(data)`) or wraps it (`GazeData(data)`) before calling us. This replays
+that wrapping on synthetic payloads and measures, per mode, the SDK-thread
+cost (wrap + ring push), the loop-side parse cost and the allocations held.
+
+    python -m gaze_capture.benchmarks.callback_modes --samples 50000 --batch-size 64
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import tobii_research as tr
+
+from ..acquisition.kernels import batch_from_dicts, batch_from_objects
+from ..models import GazeBatch
+from .kernels import synthetic_samples, _utc_ms, _WIDTH, _HEIGHT
+
+_MODES = {
+    "dict": (dict, batch_from_dicts),
+    "object": (tr.GazeData, batch_from_objects),
+}
+
+def _run(mode: str, raw: list[dict], batch_size: int) -> tuple[dict, GazeBatch]:
+    wrap, parse = _MODES[mode]
+
+    # SDK thread: wrap the C payload and hand it over
+    pending: list = []
+    t0 = time.thread_time_ns()
+    for d in raw:
+        pending.append(wrap(d))
+    sdk_ns = (time.thread_time_ns() - t0) / len(raw)
+
+    # Allocations retained per sample while waiting in the ring
+    tracemalloc.start()
+    snapshot = [wrap(d) for d in raw[:batch_size]]
+    held_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del snapshot
+
+    # Event loop: parse whole batches
+    batches = []
+    t0 = time.thread_time_ns()
+    for i in range(0, len(pending), batch_size):
+        batches.append(parse(pending[i:i + batch_size], _WIDTH, _HEIGHT, _utc_ms))
+    loop_ns = (time.thread_time_ns() - t0) / len(raw)
+
+    return {
+        "mode": mode,
+        "sdk_us": sdk_ns / 1_000,
+        "loop_us": loop_ns / 1_000,
+        "held_bytes": held_bytes / batch_size,
+    }, GazeBatch.concat(batches)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    raw = synthetic_samples(args.samples)
+    results = [_run(mode, raw, args.batch_size) for mode in _MODES]
+
+    reference = results[0][1]
+    for _, batch in results[1:]:
+        for name in GazeBatch.COLUMNS:
+            if not np.array_equal(getattr(batch, name), getattr(reference, name), equal_nan=getattr(batch, name).dtype.kind == "f"):
+                raise AssertionError(f"Column '{name}' differs between callback modes.")
+
+    print(f"{'mode':<8} {'sdk us/sample':>14} {'loop us/sample':>15} {'bytes held/sample':>18}")
+    for r, _ in results:
+        print(f"{r['mode']:<8} {r['sdk_us']:>14.2f} {r['loop_us']:>15.2f} {r['held_bytes']:>18.0f}")
+
+if __name__ == "__main__":
+    main()
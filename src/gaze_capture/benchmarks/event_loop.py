@@ -0,0 +1,124 @@
+"""
+Engine event loop benchmark: stock asyncio vs uvloop.
+
+Runs each loop the way the app does (`start_engine`, a daemon thread running
+forever) and measures, from a foreign thread like the SDK callback thread:
+  - wakeup latency: `call_soon_threadsafe` on an idle loop until the callback runs
+  - timer overshoot: how late a 1 ms `asyncio.sleep` resumes
+  - `call_soon_threadsafe` cost on the calling thread, and the loop's drain rate
+  - NATS publish throughput of gaze-sized messages (only with --nats)
+
+    python -m gaze_capture.benchmarks.event_loop --iterations 5000 [--nats nats://localhost:4222]
+"""
+import argparse
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+from ..configs import EngineConfig
+from ..utils.engine import new_event_loop, start_engine
+
+_PAYLOAD = bytes(24) # Serialized GazeScreenPosition is ~20-30 bytes
+
+def _percentiles_us(ns: list[int]) -> str:
+    p50, p99, p999 = np.percentile(np.asarray(ns) / 1_000, (50, 99, 99.9))
+    return f"p50 {p50:7.1f} us  p99 {p99:7.1f} us  p99.9 {p999:7.1f} us"
+
+def wakeup_latency(loop: asyncio.AbstractEventLoop, iterations: int) -> list[int]:
+    """One cross-thread wakeup at a time, with the loop idle in between."""
+    results: list[int] = []
+    done = threading.Event()
+
+    def callback(t0: int) -> None:
+        results.append(time.perf_counter_ns() - t0)
+        done.set()
+
+    for _ in range(iterations):
+        done.clear()
+        loop.call_soon_threadsafe(callback, time.perf_counter_ns())
+        done.wait()
+        time.sleep(0.0005) # Let the loop go back to sleep in select/epoll
+    return results
+
+def timer_overshoot(loop: asyncio.AbstractEventLoop, iterations: int) -> list[int]:
+    async def run() -> list[int]:
+        lateness = []
+        for _ in range(iterations):
+            t0 = time.perf_counter_ns()
+            await asyncio.sleep(0.001)
+            lateness.append(time.perf_counter_ns() - t0 - 1_000_000)
+        return lateness
+    return asyncio.run_coroutine_threadsafe(run(), loop).result()
+
+def threadsafe_cost(loop: asyncio.AbstractEventLoop, calls: int) -> tuple[float, float]:
+    """Caller-side ns per call for a burst of `calls`, and callbacks/s until the loop ran them all."""
+    remaining = calls
+    done = threading.Event()
+
+    def callback() -> None:
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
+    t0 = time.perf_counter_ns()
+    for _ in range(calls):
+        loop.call_soon_threadsafe(callback)
+    t_calls = time.perf_counter_ns() - t0
+    done.wait()
+    t_all = time.perf_counter_ns() - t0
+    return t_calls / calls, calls / (t_all / 1e9)
+
+def nats_throughput(loop: asyncio.AbstractEventLoop, url: str, messages: int) -> float:
+    """Messages/s published and flushed to the server."""
+    import nats
+
+    async def quiet(_: Exception) -> None:
+        pass
+
+    async def run() -> float:
+        nc = await nats.connect(url, connect_timeout=2, allow_reconnect=False, error_cb=quiet)
+        try:
+            t0 = time.perf_counter()
+            for _ in range(messages):
+                await nc.publish("bench.gaze", _PAYLOAD)
+            await nc.flush()
+            return messages / (time.perf_counter() - t0)
+        finally:
+            await nc.close()
+    return asyncio.run_coroutine_threadsafe(run(), loop).result()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5_000)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--nats", default=None, help="NATS server URL, skips the publish benchmark when omitted")
+    parser.add_argument("--messages", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for kind in ("asyncio", "uvloop"):
+        probe = new_event_loop(kind)
+        fell_back = kind == "uvloop" and type(probe).__module__.startswith("asyncio")
+        probe.close()
+        if fell_back:
+            print("\nuvloop: not installed, skipped")
+            continue
+
+        loop = start_engine(EngineConfig(loop=kind))
+        print(f"\n{kind} ({type(loop).__module__}.{type(loop).__name__})")
+        print(f"  wakeup latency:    {_percentiles_us(wakeup_latency(loop, args.iterations))}")
+        print(f"  timer overshoot:   {_percentiles_us(timer_overshoot(loop, args.iterations))}")
+        ns_per_call, drain_rate = threadsafe_cost(loop, args.calls)
+        print(f"  call_soon_threadsafe: {ns_per_call:6.0f} ns/call, loop drains {drain_rate / 1e6:.2f} M callbacks/s")
+        if args.nats:
+            try:
+                print(f"  NATS publish:      {nats_throughput(loop, args.nats, args.messages):,.0f} msg/s")
+            except Exception as e:
+                print(f"  NATS publish:      failed ({type(e).__name__}: {e})")
+
+        loop.call_soon_threadsafe(loop.stop)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+SDK thread -> asyncio handoff benchmark.
+
+Emulates the Tobii callback thread at a fixed rate and compares the legacy
+per-sample `call_soon_threadsafe` path against the batched `SampleRing`.
+
+    python -m gaze_capture.benchmarks.handoff --rates 120 250 600 1200 --seconds 5
+"""
+import argparse
+import asyncio
+import time
+from typing import Callable
+
+from ..acquisition.ring import SampleRing
+
+def _produce(push: Callable[[dict], None], rate_hz: int, seconds: float) -> None:
+    """Pushes dict payloads (like `as_dictionary=True`) at a fixed rate."""
+    interval_ns = 1_000_000_000 // rate_hz
+    n = int(rate_hz * seconds)
+    t0 = time.monotonic_ns()
+    for i in range(n):
+        push({"system_time_stamp": i, "device_time_stamp": i})
+        delay_ns = t0 + (i + 1) * interval_ns - time.monotonic_ns()
+        if delay_ns > 0:
+            time.sleep(delay_ns / 1e9)
+
+async def _run(mode: str, rate_hz: int, seconds: float, coalesce_ms: float, high_water: int) -> dict:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    threadsafe_calls = 0
+    original = loop.call_soon_threadsafe
+
+    def counting_call_soon_threadsafe(*args, **kwargs):
+        nonlocal threadsafe_calls
+        threadsafe_calls += 1
+        return original(*args, **kwargs)
+
+    loop.call_soon_threadsafe = counting_call_soon_threadsafe
+
+    if mode == "legacy":
+        push = lambda item: loop.call_soon_threadsafe(queue.put_nowait, item)
+        ring = None
+    else:
+        def enqueue(items):
+            for item in items:
+                queue.put_nowait(item)
+
+        ring = SampleRing(loop, enqueue, high_water=high_water, coalesce_s=coalesce_ms / 1_000)
+        push = ring.push
+
+    received = 0
+    n_expected = int(rate_hz * seconds)
+
+    async def consume():
+        nonlocal received
+        while received < n_expected:
+            await queue.get()
+            received += 1
+
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    consumer = asyncio.create_task(consume())
+    await asyncio.to_thread(_produce, push, rate_hz, seconds)
+    if ring is not None:
+        ring.close()
+    await consumer
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+
+    del loop.call_soon_threadsafe
+    return {
+        "mode": mode,
+        "rate_hz": rate_hz,
+        "samples": received,
+        # to_thread itself costs one threadsafe call on completion
+        "threadsafe_wakeups": threadsafe_calls - 1,
+        # Callbacks delivering samples to the loop: one per sample, or one per non-empty drain
+        "loop_callbacks": ring.drains if ring is not None else received,
+        "cpu_pct": 100 * cpu / wall,
+        "overflows": ring.overflows if ring is not None else 0,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rates", type=int, nargs="+", default=[120, 250, 600, 1200])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--coalesce-ms", type=float, default=16.0)
+    parser.add_argument("--high-water", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'rate':>6} {'samples':>8} {'wakeups':>8} {'callbacks':>10} {'cpu%':>6} {'overflow':>8}")
+    for rate in args.rates:
+        for mode in ("legacy", "ring"):
+            r = asyncio.run(_run(mode, rate, args.seconds, args.coalesce_ms, args.high_water))
+            print(
+                f"{r['mode']:<8} {r['rate_hz']:>6} {r['samples']:>8} {r['threadsafe_wakeups']:>8} "
+                f"{r['loop_callbacks']:>10} {r['cpu_pct']:>6.1f} {r['overflows']:>8}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Recording path cost: Parquet (zstd) vs the Arrow IPC journal, plus compaction and recovery.
+
+Writes the same synthetic flushes through `ParquetSink._write_sync` and
+`JournalSink._write_sync` (Arrow conversion included) and reports per-flush
+write time, then the background compaction time of the journal and its size
+against the Parquet output. Finally the journal is cut at random offsets, as
+a crash mid-write would leave it, and `read_journal` must return every batch
+before the cut.
+
+    python -m gaze_capture.benchmarks.journal --rate 120 --rows 600 --flushes 600
+"""
+import argparse
+import logging
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .kernels import _WIDTH, _HEIGHT
+from ..acquisition import read_recording
+from ..acquisition.synthetic import GazeSynthesizer
+from ..sinks.journal import JournalSink, compact_journal, read_journal
+from ..sinks.parquet import ParquetSink
+
+def write_flushes(sink: ParquetSink, batches: list) -> list[float]:
+    times = []
+    for batch in batches:
+        t0 = time.perf_counter()
+        sink._write_sync(batch)
+        times.append(time.perf_counter() - t0)
+    sink._close_writer()
+    return times
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=120)
+    parser.add_argument("--rows", type=int, default=600, help="Rows per flush (ParquetSinkConfig.max_buffer_size)")
+    parser.add_argument("--flushes", type=int, default=600)
+    parser.add_argument("--cuts", type=int, default=20, help="Random truncation points for the recovery check")
+    args = parser.parse_args()
+    logging.getLogger("gaze_capture.sinks.journal").setLevel(logging.ERROR) # One torn-batch warning per cut otherwise
+
+    gen = GazeSynthesizer(args.rate, _WIDTH, _HEIGHT, seed=0)
+    batches = [gen.generate(args.rows) for _ in range(args.flushes)]
+    n = args.rows * args.flushes
+
+    with tempfile.TemporaryDirectory(prefix="gaze_journal_") as tmp:
+        common = dict(drop_when_full=False, max_buffer_size=args.rows, queue_size=args.rows + 1)
+        parquet = ParquetSink(Path(tmp) / "parquet", **common)
+        journal = JournalSink(Path(tmp) / "journal", **common)
+
+        print(f"{args.flushes} flushes of {args.rows} rows ({n:,} rows)")
+        print(f"{'path':<9} {'p50 us':>8} {'p99 us':>8} {'max us':>8} {'total ms':>9} {'size KiB':>10}")
+        for name, sink, path in (("parquet", parquet, parquet.output_path), ("journal", journal, journal.journal_path)):
+            times = np.asarray(write_flushes(sink, batches)) * 1e6
+            p50, p99 = np.percentile(times, (50, 99))
+            print(
+                f"{name:<9} {p50:>8.0f} {p99:>8.0f} {times.max():>8.0f} "
+                f"{times.sum() / 1e3:>9.1f} {path.stat().st_size / 1024:>10,.1f}"
+            )
+
+        # Recovery: every complete batch before a cut must come back
+        size = journal.journal_path.stat().st_size
+        cut_path = Path(tmp) / "cut.arrows"
+        rng = random.Random(0)
+        for _ in range(args.cuts):
+            cut = rng.randrange(size)
+            shutil.copyfile(journal.journal_path, cut_path)
+            with open(cut_path, "r+b") as f:
+                f.truncate(cut)
+            recovered = sum(b.num_rows for b in read_journal(cut_path))
+            assert recovered % args.rows == 0 and recovered <= n * cut / size + args.rows, (cut, recovered)
+        print(f"recovery: {args.cuts} random truncations, each read back to the last complete batch")
+
+        # Compaction (what the background worker runs at close)
+        t0 = time.perf_counter()
+        compacted = compact_journal(journal.journal_path, Path(tmp) / "compacted.parquet")
+        dt = time.perf_counter() - t0
+        print(f"compaction: {1e3 * dt:.1f} ms ({n / dt:,.0f} rows/s), {compacted.stat().st_size / 1024:,.1f} KiB")
+        assert np.array_equal(read_recording(compacted).device_timestamp_us, read_recording(parquet.output_path).device_timestamp_us)
+
+if __name__ == "__main__":
+    main()
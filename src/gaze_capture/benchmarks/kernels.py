@@ -0,0 +1,175 @@
+"""
+Scalar vs vectorized Tobii sample processing.
+
+Checks that `batch_from_dicts` reproduces the legacy per-sample callback
+exactly, on synthetic samples and optionally on a recorded parquet file,
+then reports the CPU time each path spends per sample.
+
+    python -m gaze_capture.benchmarks.kernels --samples 100000 [--parquet data/eye_tracker__X.parquet]
+"""
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..acquisition.kernels import batch_from_dicts, midpoint_scalar
+from ..models import GazeBatch, GazeData
+
+_NAN3 = (float("nan"),) * 3
+_WIDTH, _HEIGHT = 3840, 2160
+
+def _utc_ms(system_us):
+    return (system_us * 1_000 + 1_700_000_000_000_000_000) // 1_000_000
+
+def scalar_sample(data: dict[str, Any], screen_width: int, screen_height: int) -> GazeData:
+    """Legacy `TobiiSource._callback` body, kept as the reference implementation."""
+    l_valid = data["left_gaze_point_validity"]
+    r_valid = data["right_gaze_point_validity"]
+    lx, ly = data["left_gaze_point_on_display_area"] if l_valid else (None, None)
+    rx, ry = data["right_gaze_point_on_display_area"] if r_valid else (None, None)
+    mid_x, mid_y, mid_x_px, mid_y_px = midpoint_scalar(lx, ly, rx, ry, screen_width, screen_height)
+
+    return GazeData(
+        timestamp_ms=_utc_ms(data["system_time_stamp"]),
+        device_timestamp_us=data["device_time_stamp"],
+        system_timestamp_us=data["system_time_stamp"],
+        gaze_x_px=mid_x_px,
+        gaze_y_px=mid_y_px,
+        gaze_x_norm=mid_x,
+        gaze_y_norm=mid_y,
+        left_x_norm=lx,
+        left_y_norm=ly,
+        right_x_norm=rx,
+        right_y_norm=ry,
+        left_pupil_mm=data["left_pupil_diameter"] if data["left_pupil_validity"] else None,
+        right_pupil_mm=data["right_pupil_diameter"] if data["right_pupil_validity"] else None,
+        left_origin_mm=data["left_gaze_origin_in_user_coordinate_system"] if data["left_gaze_origin_validity"] else None,
+        right_origin_mm=data["right_gaze_origin_in_user_coordinate_system"] if data["right_gaze_origin_validity"] else None,
+        left_3d_mm=data["left_gaze_point_in_user_coordinate_system"] if l_valid else None,
+        right_3d_mm=data["right_gaze_point_in_user_coordinate_system"] if r_valid else None,
+    )
+
+def _raw_sample(i: int, l_valid: bool, r_valid: bool, l: tuple, r: tuple, l_pupil, r_pupil, l_3d, r_3d, l_origin, r_origin) -> dict[str, Any]:
+    nan2 = (float("nan"),) * 2
+    return {
+        "device_time_stamp": 1_000_000 + i * 8_333,
+        "system_time_stamp": 5_000_000_000 + i * 8_333,
+        "left_gaze_point_validity": int(l_valid),
+        "right_gaze_point_validity": int(r_valid),
+        "left_gaze_point_on_display_area": l if l_valid else nan2,
+        "right_gaze_point_on_display_area": r if r_valid else nan2,
+        "left_gaze_point_in_user_coordinate_system": l_3d if l_valid else _NAN3,
+        "right_gaze_point_in_user_coordinate_system": r_3d if r_valid else _NAN3,
+        "left_pupil_validity": int(l_pupil is not None),
+        "right_pupil_validity": int(r_pupil is not None),
+        "left_pupil_diameter": l_pupil if l_pupil is not None else float("nan"),
+        "right_pupil_diameter": r_pupil if r_pupil is not None else float("nan"),
+        "left_gaze_origin_validity": int(l_origin is not None),
+        "right_gaze_origin_validity": int(r_origin is not None),
+        "left_gaze_origin_in_user_coordinate_system": l_origin or _NAN3,
+        "right_gaze_origin_in_user_coordinate_system": r_origin or _NAN3,
+    }
+
+def synthetic_samples(n: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Random samples including one-eye, no-eye, off-screen and exact edge (0.0, 1.0) cases."""
+    rng = random.Random(seed)
+    edges = [0.0, 1.0, -1e-9, 1 - 1e-12, 0.5]
+
+    def coord():
+        return rng.choice(edges) if rng.random() < 0.1 else rng.uniform(-0.1, 1.1)
+
+    def vec3():
+        return (rng.uniform(-300, 300), rng.uniform(-300, 300), rng.uniform(400, 800))
+
+    return [
+        _raw_sample(
+            i,
+            rng.random() > 0.15,
+            rng.random() > 0.15,
+            (coord(), coord()),
+            (coord(), coord()),
+            rng.uniform(2, 6) if rng.random() > 0.1 else None,
+            rng.uniform(2, 6) if rng.random() > 0.1 else None,
+            vec3(), vec3(),
+            vec3() if rng.random() > 0.1 else None,
+            vec3() if rng.random() > 0.1 else None,
+        )
+        for i in range(n)
+    ]
+
+def recorded_samples(path: Path) -> list[dict[str, Any]]:
+    """Rebuilds raw SDK samples from a recorded file, validity is inferred from nulls."""
+    import pyarrow.parquet as pq
+
+    rows = pq.read_table(path).to_pylist()
+    as_tuple = lambda v: tuple(v) if v is not None else None
+    return [
+        _raw_sample(
+            i,
+            r["left_x_norm"] is not None,
+            r["right_x_norm"] is not None,
+            (r["left_x_norm"], r["left_y_norm"]),
+            (r["right_x_norm"], r["right_y_norm"]),
+            r["left_pupil_mm"], r["right_pupil_mm"],
+            as_tuple(r["left_3d_mm"]) or _NAN3, as_tuple(r["right_3d_mm"]) or _NAN3,
+            as_tuple(r["left_origin_mm"]), as_tuple(r["right_origin_mm"]),
+        )
+        for i, r in enumerate(rows)
+    ]
+
+def check_equivalence(samples: list[dict[str, Any]], batch_size: int = 64) -> None:
+    expected = GazeBatch.from_samples([scalar_sample(d, _WIDTH, _HEIGHT) for d in samples])
+    actual = GazeBatch.concat([
+        batch_from_dicts(samples[i:i + batch_size], _WIDTH, _HEIGHT, _utc_ms)
+        for i in range(0, len(samples), batch_size)
+    ])
+    for name in GazeBatch.COLUMNS:
+        a, e = getattr(actual, name), getattr(expected, name)
+        if name in ("gaze_x_px", "gaze_y_px"):
+            a, e = a[actual.gaze_px_valid], e[expected.gaze_px_valid]
+        equal_nan = a.dtype.kind == "f"
+        if not np.array_equal(a, e, equal_nan=equal_nan):
+            raise AssertionError(f"Column '{name}' differs between scalar and vectorized paths.")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--parquet", type=Path, default=None)
+    args = parser.parse_args()
+
+    samples = synthetic_samples(args.samples)
+    check_equivalence(samples, args.batch_size)
+    print(f"Equivalence OK on {len(samples):,} synthetic samples.")
+
+    if args.parquet is not None:
+        check_equivalence(recorded_samples(args.parquet), args.batch_size)
+        print(f"Equivalence OK on recorded samples from {args.parquet}.")
+
+    # Legacy: the whole scalar path runs on the SDK callback thread
+    t0 = time.thread_time_ns()
+    for d in samples:
+        scalar_sample(d, _WIDTH, _HEIGHT)
+    scalar_ns = (time.thread_time_ns() - t0) / len(samples)
+
+    # Batched: the callback only appends, the kernel runs once per batch on the loop
+    pending: list = []
+    t0 = time.thread_time_ns()
+    for d in samples:
+        pending.append(d)
+    handoff_ns = (time.thread_time_ns() - t0) / len(samples)
+
+    t0 = time.thread_time_ns()
+    for i in range(0, len(samples), args.batch_size):
+        batch_from_dicts(samples[i:i + args.batch_size], _WIDTH, _HEIGHT, _utc_ms)
+    vector_ns = (time.thread_time_ns() - t0) / len(samples)
+
+    print(f"scalar (SDK thread):       {scalar_ns / 1_000:7.2f} us/sample")
+    print(f"batched (SDK thread):      {handoff_ns / 1_000:7.2f} us/sample (+ ring lock)")
+    print(f"batched (loop, n={args.batch_size:<4}):   {vector_ns / 1_000:7.2f} us/sample")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Pipeline load test with the synthetic dummy tracker or a recorded session.
+
+Runs `GazeRunner` with a synthetic `DummySource` at the given rate (or a
+`ReplaySource` when --replay is given) into the sinks built by `create_sinks`
+(Parquet always, NATS when --nats is given) and reports throughput, drops
+and process CPU.
+
+    python -m gaze_capture.benchmarks.load --rate 2000 --seconds 30 --burstiness 0.2 [--nats nats://localhost:4222]
+    python -m gaze_capture.benchmarks.load --replay data/.../eye_tracker__x.parquet --speed 0
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from ..acquisition import DummySource, ReplaySource
+from ..configs import AppSettings, SourceConfig
+from ..core.factories import create_sinks, create_stages
+from ..core.runner import GazeRunner
+
+async def _run(args: argparse.Namespace) -> dict:
+    cfg = SourceConfig(
+        dummy_mode="synthetic",
+        dummy_frequency=args.rate,
+        dummy_batch_ms=args.batch_ms,
+        dummy_burstiness=args.burstiness,
+        replay_path=args.replay,
+        replay_speed=args.speed,
+    )
+    settings = AppSettings(orion_host="", orion_polaris_db_dir="", source=cfg)
+    settings.processing.stages = args.stages
+
+    nc = None
+    if args.nats:
+        import nats
+        nc = await nats.connect(args.nats)
+    settings.nats.enabled = nc is not None
+
+    output_dir = args.output_dir or Path(tempfile.mkdtemp(prefix="gaze_load_"))
+    if args.replay:
+        source = ReplaySource(args.replay, 3840, 2160, speed=args.speed, cfg=cfg)
+    else:
+        source = DummySource(3840, 2160, frequency=args.rate, cfg=cfg)
+
+    runner = GazeRunner(
+        source=source,
+        sinks=create_sinks(settings, output_dir, nc),
+        cfg=settings.runner,
+        stages=create_stages(settings, output_dir, nc),
+    )
+
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    await runner.start()
+    if args.replay:
+        # Replay ends on its own, --seconds only caps it
+        await asyncio.wait([runner._source_task], timeout=args.seconds)
+    else:
+        await asyncio.sleep(args.seconds)
+    await runner.stop()
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+
+    if nc is not None:
+        await nc.drain()
+
+    stats = runner.stats()
+    samples = stats["source"]["queue"]["enqueued"]
+    return {
+        "rate_hz": args.rate,
+        "samples": samples,
+        "achieved_hz": samples / wall,
+        "cpu_pct": 100 * cpu / wall,
+        "output_dir": str(output_dir),
+        **stats,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=1200)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--batch-ms", type=float, default=16.0)
+    parser.add_argument("--burstiness", type=float, default=0.0)
+    parser.add_argument("--nats", type=str, default=None)
+    parser.add_argument("--output-dir", type=Path, default=None)
+    parser.add_argument("--stages", type=lambda s: s.split(","), default=[], help="Comma separated processing stages, e.g. ivt")
+    parser.add_argument("--replay", type=Path, default=None, help="Recorded eye_tracker parquet to replay")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed factor, 0 = as fast as possible")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(_run(args)), indent=2, default=str))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Parquet codecs and encodings: bytes per hour, flush CPU time and read throughput.
+
+Runs one session (a recording, or synthetic gaze) through `ParquetSink` once
+per `ParquetWriterConfig` below, one `_write_sync` per flush like the sink's
+worker, and reports:
+  MB/h       file size scaled to one hour of recording (from the device clock span)
+  cpu ms     thread CPU time per flush (Arrow conversion + encoding + compression)
+  read Mrows pq.read_table throughput of the whole file (best of --repeat)
+
+Before that, a writer is opened for every codec `ParquetWriterConfig` accepts,
+with and without a compression level, so a config that validates can't fail
+at the sink's first flush.
+
+    python -m gaze_capture.benchmarks.parquet_codecs --rate 120 --minutes 10
+    python -m gaze_capture.benchmarks.parquet_codecs --recording data/eye_tracker__20250101_120000.parquet
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import get_args
+
+from pydantic import ValidationError
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .kernels import _WIDTH, _HEIGHT
+from ..acquisition import read_recording
+from ..acquisition.synthetic import GazeSynthesizer
+from ..configs import ParquetWriterConfig
+from ..models import GazeBatch
+from ..sinks.parquet import ParquetSink, batch_to_table, writer_options
+
+CONFIGS: dict[str, ParquetWriterConfig] = {
+    "zstd (default)": ParquetWriterConfig(),
+    "zstd-1": ParquetWriterConfig(compression_level=1),
+    "zstd-9": ParquetWriterConfig(compression_level=9),
+    "lz4": ParquetWriterConfig(compression="lz4"),
+    "snappy": ParquetWriterConfig(compression="snappy"),
+    "gzip": ParquetWriterConfig(compression="gzip"),
+    "brotli": ParquetWriterConfig(compression="brotli"),
+    "none": ParquetWriterConfig(compression="none"),
+    "zstd no-dict": ParquetWriterConfig(use_dictionary=False),
+    "zstd delta": ParquetWriterConfig(delta_timestamps=True),
+    "zstd bss": ParquetWriterConfig(byte_stream_split=True),
+    "zstd delta+bss": ParquetWriterConfig(delta_timestamps=True, byte_stream_split=True),
+    "zstd-9 delta+bss": ParquetWriterConfig(compression_level=9, delta_timestamps=True, byte_stream_split=True),
+    "lz4 delta+bss": ParquetWriterConfig(compression="lz4", delta_timestamps=True, byte_stream_split=True),
+}
+
+def check_codecs(batch: GazeBatch, schema_version: int) -> list[str]:
+    """Opens a writer for every codec, with the default and an explicit level. Returns the codecs that take no level."""
+    table = batch_to_table(batch.slice(0, min(len(batch), 100)), schema_version)
+    no_level = []
+    for codec in get_args(ParquetWriterConfig.model_fields["compression"].annotation):
+        for level in (None, 3):
+            try:
+                cfg = ParquetWriterConfig(compression=codec, compression_level=level)
+            except ValidationError:
+                no_level.append(codec)
+                continue
+            with pq.ParquetWriter(pa.BufferOutputStream(), table.schema, **writer_options(cfg, table.schema)) as writer:
+                writer.write_table(table)
+    return no_level
+
+def write(batch: GazeBatch, output_dir: Path, cfg: ParquetWriterConfig, flush_rows: int, schema_version: int) -> tuple[Path, list[float]]:
+    """Writes `batch` flush by flush, returns the file and the thread CPU seconds of each flush."""
+    sink = ParquetSink(
+        output_dir, drop_when_full=False, max_buffer_size=flush_rows, queue_size=flush_rows + 1,
+        schema_version=schema_version, writer=cfg,
+    )
+    cpu = []
+    for start in range(0, len(batch), flush_rows):
+        chunk = batch.slice(start, min(start + flush_rows, len(batch)))
+        t0 = time.thread_time()
+        sink._write_sync(chunk)
+        cpu.append(time.thread_time() - t0)
+    sink._close_writer()
+    return sink.output_path, cpu
+
+def read_seconds(path: Path, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        pq.read_table(path, memory_map=True)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recording", type=Path, default=None, help="Recorded session to re-encode, synthetic gaze when omitted")
+    parser.add_argument("--rate", type=int, default=120, help="Synthetic sampling rate")
+    parser.add_argument("--minutes", type=float, default=10.0, help="Synthetic session length")
+    parser.add_argument("--flush-rows", type=int, default=600, help="Rows per flush (ParquetSinkConfig.max_buffer_size)")
+    parser.add_argument("--schema", type=int, default=1, choices=[1, 2], help="Recording schema version")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--configs", nargs="+", default=list(CONFIGS), choices=list(CONFIGS), metavar="NAME")
+    args = parser.parse_args()
+
+    if args.recording is not None:
+        batch, source = read_recording(args.recording), str(args.recording)
+    else:
+        batch = GazeSynthesizer(args.rate, _WIDTH, _HEIGHT, seed=0).generate(int(args.rate * args.minutes * 60))
+        source = f"synthetic {args.rate} Hz, {args.minutes:g} min"
+    n = len(batch)
+    hours = (int(batch.device_timestamp_us[-1]) - int(batch.device_timestamp_us[0])) / 3.6e9
+
+    no_level = check_codecs(batch, args.schema)
+    print(f"{source}: {n:,} rows, schema v{args.schema}, {args.flush_rows} rows per flush")
+    print(f"every codec opens a writer (no compression_level accepted for {', '.join(no_level)})")
+    print(f"{'config':<18} {'MB/h':>8} {'B/row':>7} {'cpu ms p50':>11} {'cpu ms p99':>11} {'read Mrows/s':>13}")
+    with tempfile.TemporaryDirectory(prefix="gaze_codecs_") as tmp:
+        for i, name in enumerate(args.configs):
+            path, cpu = write(batch, Path(tmp) / str(i), CONFIGS[name], args.flush_rows, args.schema)
+            size = path.stat().st_size
+            p50, p99 = 1e3 * np.percentile(cpu, (50, 99))
+            read_s = read_seconds(path, args.repeat)
+            print(f"{name:<18} {size / hours / 1e6:>8.1f} {size / n:>7.2f} {p50:>11.2f} {p99:>11.2f} {n / read_s / 1e6:>13.2f}")
+
+if __name__ == "__main__":
+    main()
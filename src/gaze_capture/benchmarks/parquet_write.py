@@ -0,0 +1,132 @@
+"""
+Arrow table building for `ParquetSink`: rows/s and GIL hold time.
+
+Compares three ways of turning one flush of gaze samples into a table:
+  rows     the original path, per-row Python lists of `GazeData` fields, then `pa.array`
+  masked   `pa.array` on `GazeBatch` columns with boolean masks
+  buffers  `batch_to_table`, arrays built over the column buffers with validity bitmaps
+
+GIL hold time is measured by a probe thread that sleeps in short steps and
+records how late it wakes up, i.e. how long it waited for the GIL held by
+the converting thread.
+
+    python -m gaze_capture.benchmarks.parquet_write --rows 600 --flushes 500
+"""
+import argparse
+import threading
+import time
+from typing import Callable
+
+import numpy as np
+import pyarrow as pa
+
+from .kernels import synthetic_samples, _utc_ms, _WIDTH, _HEIGHT
+from ..acquisition.kernels import batch_from_dicts
+from ..models import GazeBatch, GazeData
+from ..sinks.parquet import ParquetSink, batch_to_table
+
+_SCHEMA = ParquetSink._SCHEMA
+
+def rows_to_table(frames: list[GazeData]) -> pa.Table:
+    """Reference: the original row-wise `_write_sync` conversion."""
+    columns: list[list] = [[] for _ in range(17)]
+    for d in frames:
+        values = (
+            d.timestamp_ms, d.gaze_x_px, d.gaze_y_px, d.gaze_x_norm, d.gaze_y_norm,
+            d.device_timestamp_us, d.system_timestamp_us,
+            d.left_x_norm, d.left_y_norm, d.right_x_norm, d.right_y_norm,
+            d.left_pupil_mm, d.right_pupil_mm,
+            *(list(v) if v is not None else None for v in (d.left_3d_mm, d.right_3d_mm, d.left_origin_mm, d.right_origin_mm)),
+        )
+        for column, value in zip(columns, values):
+            column.append(value)
+    return pa.Table.from_arrays([pa.array(c, type=f.type) for c, f in zip(columns, _SCHEMA)], schema=_SCHEMA)
+
+def masked_to_table(batch: GazeBatch) -> pa.Table:
+    """Reference: `pa.array` with boolean masks, the previous batch path."""
+    def f32(values: np.ndarray) -> pa.Array:
+        return pa.array(values.astype(np.float32), mask=np.isnan(values))
+
+    def vec3(values: np.ndarray) -> pa.Array:
+        offsets = pa.array(np.arange(0, 3 * len(values) + 1, 3, dtype=np.int32))
+        return pa.ListArray.from_arrays(offsets, values.astype(np.float32).ravel(), mask=pa.array(np.isnan(values[:, 0])))
+
+    px_mask = ~batch.gaze_px_valid
+    return pa.Table.from_arrays(
+        [
+            pa.array(batch.timestamp_ms, type=pa.timestamp('ms')),
+            pa.array(batch.gaze_x_px, type=pa.int16(), mask=px_mask),
+            pa.array(batch.gaze_y_px, type=pa.int16(), mask=px_mask),
+            f32(batch.gaze_x_norm), f32(batch.gaze_y_norm),
+            pa.array(batch.device_timestamp_us, type=pa.int64()),
+            pa.array(batch.system_timestamp_us, type=pa.int64()),
+            f32(batch.left_x_norm), f32(batch.left_y_norm), f32(batch.right_x_norm), f32(batch.right_y_norm),
+            f32(batch.left_pupil_mm), f32(batch.right_pupil_mm),
+            vec3(batch.left_3d_mm), vec3(batch.right_3d_mm), vec3(batch.left_origin_mm), vec3(batch.right_origin_mm),
+        ],
+        schema=_SCHEMA,
+    )
+
+class GilProbe:
+    """Background thread measuring how late its short sleeps end, i.e. time spent waiting for the GIL."""
+    def __init__(self, step_s: float = 0.0002) -> None:
+        self.step_s = step_s
+        self.waits: list[float] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            t0 = time.perf_counter()
+            time.sleep(self.step_s)
+            self.waits.append(time.perf_counter() - t0 - self.step_s)
+
+    def __enter__(self) -> "GilProbe":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._stop.set()
+        self._thread.join()
+
+def measure(convert: Callable[[], pa.Table], flushes: int, baseline_wait_s: float) -> tuple[float, float, float]:
+    """Seconds per flush, and GIL wait per flush / worst single wait in ms (above the idle baseline)."""
+    with GilProbe() as probe:
+        t0 = time.perf_counter()
+        for _ in range(flushes):
+            convert()
+        elapsed = time.perf_counter() - t0
+    waits = np.maximum(np.asarray(probe.waits) - baseline_wait_s, 0)
+    return elapsed / flushes, 1_000 * waits.sum() / flushes, 1_000 * waits.max(initial=0)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=600, help="Rows per flush (ParquetSinkConfig.max_buffer_size)")
+    parser.add_argument("--flushes", type=int, default=500)
+    args = parser.parse_args()
+
+    batch = batch_from_dicts(synthetic_samples(args.rows), _WIDTH, _HEIGHT, _utc_ms)
+    frames = list(batch)
+
+    # All three paths must produce the same table
+    expected = batch_to_table(batch)
+    assert masked_to_table(batch).equals(expected), "masked path differs"
+    assert rows_to_table(frames).equals(expected), "row path differs"
+
+    # Idle probe lateness (timer granularity), subtracted from the measurements
+    with GilProbe() as probe:
+        time.sleep(0.5)
+    baseline = float(np.median(probe.waits))
+
+    print(f"{args.rows} rows per flush, {args.flushes} flushes (idle probe lateness {1e6 * baseline:.0f} us subtracted)")
+    print(f"{'path':<8} {'us/flush':>10} {'rows/s':>12} {'GIL ms/flush':>13} {'max hold ms':>12}")
+    for name, convert in (
+        ("rows", lambda: rows_to_table(frames)),
+        ("masked", lambda: masked_to_table(batch)),
+        ("buffers", lambda: batch_to_table(batch)),
+    ):
+        per_flush, gil_ms, max_ms = measure(convert, args.flushes, baseline)
+        print(f"{name:<8} {1e6 * per_flush:>10.1f} {args.rows / per_flush:>12,.0f} {gil_ms:>13.3f} {max_ms:>12.3f}")
+
+if __name__ == "__main__":
+    main()
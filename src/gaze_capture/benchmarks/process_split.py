@@ -0,0 +1,93 @@
+"""
+Sample timing with the pipeline in the UI process vs in its own process.
+
+Records dummy gaze at the given rate while the main thread emulates UI work:
+`--ui-work-ms` of pure-Python work (holding the GIL, like Tk redraws,
+canvas drawing or `_poll_ui_state`) every `--ui-period-ms`. Reports the
+sample age when the runner dequeues it and its jitter (p99 - p50), for
+`EyeTrackingManager` on an engine thread ("inline") and for `ProcessManager`
+("process").
+
+    python -m gaze_capture.benchmarks.process_split --rate 600 --seconds 10 [--ui-work-ms 8 --ui-period-ms 20]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from ..configs import AppSettings
+from ..controllers import DummyController
+from ..core.manager import EyeTrackingManager
+from ..core.process import ProcessManager
+from ..utils.engine import start_engine
+
+def _settings(data_dir: Path, rate: int, batch_ms: float) -> AppSettings:
+    settings = AppSettings(data_dir=data_dir, use_dummy_mode=True, orion_host="", orion_polaris_db_dir="")
+    settings.nats.enabled = False
+    settings.runner.tracing.enabled = True
+    settings.runner.tracing.log_interval_s = 0
+    settings.source.dummy_mode = "synthetic"
+    settings.source.dummy_frequency = rate
+    settings.source.dummy_batch_ms = batch_ms
+    return settings
+
+def _ui_load(seconds: float, work_ms: float, period_ms: float) -> None:
+    """Busy pure-Python work in bursts, the way Tk callbacks hold the GIL."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        burst_end = time.perf_counter() + work_ms / 1_000
+        n = 0
+        while time.perf_counter() < burst_end:
+            n += sum(i * i for i in range(200))
+        time.sleep(max(period_ms - work_ms, 0) / 1_000)
+
+def record(mode: str, args: argparse.Namespace) -> dict[str, Any]:
+    data_dir = Path(tempfile.mkdtemp(prefix="gaze_split_"))
+    (data_dir / "calibration.bin").touch() # The dummy controller only checks that it exists
+    settings = _settings(data_dir, args.rate, args.batch_ms)
+    loop = start_engine(settings.engine)
+
+    if mode == "process":
+        manager = ProcessManager(settings, loop)
+    else:
+        manager = EyeTrackingManager(DummyController(), settings, loop, None)
+
+    def run(coro):
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    try:
+        run(manager.connect(settings.display_area))
+        run(manager.load_calibration(data_dir))
+        run(manager.start_recording("bench"))
+        _ui_load(args.seconds, args.ui_work_ms, args.ui_period_ms)
+        run(manager.stop_recording())
+        stats = manager.pop_recording_stats()[-1]
+    finally:
+        manager.shutdown()
+        loop.call_soon_threadsafe(loop.stop)
+
+    return stats["latency"]["dequeue"]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=600)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--batch-ms", type=float, default=2.0, help="Dummy emission period, small so batching hides no jitter")
+    parser.add_argument("--ui-work-ms", type=float, default=8.0)
+    parser.add_argument("--ui-period-ms", type=float, default=20.0)
+    parser.add_argument("--modes", nargs="+", default=["inline", "process"], choices=["inline", "process"])
+    args = parser.parse_args()
+
+    print(f"rate={args.rate} Hz, UI load {args.ui_work_ms} ms every {args.ui_period_ms} ms, sample age at dequeue:")
+    print(f"{'mode':<8} {'samples':>8} {'p50 ms':>8} {'p99 ms':>8} {'p99.9 ms':>9} {'max ms':>8} {'jitter ms':>10}")
+    for mode in args.modes:
+        r = record(mode, args)
+        print(
+            f"{mode:<8} {r['count']:>8} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['p999_ms']:>9.2f} "
+            f"{r['max_ms']:>8.2f} {r['p99_ms'] - r['p50_ms']:>10.2f}"
+        )
+
+if __name__ == "__main__":
+    main()
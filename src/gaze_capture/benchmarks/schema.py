@@ -0,0 +1,85 @@
+"""
+Recording schema v1 vs v2: file size and read speed.
+
+Writes the same synthetic recording through `ParquetSink` with each schema
+version (one row group per flush, like a live session) and reports:
+  size     bytes on disk and per row
+  table    `pq.read_table` of the whole file
+  3d       `pq.read_table` of the four 3D coordinate columns only
+  batch    `read_recording`, the whole file back into a `GazeBatch`
+
+v1 stores 3D coordinates as `list<float32>` (offsets plus repetition and
+definition levels per column), v2 as flat `<name>_x/_y/_z` float32 columns.
+
+    python -m gaze_capture.benchmarks.schema --rate 120 --minutes 10 [--repeat 5]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from .kernels import _WIDTH, _HEIGHT
+from ..acquisition import read_recording
+from ..acquisition.replay import schema_version
+from ..acquisition.synthetic import GazeSynthesizer
+from ..models import GazeBatch
+from ..sinks.parquet import ParquetSink
+
+_VEC3_NAMES = ["left_3d_mm", "right_3d_mm", "left_origin_mm", "right_origin_mm"]
+_VEC3_COLUMNS = {1: _VEC3_NAMES, 2: [f"{name}_{axis}" for name in _VEC3_NAMES for axis in "xyz"]}
+
+def write(batch: GazeBatch, output_dir: Path, version: int, flush_rows: int) -> Path:
+    """Writes `batch` the way the sink's worker does, one `_write_sync` per flush."""
+    sink = ParquetSink(output_dir, drop_when_full=False, max_buffer_size=flush_rows, queue_size=1, schema_version=version)
+    for start in range(0, len(batch), flush_rows):
+        sink._write_sync(batch.slice(start, min(start + flush_rows, len(batch))))
+    sink._writer.close()
+    return sink.output_path
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=120, help="Sampling rate of the synthetic recording")
+    parser.add_argument("--minutes", type=float, default=10.0)
+    parser.add_argument("--flush-rows", type=int, default=600, help="Rows per row group (ParquetSinkConfig.max_buffer_size)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    n = int(args.rate * args.minutes * 60)
+    batch = GazeSynthesizer(args.rate, _WIDTH, _HEIGHT, seed=0).generate(n)
+
+    with tempfile.TemporaryDirectory(prefix="gaze_schema_") as tmp:
+        paths = {v: write(batch, Path(tmp) / f"v{v}", v, args.flush_rows) for v in (1, 2)}
+
+        # Both versions must read back to the same data
+        v1, v2 = read_recording(paths[1]), read_recording(paths[2])
+        for name in GazeBatch.COLUMNS:
+            a, b = getattr(v1, name), getattr(v2, name)
+            assert np.array_equal(a, b, equal_nan=a.dtype.kind == "f"), f"{name} differs between v1 and v2"
+
+        print(f"{n:,} rows ({args.rate} Hz, {args.minutes:g} min), {args.flush_rows} rows per row group, best of {args.repeat}")
+        print(f"{'schema':<7} {'size KiB':>10} {'B/row':>7} {'table ms':>9} {'3d ms':>8} {'batch ms':>9}")
+        for version, path in paths.items():
+            assert schema_version(pq.read_schema(path)) == version
+            size = path.stat().st_size
+            t_table = best_of(lambda: pq.read_table(path, memory_map=True), args.repeat)
+            t_vec3 = best_of(lambda: pq.read_table(path, columns=_VEC3_COLUMNS[version], memory_map=True), args.repeat)
+            t_batch = best_of(lambda: read_recording(path), args.repeat)
+            print(
+                f"v{version:<6} {size / 1024:>10,.1f} {size / n:>7.2f} "
+                f"{1e3 * t_table:>9.1f} {1e3 * t_vec3:>8.1f} {1e3 * t_batch:>9.1f}"
+            )
+
+if __name__ == "__main__":
+    main()
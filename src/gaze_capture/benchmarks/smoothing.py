@@ -0,0 +1,89 @@
+"""
+Latency and jitter of the One-Euro smoothing stage.
+
+On synthetic gaze at the given rate reports the stage CPU time per sample,
+the delay it adds to a noise-free saccade step (time to 50 % / 90 % of the
+step, relative to the raw signal) and the sample-to-sample jitter during
+fixations with and without smoothing.
+
+    python -m gaze_capture.benchmarks.smoothing --rate 1200 --seconds 60 [--beta 10 --min-cutoff 1]
+"""
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from ..acquisition.synthetic import GazeSynthesizer
+from ..configs import OneEuroConfig
+from ..models import GazeBatch
+from ..processing import GazeStage, OneEuroSmoother
+
+_WIDTH, _HEIGHT = 3840, 2160
+
+async def run_stage(stage: GazeStage, batch: GazeBatch, batch_rows: int) -> GazeBatch:
+    """Feeds `batch` through the stage in runner-sized chunks."""
+    return GazeBatch.concat([
+        await stage.process(batch.slice(i, i + batch_rows))
+        for i in range(0, len(batch), batch_rows)
+    ])
+
+def _step_batch(rate: int, start: float, end: float, seconds: float = 1.0) -> GazeBatch:
+    """Noise-free gaze that jumps from `start` to `end` halfway through."""
+    n = int(rate * seconds)
+    x = np.where(np.arange(n) < n // 2, start, end)
+    batch = GazeBatch.empty(n)
+    batch.device_timestamp_us[:] = np.arange(n) * 1_000_000 // rate
+    for name in ("left_x_norm", "right_x_norm", "gaze_x_norm"):
+        getattr(batch, name)[:] = x
+    for name in ("left_y_norm", "right_y_norm", "gaze_y_norm"):
+        getattr(batch, name)[:] = 0.5
+    return batch
+
+def step_delay_ms(cfg: OneEuroConfig, rate: int, batch_rows: int) -> dict[str, float]:
+    batch = _step_batch(rate, 0.3, 0.6)
+    smoothed = asyncio.run(run_stage(OneEuroSmoother(cfg, _WIDTH, _HEIGHT), batch, batch_rows))
+    x = smoothed.extras["smooth_x_norm"]
+    t_ms = batch.device_timestamp_us / 1_000
+    t_step = t_ms[len(batch) // 2]
+
+    def reach(frac: float) -> float:
+        return float(t_ms[np.argmax(x >= 0.3 + frac * 0.3)] - t_step)
+    return {"step_50pct_ms": reach(0.5), "step_90pct_ms": reach(0.9)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=1200)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--batch-ms", type=float, default=16.0)
+    parser.add_argument("--min-cutoff", type=float, default=None)
+    parser.add_argument("--beta", type=float, default=None)
+    args = parser.parse_args()
+
+    overrides = {"min_cutoff_hz": args.min_cutoff, "beta": args.beta}
+    cfg = OneEuroConfig(**{k: v for k, v in overrides.items() if v is not None})
+    batch_rows = max(1, int(args.rate * args.batch_ms / 1_000))
+
+    raw = GazeSynthesizer(args.rate, _WIDTH, _HEIGHT, seed=0).generate(int(args.rate * args.seconds))
+
+    t0 = time.thread_time_ns()
+    smoothed = asyncio.run(run_stage(OneEuroSmoother(cfg, _WIDTH, _HEIGHT), raw, batch_rows))
+    cpu_ns = (time.thread_time_ns() - t0) / len(raw)
+
+    # Jitter: sample-to-sample motion below saccade speed, in pixels
+    def jitter_px(x: np.ndarray, y: np.ndarray) -> float:
+        step = np.hypot(np.diff(x) * _WIDTH, np.diff(y) * _HEIGHT)
+        slow = step < 5 * np.nanmedian(step)
+        return float(np.sqrt(np.nanmean(step[slow] ** 2)))
+
+    raw_jitter = jitter_px(raw.gaze_x_norm, raw.gaze_y_norm)
+    smooth_jitter = jitter_px(smoothed.extras["smooth_x_norm"], smoothed.extras["smooth_y_norm"])
+
+    print(f"config:            min_cutoff={cfg.min_cutoff_hz} Hz, beta={cfg.beta}, rate={args.rate} Hz")
+    print(f"cpu:               {cpu_ns / 1_000:7.2f} us/sample")
+    for name, value in step_delay_ms(cfg, args.rate, batch_rows).items():
+        print(f"{name + ':':<18} {value:7.2f} ms")
+    print(f"fixation jitter:   {raw_jitter:7.2f} px raw -> {smooth_jitter:.2f} px smoothed")
+
+if __name__ == "__main__":
+    main()
@@ -1 +1 @@
-from .app import AppSettings, DisplayAreaSettings
\ No newline at end of file
+from .app import AppSettings, DisplayAreaSettings, SourceConfig, RunnerConfig, WatchdogConfig, TracingConfig, SinkInboxConfig, IVTConfig, OneEuroConfig, EngineConfig, MetricsConfig, ParquetWriterConfig
\ No newline at end of file
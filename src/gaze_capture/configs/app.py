@@ -1,11 +1,13 @@
 import logging
 from pathlib import Path
+from typing import Literal
 from importlib.metadata import version
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import BaseModel, PositiveInt, model_validator, Field
+from pydantic import BaseModel, PositiveInt, PositiveFloat, NonNegativeInt, NonNegativeFloat, model_validator, Field
 
 from .utils import LoggingConfig
+from ..utils.queues import OverflowPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -22,22 +24,156 @@ class DisplayAreaSettings(BaseModel):
     horizontal_offset_mm: float = Field(0.0, description="Horizontal distance from tracker center to screen center.")
     depth_offset_mm: float = Field(0.0, description="Depth distance from the tracker to the screen plane.")
 
+class SourceConfig(BaseModel):
+    # Tobii SDK payload: "dict" (as_dictionary=True) or "object" (tr.GazeData accessors)
+    callback_mode: Literal["dict", "object"] = "dict"
+
+    # Hardware thread -> event loop handoff
+    ring_capacity: PositiveInt = 4096 # Samples buffered between loop wakeups
+    wakeup_high_water: PositiveInt = 64 # Forces a drain once this many samples are pending
+    wakeup_coalesce_ms: NonNegativeFloat = 16.0 # Max delay before pending samples are drained
+
+    # Source -> runner queue, bounded in samples (0 = unbounded)
+    queue_capacity: NonNegativeInt = 120 * 60 * 5 # Holds 5 minutes of data at 120 Hz
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    block_timeout_ms: NonNegativeFloat = 1_000.0 # Only used by the "block" policy
+
+    # Device clock -> UTC synchronisation
+    clock_sync_interval_s: NonNegativeFloat = 10.0 # Re-probe period (0 = one-shot at start)
+    clock_sync_burst: PositiveInt = 50 # Probes per re-sync, the lowest latency one is kept
+    clock_sync_window: PositiveInt = 60 # Re-syncs used for the offset/drift fit
+
+    # Dummy tracker ("circle": one frame per sleep, "synthetic": realistic vectorized batches)
+    dummy_mode: Literal["circle", "synthetic"] = "circle"
+    dummy_frequency: int = Field(120, ge=1, le=2000)
+    dummy_batch_ms: PositiveFloat = 16.0 # Synthetic emission period
+    dummy_burstiness: float = Field(0.0, ge=0.0, le=1.0) # Chance that an emission stalls and catches up later
+
+    # Replay of a recorded eye_tracker parquet (dummy mode only, replaces the dummy tracker when set)
+    replay_path: Path | None = None
+    replay_speed: NonNegativeFloat = 1.0 # 1.0 = real time, N = N times faster, 0 = as fast as possible
+
+    @model_validator(mode='after')
+    def validate_ring(self) -> "SourceConfig":
+        if self.wakeup_high_water > self.ring_capacity:
+            raise ValueError('High-water mark must not exceed ring capacity.')
+        return self
+
+class WatchdogConfig(BaseModel):
+    """
+    Pipeline health checks while recording. Worst-case detection time is
+    `interval_s` plus `rate_window_s` (rate) or `stall_timeout_s` (stalls).
+    """
+    enabled: bool = True
+    interval_s: PositiveFloat = 0.5 # Check period
+    rate_window_s: PositiveFloat = 2.0 # Span the sample rate is measured over
+    min_rate_ratio: float = Field(0.9, gt=0.0, le=1.0) # Degraded below this fraction of the expected rate
+    stall_timeout_s: PositiveFloat = 2.0 # Stalled after this long without samples or sink progress
+    max_sink_lag_ms: PositiveFloat = 1_000.0 # Degraded when a sink's backlog is older than this
+
+class TracingConfig(BaseModel):
+    # Per-sample age histograms at callback, enqueue, dequeue and sink checkpoints (opt-in)
+    enabled: bool = False
+    log_interval_s: NonNegativeFloat = 30.0 # Periodic percentile log (0 = never)
+
+class RunnerConfig(BaseModel):
+    # Greedy draining: everything queued is forwarded as one batch, bounded by rows and time
+    batch_max_rows: PositiveInt = 4096
+    batch_budget_ms: NonNegativeFloat = 2.0 # Max time spent collecting one batch
+    history_ms: NonNegativeFloat = 2_000.0 # Recent samples kept to backfill sinks attached mid-recording (0 = off)
+
+    watchdog: WatchdogConfig = Field(default_factory=WatchdogConfig)
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
+
+class IVTConfig(BaseModel):
+    """Velocity-threshold (I-VT) fixation/saccade/blink classification."""
+    velocity_threshold_deg_s: PositiveFloat = 30.0 # Faster is saccade
+    velocity_window_ms: NonNegativeFloat = 20.0 # Velocity over this span, damps noise at high rates (0 = consecutive samples)
+    min_fixation_ms: NonNegativeFloat = 60.0 # Shorter fixations are discarded
+    default_distance_mm: PositiveFloat = 600.0 # Eye-screen distance when head position is missing
+    subject: str = "intent.gaze.fixations"
+    sidecar: bool = True # Writes fixations__*.parquet next to the recording
+
+class OneEuroConfig(BaseModel):
+    """One-Euro adaptive smoothing of per-eye normalized gaze."""
+    min_cutoff_hz: PositiveFloat = 1.0 # Cutoff at rest, lower is steadier
+    beta: NonNegativeFloat = 10.0 # Cutoff increase per unit/s of gaze speed, higher is less lag
+    d_cutoff_hz: PositiveFloat = 1.0 # Cutoff of the speed estimate
+    reset_gap_ms: PositiveFloat = 100.0 # Longer gaps (blinks, lost tracking) restart the filter
+
+class ProcessingConfig(BaseModel):
+    # Stage names, applied in order to every batch before it reaches the sinks ("ivt", "one_euro")
+    stages: list[str] = Field(default_factory=list)
+    ivt: IVTConfig = Field(default_factory=IVTConfig)
+    one_euro: OneEuroConfig = Field(default_factory=OneEuroConfig)
+
+class SinkInboxConfig(BaseModel):
+    """
+    Per-sink inbox between the runner and the sink's own consumer task.
+    A slow sink only fills (and overflows) its own inbox.
+    """
+    capacity: NonNegativeInt = 120 * 60 # Samples (0 = unbounded)
+    policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    block_timeout_ms: NonNegativeFloat = 1_000.0 # Only used by the "block" policy
+    drain_timeout_ms: NonNegativeFloat = 5_000.0 # Max wait for the backlog when the runner stops
+
+class ParquetWriterConfig(BaseModel):
+    """Codec and column encodings of the written Parquet files (defaults are the pyarrow ones, plus zstd)."""
+    compression: Literal["zstd", "lz4", "snappy", "gzip", "brotli", "none"] = "zstd"
+    compression_level: int | None = None # Codec default when unset, e.g. zstd 1..22
+    use_dictionary: bool = True # Only applies to columns without an explicit encoding below
+    delta_timestamps: bool = False # DELTA_BINARY_PACKED for timestamp_ms / device_ts_us / system_ts_us
+    byte_stream_split: bool = False # BYTE_STREAM_SPLIT for float32 columns (3D coordinates included)
+
+    @model_validator(mode='after')
+    def validate_compression_level(self) -> "ParquetWriterConfig":
+        # pyarrow raises when the writer opens, every flush of the session would be dropped
+        if self.compression_level is not None and self.compression in ("snappy", "none"):
+            raise ValueError(f"Codec '{self.compression}' takes no compression_level.")
+        return self
+
 class ParquetSinkConfig(BaseModel):
     enabled: bool = True
     output_dir: Path = Path("./data")
     drop_when_full: bool = True
     max_buffer_size: PositiveInt = 120 * 5 # Flushes every 5 seconds at 120 Hz
-    queue_size: PositiveInt = 120 * 5 * 60 # Holds 5 minutes of data at 120 Hz
+    queue_size: PositiveInt = 120 * 5 * 60 # Samples (frames or batch rows), holds 5 minutes of data at 120 Hz
+    schema_version: Literal[1, 2] = 1 # 2 stores 3D coordinates as flat _x/_y/_z columns
+    # Rolling segments: the session becomes a directory of files closed atomically, 0/0 keeps one file
+    segment_s: NonNegativeFloat = 0 # Roll after this many seconds (checked at each flush)
+    segment_rows: NonNegativeInt = 0 # Roll after this many rows
+    # Journal: record into an Arrow IPC stream, compacted to the Parquet file at close (or next startup after a crash)
+    journal: bool = False
+    compaction_rows: PositiveInt = 65_536 # Rows per row group of the compacted file
+    writer: ParquetWriterConfig = Field(default_factory=ParquetWriterConfig)
+    inbox: SinkInboxConfig = Field(default_factory=lambda: SinkInboxConfig(policy=OverflowPolicy.BLOCK))
 
     @model_validator(mode='after')
     def validate_buffer_sizes(self) -> "ParquetSinkConfig":
         if self.queue_size <= self.max_buffer_size:
-            raise ValueError('Queue must be bigger than buffer.')
+            raise ValueError('Queue must hold more samples than one flush (max_buffer_size).')
+        if self.journal and (self.segment_s or self.segment_rows):
+            raise ValueError('Journal and rolling segments are alternatives, enable only one.')
         return self
     
 class NatsSinkConfig(BaseModel):
     enabled: bool = True
     subject: str = "intent.gaze"
+    use_smoothed: bool = True # Publish the "one_euro" stage output when it runs, Parquet always keeps raw
+    inbox: SinkInboxConfig = Field(default_factory=lambda: SinkInboxConfig(capacity=120 * 5)) # Stale gaze is useless live
+
+class EngineConfig(BaseModel):
+    """Event loop of the `AsyncioEngine` thread (hot path, NATS client, to_thread I/O)."""
+    loop: Literal["asyncio", "uvloop"] = "asyncio" # "uvloop" falls back to asyncio when not installed
+    isolate: bool = False # Runs the manager, controller and pipeline in a child process, away from the UI's GIL
+    status_interval_ms: PositiveFloat = 50.0 # Shared-memory status refresh period when isolated
+
+class MetricsConfig(BaseModel):
+    """Prometheus text endpoint served from the engine loop."""
+    enabled: bool = False
+    host: str = "127.0.0.1" # Localhost only, there is no authentication
+    port: int = Field(9464, ge=1, le=65535)
+    loop_lag_interval_s: PositiveFloat = 0.25 # Event-loop lag probe period
 
 class AppSettings(BaseSettings):
     """
@@ -48,13 +184,24 @@ class AppSettings(BaseSettings):
     data_dir: Path = Field(default=Path("./data"), description="Path to directory where local data is stored.")
     nats_host: str = "nats://localhost:4222"
 
+    # Engine
+    engine: EngineConfig = Field(default_factory=EngineConfig)
+
     # Hardware
     display_area: DisplayAreaSettings = Field(default_factory=DisplayAreaSettings)
+    source: SourceConfig = Field(default_factory=SourceConfig)
+
+    # Pipeline
+    runner: RunnerConfig = Field(default_factory=RunnerConfig)
+    processing: ProcessingConfig = Field(default_factory=ProcessingConfig)
 
     # Sinks
     parquet: ParquetSinkConfig = Field(default_factory=ParquetSinkConfig)
     nats: NatsSinkConfig = Field(default_factory=NatsSinkConfig)
 
+    # Monitoring
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
+
     # Logging
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     __version__: str = version("gaze-capture")
@@ -7,7 +7,7 @@ import logging
 from typing import Final, Callable, Optional
 
 from ..acquisition import GazeSource
-from ..configs import DisplayAreaSettings
+from ..configs import DisplayAreaSettings, SourceConfig
 from ..core.protocols import CalibrationView
 
 logger = logging.getLogger(__name__)
@@ -52,7 +52,7 @@ class GazeTrackerController(ABC):
         return asyncio.get_running_loop()
 
     @abstractmethod
-    def create_source(self) -> GazeSource:
+    def create_source(self, cfg: SourceConfig) -> GazeSource:
         """Factory: Returns a fresh GazeSource for a recording session."""
         ...
 
@@ -5,8 +5,8 @@ from datetime import datetime, timezone
 import json
 
 from .base import GazeTrackerController
-from ..acquisition import DummySource
-from ..configs import DisplayAreaSettings
+from ..acquisition import DummySource, GazeSource, ReplaySource
+from ..configs import DisplayAreaSettings, SourceConfig
 from ..core.protocols import CalibrationView
 
 logger = logging.getLogger(__name__)
@@ -31,8 +31,10 @@ class DummyController(GazeTrackerController):
         self._connected = True
         return True
 
-    def create_source(self) -> DummySource:
-        return DummySource(self.screen_width, self.screen_height)
+    def create_source(self, cfg: SourceConfig) -> GazeSource:
+        if cfg.replay_path is not None:
+            return ReplaySource(cfg.replay_path, self.screen_width, self.screen_height, speed=cfg.replay_speed, cfg=cfg)
+        return DummySource(self.screen_width, self.screen_height, frequency=cfg.dummy_frequency, cfg=cfg)
 
     async def load_calibration(self, folder: Path) -> bool:
         self._calibrated = (folder / "calibration.bin").exists()
@@ -9,7 +9,7 @@ import tobii_research as tr
 
 from .base import GazeTrackerController, require_tracker
 from ..acquisition import TobiiSource
-from ..configs import DisplayAreaSettings
+from ..configs import DisplayAreaSettings, SourceConfig
 from ..core.protocols import CalibrationView
 
 logger = logging.getLogger(__name__)
@@ -88,8 +88,8 @@ class TobiiController(GazeTrackerController):
         if self._on_connection_restored is not None:
             self._on_connection_restored()
 
-    def create_source(self) -> TobiiSource:
-        return TobiiSource(self.tracker, self.screen_width, self.screen_height)
+    def create_source(self, cfg: SourceConfig) -> TobiiSource:
+        return TobiiSource(self.tracker, self.screen_width, self.screen_height, cfg)
 
     @require_tracker
     async def load_calibration(self, folder: Path) -> bool:
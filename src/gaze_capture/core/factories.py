@@ -3,7 +3,8 @@ from typing import List
 import nats
 
 from ..configs import AppSettings
-from ..sinks import GazeSink, ParquetSink, NATSSink
+from ..processing import GazeStage, IVTClassifier, OneEuroSmoother
+from ..sinks import GazeSink, ParquetSink, JournalSink, NATSSink
 
 def create_sinks(
     settings: AppSettings,
@@ -21,21 +22,74 @@ def create_sinks(
             sinks.append(
                 NATSSink(
                     nc=nc,
-                    subject=settings.nats.subject
+                    subject=settings.nats.subject,
+                    use_smoothed=settings.nats.use_smoothed,
+                    inbox=settings.nats.inbox,
                 )
             )
         else:
             ValueError("NATS sink not created, no `nc` NATS instance passed to factory.")
 
     # Parquet
-    if settings.parquet.enabled:
+    if settings.parquet.enabled and settings.parquet.journal:
+        sinks.append(
+            JournalSink(
+                output_dir=output_dir or settings.data_dir,
+                drop_when_full=settings.parquet.drop_when_full,
+                max_buffer_size=settings.parquet.max_buffer_size,
+                queue_size=settings.parquet.queue_size,
+                inbox=settings.parquet.inbox,
+                schema_version=settings.parquet.schema_version,
+                compaction_rows=settings.parquet.compaction_rows,
+                writer=settings.parquet.writer,
+            )
+        )
+    elif settings.parquet.enabled:
         sinks.append(
             ParquetSink(
                 output_dir=output_dir or settings.data_dir,
                 drop_when_full=settings.parquet.drop_when_full,
                 max_buffer_size=settings.parquet.max_buffer_size,
-                queue_size=settings.parquet.queue_size
+                queue_size=settings.parquet.queue_size,
+                inbox=settings.parquet.inbox,
+                schema_version=settings.parquet.schema_version,
+                segment_s=settings.parquet.segment_s,
+                segment_rows=settings.parquet.segment_rows,
+                writer=settings.parquet.writer,
             )
         )
 
-    return sinks
\ No newline at end of file
+    return sinks
+
+def create_stages(
+    settings: AppSettings,
+    output_dir: Path | None = None,
+    nc: nats.NATS | None = None
+) -> List[GazeStage]:
+    """
+    Creates fresh processing stages for a new recording session, in configured order.
+    """
+    stages = []
+
+    for name in settings.processing.stages:
+        if name == "ivt":
+            stages.append(
+                IVTClassifier(
+                    cfg=settings.processing.ivt,
+                    display=settings.display_area,
+                    output_dir=output_dir or settings.data_dir,
+                    nc=nc if settings.nats.enabled else None,
+                )
+            )
+        elif name == "one_euro":
+            stages.append(
+                OneEuroSmoother(
+                    cfg=settings.processing.one_euro,
+                    screen_width=settings.display_area.width_px,
+                    screen_height=settings.display_area.height_px,
+                )
+            )
+        else:
+            raise ValueError(f"Unknown processing stage: {name!r}")
+
+    return stages
\ No newline at end of file
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+from ..models import GazeBatch
+from ..sinks import GazeSink
+from ..utils.logging import ThrottledLogger
+from ..utils.queues import SampleQueue
+from ..utils.tracing import LatencyTracer
+from ..utils.types import _END
+
+logger = logging.getLogger(__name__)
+
+class SinkChannel:
+    """
+    Bounded inbox plus consumer task in front of one sink.
+
+    The runner only ever calls `offer` (never blocks, overflow is resolved by the
+    inbox policy), so a stalled sink delays nothing but its own backlog.
+    """
+    def __init__(self, sink: GazeSink, name: str | None = None) -> None:
+        cfg = sink.inbox
+        self.sink = sink
+        self.name = name or type(sink).__name__
+        self.drain_timeout_s = cfg.drain_timeout_ms / 1_000
+        self.inbox = SampleQueue(cfg.capacity, cfg.policy, cfg.block_timeout_ms / 1_000)
+
+        self._task: asyncio.Task | None = None
+        self._send_started: float | None = None
+        self._in_flight = 0
+        self._error_logger = ThrottledLogger(logger, interval_sec=1)
+        self.tracer: LatencyTracer | None = None
+
+        # Stats
+        self.delivered = 0
+        self.errors = 0
+        self.sends = 0
+        self.send_time_total_s = 0.0
+        self.send_time_max_s = 0.0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._consume(), name=f"sink:{self.name}")
+
+    def offer(self, item: GazeBatch) -> None:
+        self.inbox.put_nowait(item)
+
+    async def close(self) -> None:
+        """Delivers the backlog (bounded by the drain timeout), the sink itself is not closed."""
+        if self._task is None:
+            return
+
+        self.inbox.put_nowait(_END)
+        done, _ = await asyncio.wait([self._task], timeout=self.drain_timeout_s or None)
+        if not done:
+            logger.warning(f"Sink {self.name} did not drain within {self.drain_timeout_s:.1f}s, discarding {self.inbox.depth:,} samples.")
+            self.inbox.dropped += self.inbox.depth + self._in_flight
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _consume(self) -> None:
+        """Hands the sink everything that piled up while it was busy as one batch."""
+        inbox, sink = self.inbox, self.sink
+
+        ended = False
+        while not ended:
+            item = await inbox.get()
+            if item is _END:
+                break
+
+            items = [item]
+            while not inbox.empty():
+                item = inbox.get_nowait()
+                if item is _END:
+                    ended = True
+                    break
+                items.append(item)
+
+            batch = GazeBatch.merge(items)
+            self._in_flight = n = len(batch)
+            self._send_started = t0 = time.perf_counter()
+            try:
+                await sink.send_batch(batch)
+                self.delivered += n
+                if self.tracer is not None:
+                    self.tracer.record(f"sink:{self.name}", batch)
+            except Exception as e:
+                self.errors += 1
+                self._error_logger.warning(f"Sink {self.name} failed: {e}")
+            finally:
+                self._send_started = None
+                self._in_flight = 0
+
+            dt = time.perf_counter() - t0
+            self.sends += 1
+            self.send_time_total_s += dt
+            if dt > self.send_time_max_s:
+                self.send_time_max_s = dt
+
+    def stats(self) -> dict[str, Any]:
+        started = self._send_started
+        return {
+            "inbox": self.inbox.stats(),
+            "backlog": self.inbox.depth,
+            "delivered": self.delivered,
+            "errors": self.errors,
+            "send_ms_mean": 1_000 * self.send_time_total_s / self.sends if self.sends else None,
+            "send_ms_max": 1_000 * self.send_time_max_s,
+            # How long the sink has been stuck in the current send, if any
+            "stalled_ms": 1_000 * (time.perf_counter() - started) if started is not None else 0.0,
+            "sink": self.sink.stats(),
+        }
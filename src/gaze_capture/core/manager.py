@@ -1,13 +1,16 @@
 import asyncio
 import logging
-from typing import Callable
+from datetime import datetime, timezone
+from typing import Any, Callable
 from pathlib import Path
 import nats
 
 from .runner import GazeRunner
-from .factories import create_sinks
+from .watchdog import Health
+from .factories import create_sinks, create_stages
 from ..controllers import GazeTrackerController
 from ..configs import AppSettings, DisplayAreaSettings
+from ..sinks import GazeSink
 from ..core.protocols import CalibrationView
 from .state import AppState
 
@@ -42,6 +45,8 @@ class EyeTrackingManager:
         self._listeners: list[Callable[[AppState], None]] = []
         self._auto_resume: bool = auto_resume
         self._runner: GazeRunner | None = None
+        self._runner_started_at: datetime | None = None
+        self._recording_stats: list[dict[str, Any]] = []
 
         self._current_recording_path: str | None = None
         self.is_calibrated: bool = False
@@ -88,6 +93,11 @@ class EyeTrackingManager:
     def is_recording(self) -> bool:
         return self._runner is not None
 
+    @property
+    def runner(self) -> GazeRunner | None:
+        """The active runner, None when not recording."""
+        return self._runner
+
     async def load_calibration(self, target_folder: Path) -> bool:
         self.is_calibrated = await self.controller.load_calibration(target_folder)
         return self.is_calibrated
@@ -112,10 +122,15 @@ class EyeTrackingManager:
 
         try:
             self._runner = GazeRunner(
-                source=self.controller.create_source(),
-                sinks=create_sinks(self.settings, self._current_recording_path, self.nc)
+                source=self.controller.create_source(self.settings.source),
+                sinks=create_sinks(self.settings, self._current_recording_path, self.nc),
+                cfg=self.settings.runner,
+                stages=create_stages(self.settings, self._current_recording_path, self.nc),
+                on_health=self._on_runner_health,
+                on_end=self._on_source_end,
             )
             await self._runner.start()
+            self._runner_started_at = datetime.now(timezone.utc)
             self._set_state(AppState.RECORDING)
             return True
 
@@ -124,17 +139,81 @@ class EyeTrackingManager:
             await self.stop_recording()
             return False
         
+    def _on_runner_health(self, health: Health, reasons: list[str]) -> None:
+        """Watchdog transitions while recording map onto the app state."""
+        if self._runner is None:
+            return
+        self._set_state({
+            Health.OK: AppState.RECORDING,
+            Health.DEGRADED: AppState.DEGRADED,
+            Health.STALLED: AppState.STALLED,
+        }[health])
+
+    def _on_source_end(self) -> None:
+        """The source ran out (a replay reached its end), the session ends like a user stop."""
+        if self._runner is None:
+            return
+        logger.info("GazeManager: Source ended, stopping recording.")
+        self.loop.create_task(self.stop_recording())
+
+    async def _stop_runner(self) -> None:
+        """Stops the active runner and keeps its counters for the session metadata."""
+        await self._runner.stop()
+
+        stats = {
+            "start": self._runner_started_at.isoformat() if self._runner_started_at else None,
+            "end": datetime.now(timezone.utc).isoformat(),
+            **self._runner.stats(),
+        }
+        self._recording_stats.append(stats)
+        logger.info("Recording stats: %s", stats)
+
+        self._runner = None
+        self._runner_started_at = None
+
+    async def attach_sink(self, sink: GazeSink, name: str | None = None, backfill_ms: float = 0.0) -> str | None:
+        """
+        Adds a sink (e.g. a live preview) to the running recording, optionally backfilled
+        with recent samples. Returns its name, None when not recording.
+        Attached sinks last until the runner stops, a tracker-loss resume recreates only the configured ones.
+        """
+        if self._runner is None:
+            return None
+        return await self._runner.attach_sink(sink, name, backfill_ms)
+
+    async def detach_sink(self, name: str) -> bool:
+        """Removes a sink from the running recording after delivering its backlog."""
+        if self._runner is None:
+            return False
+        try:
+            await self._runner.detach_sink(name)
+            return True
+        except KeyError:
+            logger.warning(f"No sink named {name!r} to detach.")
+            return False
+
+    def runner_stats(self) -> dict[str, Any] | None:
+        """Live counters of the active runner, None when not recording."""
+        return self._runner.stats() if self._runner is not None else None
+
+    async def fetch_runner_stats(self) -> dict[str, Any] | None:
+        """`runner_stats` for callers on the engine loop (remote in `ProcessManager`)."""
+        return self.runner_stats()
+
+    def pop_recording_stats(self) -> list[dict[str, Any]]:
+        """Returns the counters of every runner stopped since the last call."""
+        stats, self._recording_stats = self._recording_stats, []
+        return stats
+
     async def _suspend_recording(self):
         if self._runner is not None:
-            await self._runner.stop()
-            self._runner = None
+            await self._stop_runner()
         
         self._set_state(AppState.TRACKER_LOST)
 
     async def stop_recording(self):
         if self._runner is not None:
-            await self._runner.stop()
-            self._runner = None
+            await self._stop_runner()
             self._current_recording_path = None
 
             self._set_state(AppState.IDLE)
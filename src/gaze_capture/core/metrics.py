@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Sequence
+
+import nats
+
+from .manager import EyeTrackingManager
+from .state import AppState
+from .watchdog import Health
+from ..configs import MetricsConfig
+
+logger = logging.getLogger(__name__)
+
+# Sink-specific counters (`GazeSink.stats()`) exposed per sink: key -> (metric, type, help)
+_SINK_METRICS: dict[str, tuple[str, str, str]] = {
+    "rows_written": ("gaze_sink_rows_written_total", "counter", "Rows persisted by the sink."),
+    "published": ("gaze_sink_published_total", "counter", "Messages published by the sink."),
+    "dropped": ("gaze_sink_internal_dropped_total", "counter", "Samples dropped inside the sink (queue full, write failed, NATS offline or buffer full)."),
+    "queue_depth": ("gaze_sink_internal_queue_depth", "gauge", "Samples waiting in the sink's own queue."),
+    "flush_s_max": ("gaze_sink_flush_max_seconds", "gauge", "Slowest flush of the session."),
+}
+
+class _Exposition:
+    """Collects samples per metric family and renders the Prometheus text format (0.0.4)."""
+    def __init__(self) -> None:
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def add(self, name: str, kind: str, help: str, value: Any, suffix: str = "", **labels: Any) -> None:
+        if value is None:
+            return
+        family = self._families.setdefault(name, (kind, help, []))
+        label_str = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+        family[2].append(f"{name}{suffix}{{{label_str}}} {_number(value)}" if label_str else f"{name}{suffix} {_number(value)}")
+
+    def render(self) -> str:
+        lines = []
+        for name, (kind, help, samples) in self._families.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+class MetricsServer:
+    """
+    Lightweight `GET /metrics` endpoint in the Prometheus text format.
+
+    Runs on the engine loop and reads the counters the pipeline keeps anyway
+    when a scrape arrives, so between scrapes it only costs the event-loop lag
+    probe. Bind it to localhost, there is no authentication.
+    `services` are duck-typed: `name`, `current_state` and optionally `heartbeat_age_s`.
+    """
+    _READ_TIMEOUT_S = 5.0
+
+    def __init__(
+        self,
+        cfg: MetricsConfig,
+        manager: EyeTrackingManager,
+        nc: nats.NATS | None = None,
+        services: Sequence[Any] = (),
+    ) -> None:
+        self.cfg = cfg
+        self.manager = manager
+        self.nc = nc
+        self.services = services
+
+        self._server: asyncio.Server | None = None
+        self._lag_task: asyncio.Task | None = None
+
+        # Event-loop lag, the max is reset by every scrape
+        self._lag_s = 0.0
+        self._lag_max_s = 0.0
+        self._scrapes = 0
+
+    async def start(self) -> bool:
+        try:
+            self._server = await asyncio.start_server(self._handle, self.cfg.host, self.cfg.port)
+        except OSError as e:
+            logger.error(f"Metrics endpoint unavailable on {self.cfg.host}:{self.cfg.port}: {e}")
+            return False
+
+        self._lag_task = asyncio.create_task(self._probe_loop_lag(), name="loop-lag-probe")
+        logger.info(f"Metrics served at http://{self.cfg.host}:{self.cfg.port}/metrics")
+        return True
+
+    async def stop(self) -> None:
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            await asyncio.gather(self._lag_task, return_exceptions=True)
+            self._lag_task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _probe_loop_lag(self) -> None:
+        """Oversleep of a periodic timer, i.e. how long ready callbacks wait for the loop."""
+        interval = self.cfg.loop_lag_interval_s
+        while True:
+            t0 = time.perf_counter()
+            await asyncio.sleep(interval)
+            self._lag_s = max(time.perf_counter() - t0 - interval, 0.0)
+            if self._lag_s > self._lag_max_s:
+                self._lag_max_s = self._lag_s
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self._READ_TIMEOUT_S)
+            method, _, rest = head.partition(b" ")
+            path = rest.split(b" ", 1)[0].split(b"?", 1)[0]
+
+            if method != b"GET":
+                status, body = "405 Method Not Allowed", b"Method not allowed\n"
+            elif path not in (b"/", b"/metrics"):
+                status, body = "404 Not Found", b"Not found\n"
+            else:
+                status, body = "200 OK", (await self.render()).encode()
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"Metrics request failed: {e}")
+        finally:
+            writer.close()
+
+    async def render(self) -> str:
+        """Snapshot of every metric, in the Prometheus text format."""
+        m = _Exposition()
+        self._scrapes += 1
+
+        # Application
+        state = self.manager.current_state
+        for s in AppState:
+            m.add("gaze_app_state", "gauge", "Current application state (1 for the active one).", int(s is state), state=s.name)
+        m.add("gaze_recording", "gauge", "Whether the recording pipeline is running.", int(self.manager.is_recording))
+
+        # Event loop
+        m.add("gaze_event_loop_lag_seconds", "gauge", "Latest oversleep of the engine loop's lag probe.", self._lag_s)
+        m.add("gaze_event_loop_lag_max_seconds", "gauge", "Worst engine loop lag since the previous scrape.", self._lag_max_s)
+        self._lag_max_s = self._lag_s
+
+        try:
+            stats = await self.manager.fetch_runner_stats()
+        except Exception as e:
+            logger.warning(f"Runner stats unavailable for this scrape: {e}")
+            stats = None
+        if stats is not None:
+            self._add_runner(m, stats)
+
+        if self.nc is not None:
+            self._add_nats(m, self.nc)
+
+        # Services
+        for service in self.services:
+            name = service.name
+            m.add("gaze_service_up", "gauge", "Whether the service is available (READY or RECORDING).", int(service.current_state.name != "UNAVAILABLE"), service=name)
+            m.add("gaze_service_heartbeat_age_seconds", "gauge", "Time since the service's last heartbeat.", getattr(service, "heartbeat_age_s", None), service=name)
+
+        m.add("gaze_metrics_scrapes_total", "counter", "Scrapes served by this endpoint.", self._scrapes)
+        return m.render()
+
+    def _add_runner(self, m: _Exposition, stats: dict[str, Any]) -> None:
+        # Source
+        queue = stats["source"]["queue"]
+        m.add("gaze_source_samples_total", "counter", "Samples admitted into the source queue.", queue["enqueued"])
+        m.add("gaze_source_dropped_total", "counter", "Samples dropped by the source queue's overflow policy.", queue["dropped"])
+        m.add("gaze_source_queue_depth", "gauge", "Samples waiting in the source queue.", queue["depth"])
+        m.add("gaze_source_queue_capacity", "gauge", "Capacity of the source queue (0 = unbounded).", queue["capacity"])
+        m.add("gaze_runner_batches_total", "counter", "Batches processed by the runner loop.", stats["batches"]["count"])
+
+        # Sinks
+        for name, sink in stats["sinks"].items():
+            inbox = sink["inbox"]
+            m.add("gaze_sink_samples_in_total", "counter", "Samples admitted into the sink inbox.", inbox["enqueued"], sink=name)
+            m.add("gaze_sink_samples_out_total", "counter", "Samples handed to the sink.", sink["delivered"], sink=name)
+            m.add("gaze_sink_dropped_total", "counter", "Samples dropped by the sink inbox's overflow policy.", inbox["dropped"], sink=name)
+            m.add("gaze_sink_queue_depth", "gauge", "Samples waiting in the sink inbox.", sink["backlog"], sink=name)
+            m.add("gaze_sink_errors_total", "counter", "Failed sends.", sink["errors"], sink=name)
+            m.add("gaze_sink_stalled_seconds", "gauge", "Time spent in the current send, 0 when idle.", sink["stalled_ms"] / 1_000, sink=name)
+
+            own = sink["sink"]
+            for key, (metric, kind, help) in _SINK_METRICS.items():
+                m.add(metric, kind, help, own.get(key), sink=name)
+            if "flushes" in own:
+                help = "Time spent flushing buffered rows to storage."
+                m.add("gaze_sink_flush_seconds", "summary", help, own["flush_s_total"], suffix="_sum", sink=name)
+                m.add("gaze_sink_flush_seconds", "summary", help, own["flushes"], suffix="_count", sink=name)
+
+        # Health and latency
+        if stats["watchdog"] is not None:
+            m.add("gaze_pipeline_health", "gauge", "Watchdog health (0 = OK, 1 = DEGRADED, 2 = STALLED).", Health[stats["watchdog"]["health"]].value)
+
+        for checkpoint, hist in (stats["latency"] or {}).items():
+            help = "Sample age at each pipeline checkpoint, since the tracker stamped it."
+            for q, key in ((0.5, "p50_ms"), (0.9, "p90_ms"), (0.99, "p99_ms"), (0.999, "p999_ms")):
+                if hist[key] is not None:
+                    m.add("gaze_sample_age_seconds", "summary", help, hist[key] / 1_000, checkpoint=checkpoint, quantile=q)
+            if hist["mean_ms"] is not None:
+                m.add("gaze_sample_age_seconds", "summary", help, hist["mean_ms"] * hist["count"] / 1_000, suffix="_sum", checkpoint=checkpoint)
+            m.add("gaze_sample_age_seconds", "summary", help, hist["count"], suffix="_count", checkpoint=checkpoint)
+
+    def _add_nats(self, m: _Exposition, nc: nats.NATS) -> None:
+        client = nc.stats
+        m.add("gaze_nats_connected", "gauge", "Whether the NATS client is connected.", int(nc.is_connected))
+        m.add("gaze_nats_out_msgs_total", "counter", "Messages published by the NATS client.", client["out_msgs"])
+        m.add("gaze_nats_out_bytes_total", "counter", "Bytes published by the NATS client.", client["out_bytes"])
+        m.add("gaze_nats_in_msgs_total", "counter", "Messages received by the NATS client.", client["in_msgs"])
+        m.add("gaze_nats_reconnects_total", "counter", "NATS reconnections.", client["reconnects"])
+        m.add("gaze_nats_pending_bytes", "gauge", "Bytes in the NATS client's outbound buffer.", nc.pending_data_size)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _number(value: Any) -> str:
+    if isinstance(value, bool) or isinstance(value, int):
+        return str(int(value))
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
@@ -0,0 +1,540 @@
+import asyncio
+import concurrent.futures
+import itertools
+import logging
+import multiprocessing
+import struct
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Final
+
+import nats
+
+from .manager import EyeTrackingManager
+from .protocols import CalibrationView
+from .state import AppState
+from .watchdog import Health
+from ..configs import AppSettings, DisplayAreaSettings
+from ..utils.engine import start_engine
+
+logger = logging.getLogger(__name__)
+
+NatsConnect = Callable[[str], Awaitable[nats.NATS]]
+
+@dataclass(frozen=True, slots=True)
+class EngineStatus:
+    """What the UI polls, without a round trip to the engine process."""
+    state: AppState = AppState.INITIALIZING
+    is_recording: bool = False
+    is_calibrated: bool = False
+    health: Health = Health.OK
+    updated_ns: int = 0 # time.monotonic_ns() of the write, system-wide
+    samples: int = 0 # Admitted into the source queue this session
+    dropped: int = 0
+    queue_depth: int = 0
+    rate_hz: float = 0.0
+
+class StatusBlock:
+    """
+    Fixed-layout `EngineStatus` record in shared memory.
+
+    One writer (the engine process), any number of readers. The leading
+    sequence counter is odd while a write is in progress, readers retry
+    torn reads instead of taking a lock.
+    """
+    _SEQ: Final[struct.Struct] = struct.Struct("<Q")
+    _BODY: Final[struct.Struct] = struct.Struct("<iBBBxqqqqd")
+
+    def __init__(self, shm: SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        self.name = shm.name
+
+    @classmethod
+    def create(cls) -> "StatusBlock":
+        block = cls(SharedMemory(create=True, size=cls._SEQ.size + cls._BODY.size), owner=True)
+        block.write(EngineStatus())
+        return block
+
+    @classmethod
+    def attach(cls, name: str) -> "StatusBlock":
+        return cls(SharedMemory(name=name), owner=False)
+
+    def write(self, status: EngineStatus) -> None:
+        buf = self._shm.buf
+        seq = self._SEQ.unpack_from(buf)[0] + 1
+        self._SEQ.pack_into(buf, 0, seq) # Odd: write in progress
+        self._BODY.pack_into(
+            buf, self._SEQ.size,
+            status.state.value, status.is_recording, status.is_calibrated, status.health.value,
+            status.updated_ns, status.samples, status.dropped, status.queue_depth, status.rate_hz,
+        )
+        self._SEQ.pack_into(buf, 0, seq + 1)
+
+    def read(self) -> EngineStatus:
+        buf = self._shm.buf
+        while True:
+            before = self._SEQ.unpack_from(buf)[0]
+            body = self._BODY.unpack_from(buf, self._SEQ.size)
+            if before % 2 == 0 and self._SEQ.unpack_from(buf)[0] == before:
+                break
+            time.sleep(0)
+
+        state, recording, calibrated, health, updated_ns, samples, dropped, depth, rate_hz = body
+        return EngineStatus(
+            AppState(state), bool(recording), bool(calibrated), Health(health),
+            updated_ns, samples, dropped, depth, rate_hz,
+        )
+
+    def close(self) -> None:
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+class _ViewRef:
+    """Stands in for a `CalibrationView` of the UI process in pickled call arguments."""
+    def __init__(self, view_id: int) -> None:
+        self.view_id = view_id
+
+class ProcessManager:
+    """
+    Stand-in for `EyeTrackingManager` that keeps the real manager, the
+    controller and every `GazeRunner` in a child process, so Tk work in the UI
+    process no longer competes with the pipeline for the GIL.
+
+    Calls go over a pipe and are awaited like the manager's own coroutines.
+    Calibration views stay in the UI process; the engine calls back into them
+    over the same pipe. State and counters are read from a `StatusBlock`, so
+    UI polling never crosses the process boundary.
+    """
+    _SYNC_TIMEOUT_S: Final[float] = 5.0
+    _JOIN_TIMEOUT_S: Final[float] = 10.0
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        loop: asyncio.AbstractEventLoop,
+        nats_connect: NatsConnect | None = None,
+    ) -> None:
+        self.settings = settings
+        self.loop = loop
+        self.data_dir = settings.data_dir
+        self.controller = RemoteController(self)
+
+        self._status = StatusBlock.create()
+        self._listeners: list[Callable[[AppState], None]] = []
+        self._last_state = AppState.INITIALIZING
+        self._snapshot: dict[str, Any] = {} # Controller attributes, refreshed by every reply
+
+        # RPC bookkeeping, shared with the receiver thread
+        self._ids = itertools.count()
+        self._pending: dict[int, concurrent.futures.Future] = {}
+        self._views: weakref.WeakValueDictionary[int, CalibrationView] = weakref.WeakValueDictionary()
+        self._send_lock = threading.Lock()
+
+        # Spawn: the tracker SDK and the event loop must not be inherited via fork
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=run_engine_process,
+            args=(child_conn, self._status.name, settings, nats_connect),
+            name="GazeEngine",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        logger.info(f"Engine process started (pid {self._process.pid}).")
+
+        threading.Thread(target=self._receive, name="GazeEngineReceiver", daemon=True).start()
+
+    # --- State (shared memory) ---
+
+    @property
+    def status(self) -> EngineStatus:
+        return self._status.read()
+
+    @property
+    def current_state(self) -> AppState:
+        return self._status.read().state
+
+    @property
+    def is_recording(self) -> bool:
+        return self._status.read().is_recording
+
+    @property
+    def is_calibrated(self) -> bool:
+        return self._status.read().is_calibrated
+
+    def add_state_listener(self, listener: Callable[[AppState], None]):
+        self._listeners.append(listener)
+        listener(self.current_state)
+
+    # --- Manager API (pipe) ---
+
+    async def connect(self, display_settings: DisplayAreaSettings) -> bool:
+        return await self._call("manager", "connect", display_settings)
+
+    async def load_calibration(self, target_folder: Path) -> bool:
+        return await self._call("manager", "load_calibration", target_folder)
+
+    async def run_calibration(self, save_folder: Path, view: CalibrationView) -> bool:
+        return await self._call("manager", "run_calibration", save_folder, view)
+
+    async def start_recording(self, sub_dir: str | None = None) -> bool:
+        return await self._call("manager", "start_recording", sub_dir)
+
+    async def stop_recording(self):
+        await self._call("manager", "stop_recording")
+
+    def pop_recording_stats(self) -> list[dict[str, Any]]:
+        return self._request("manager", "pop_recording_stats").result(self._SYNC_TIMEOUT_S)
+
+    def runner_stats(self) -> dict[str, Any] | None:
+        return self._request("manager", "runner_stats").result(self._SYNC_TIMEOUT_S)
+
+    async def fetch_runner_stats(self) -> dict[str, Any] | None:
+        """Awaits the pipe round trip instead of blocking, for callers on the engine loop."""
+        return await asyncio.wait_for(self._call("manager", "runner_stats"), self._SYNC_TIMEOUT_S)
+
+    def run_task(self, coro):
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        future.add_done_callback(lambda fut: fut.exception() if fut.exception() else None)
+        return future
+
+    def shutdown(self):
+        """Stops the engine process (it shuts the controller down) and releases the status block."""
+        try:
+            with self._send_lock:
+                self._conn.send(("shutdown",))
+        except OSError:
+            pass # Already gone
+
+        self._process.join(self._JOIN_TIMEOUT_S)
+        if self._process.is_alive():
+            logger.error("Engine process did not exit, terminating it.")
+            self._process.terminate()
+            self._process.join()
+
+        self._conn.close()
+        self._status.close()
+        logger.info(f"Engine process exited ({self._process.exitcode}).")
+
+    # --- RPC ---
+
+    def _request(self, target: str, method: str, *args: Any) -> concurrent.futures.Future:
+        call_id = next(self._ids)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._pending[call_id] = future
+
+        refs = []
+        for arg in args:
+            if isinstance(arg, CalibrationView):
+                view_id = next(self._ids)
+                self._views[view_id] = arg
+                arg = _ViewRef(view_id)
+            refs.append(arg)
+
+        try:
+            with self._send_lock:
+                self._conn.send(("call", call_id, target, method, tuple(refs)))
+        except OSError as e:
+            self._pending.pop(call_id, None)
+            future.set_exception(RuntimeError(f"Engine process unavailable: {e}"))
+        return future
+
+    async def _call(self, target: str, method: str, *args: Any) -> Any:
+        return await asyncio.wrap_future(self._request(target, method, *args), loop=self.loop)
+
+    def _receive(self) -> None:
+        """Receiver thread: resolves replies and runs the engine's view calls on the engine loop."""
+        while True:
+            try:
+                msg = self._conn.recv()
+            except (EOFError, OSError):
+                break
+
+            if msg[0] == "reply":
+                _, call_id, ok, value, snapshot = msg
+                self._snapshot = snapshot
+                future = self._pending.pop(call_id, None)
+                if future is None:
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+            elif msg[0] == "state":
+                # Every transition is pushed, listeners run on the engine loop like the manager's
+                state = AppState(msg[1])
+                if state is self._last_state:
+                    continue
+                self._last_state = state
+                for listener in self._listeners:
+                    self.loop.call_soon_threadsafe(listener, state)
+
+            elif msg[0] == "view":
+                _, call_id, view_id, method, args = msg
+                view = self._views.get(view_id)
+                if view is None:
+                    self._send_reply(call_id, False, RuntimeError("Calibration view is gone"))
+                    continue
+                future = asyncio.run_coroutine_threadsafe(getattr(view, method)(*args), self.loop)
+                future.add_done_callback(partial(self._on_view_done, call_id))
+
+        # Pipe closed: the engine exited or crashed
+        for future in list(self._pending.values()):
+            future.set_exception(RuntimeError("Engine process exited"))
+        self._pending.clear()
+        if self._process.exitcode not in (None, 0):
+            logger.error(f"Engine process died (exit code {self._process.exitcode}).")
+
+    def _on_view_done(self, call_id: int, future: concurrent.futures.Future) -> None:
+        try:
+            self._send_reply(call_id, True, future.result())
+        except Exception as e:
+            self._send_reply(call_id, False, e)
+
+    def _send_reply(self, call_id: int, ok: bool, value: Any) -> None:
+        try:
+            with self._send_lock:
+                self._conn.send(("reply", call_id, ok, value))
+        except OSError:
+            pass
+
+class RemoteController:
+    """
+    Controller facade of `ProcessManager`. Attributes come from the snapshot
+    the engine attaches to every reply, methods are forwarded.
+    """
+    def __init__(self, manager: ProcessManager) -> None:
+        self._manager = manager
+
+    @property
+    def tracker_name(self) -> str | None:
+        return self._manager._snapshot.get("tracker_name")
+
+    @property
+    def is_connected(self) -> bool:
+        return self._manager._snapshot.get("is_connected", False)
+
+    @property
+    def last_calibration_path(self) -> Path | None:
+        return self._manager._snapshot.get("last_calibration_path")
+
+    @property
+    def last_display_settings(self) -> DisplayAreaSettings | None:
+        return self._manager._snapshot.get("last_display_settings")
+
+    async def apply_display_settings(self, cfg: DisplayAreaSettings) -> bool:
+        return await self._manager._call("controller", "apply_display_settings", cfg)
+
+    async def show_calibration_results(self, folder: Path, view: CalibrationView) -> bool:
+        return await self._manager._call("controller", "show_calibration_results", folder, view)
+
+class RemoteView(CalibrationView):
+    """Engine-side proxy of a `CalibrationView` that lives in the UI process."""
+    def __init__(self, bridge: "_EngineBridge", view_id: int) -> None:
+        self._bridge = bridge
+        self._view_id = view_id
+
+    async def open(self, *args: Any) -> None:
+        await self._bridge.call_view(self._view_id, "open", args)
+
+    async def show_point(self, x: float, y: float) -> None:
+        await self._bridge.call_view(self._view_id, "show_point", (x, y))
+
+    async def show_message(self, text: str) -> None:
+        await self._bridge.call_view(self._view_id, "show_message", (text,))
+
+    async def show_results(self, result_dict: dict) -> None:
+        await self._bridge.call_view(self._view_id, "show_results", (result_dict,))
+
+    async def close(self) -> None:
+        await self._bridge.call_view(self._view_id, "close", ())
+
+class _EngineBridge:
+    """
+    Engine side of the pipe: serves calls on the engine loop and publishes the
+    status block. Every status write happens on the engine loop (single writer).
+    """
+    def __init__(self, conn: Connection, manager: EyeTrackingManager, status: StatusBlock, interval_s: float) -> None:
+        self.conn = conn
+        self.manager = manager
+        self.loop = manager.loop
+        self.status = status
+        self.interval_s = interval_s
+
+        self._ids = itertools.count()
+        self._pending: dict[int, concurrent.futures.Future] = {}
+        self._send_lock = threading.Lock()
+
+        self._publisher: asyncio.Task | None = None
+        self._closed = False
+
+        # Rate over the last status period
+        self._last_samples = 0
+        self._last_ns = time.monotonic_ns()
+
+    async def start(self) -> None:
+        self.manager.add_state_listener(self._on_state_changed)
+        self._publisher = asyncio.create_task(self._publish_periodically(), name="status-publisher")
+
+    async def close(self) -> None:
+        """Stops any recording (never leave one half-written) and publishes the final status."""
+        await self.manager.stop_recording()
+        if self._publisher is not None:
+            self._publisher.cancel()
+            await asyncio.gather(self._publisher, return_exceptions=True)
+        self.publish_status()
+        self._closed = True
+
+    def serve(self) -> None:
+        """Blocking receive loop, until shutdown or the UI process goes away."""
+        while True:
+            try:
+                msg = self.conn.recv()
+            except (EOFError, OSError):
+                logger.warning("UI process went away, shutting down the engine.")
+                break
+
+            if msg[0] == "call":
+                _, call_id, target, method, args = msg
+                future = asyncio.run_coroutine_threadsafe(self._dispatch(target, method, args), self.loop)
+                future.add_done_callback(partial(self._on_call_done, call_id))
+
+            elif msg[0] == "reply":
+                _, call_id, ok, value = msg
+                future = self._pending.pop(call_id, None)
+                if future is None:
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+            elif msg[0] == "shutdown":
+                break
+
+    async def _dispatch(self, target: str, method: str, args: tuple) -> Any:
+        obj = self.manager if target == "manager" else self.manager.controller
+        args = [RemoteView(self, a.view_id) if isinstance(a, _ViewRef) else a for a in args]
+        result = getattr(obj, method)(*args)
+        if asyncio.iscoroutine(result):
+            result = await result
+        self.publish_status() # Calls change state, don't wait for the next period
+        return result
+
+    def _on_call_done(self, call_id: int, future: concurrent.futures.Future) -> None:
+        try:
+            msg = ("reply", call_id, True, future.result(), self._snapshot())
+        except BaseException as e: # Includes cancellation, the caller always gets an answer
+            msg = ("reply", call_id, False, e, self._snapshot())
+
+        try:
+            with self._send_lock:
+                self.conn.send(msg)
+        except OSError:
+            pass
+        except Exception as e:
+            # Unpicklable result or exception, the caller still needs an answer
+            with self._send_lock:
+                self.conn.send(("reply", call_id, False, RuntimeError(f"{type(e).__name__}: {e}"), self._snapshot()))
+
+    async def call_view(self, view_id: int, method: str, args: tuple) -> Any:
+        call_id = next(self._ids)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._pending[call_id] = future
+        with self._send_lock:
+            self.conn.send(("view", call_id, view_id, method, args))
+        return await asyncio.wrap_future(future)
+
+    def _snapshot(self) -> dict[str, Any]:
+        controller = self.manager.controller
+        try:
+            tracker_name = controller.tracker_name if controller.is_connected else None
+        except Exception:
+            tracker_name = None
+        return {
+            "tracker_name": tracker_name,
+            "is_connected": controller.is_connected,
+            "last_calibration_path": controller.last_calibration_path,
+            "last_display_settings": controller.last_display_settings,
+        }
+
+    def _on_state_changed(self, state: AppState) -> None:
+        self.publish_status()
+        try:
+            with self._send_lock:
+                self.conn.send(("state", state.value))
+        except OSError:
+            pass
+
+    def publish_status(self) -> None:
+        if self._closed:
+            return
+
+        manager = self.manager
+        runner = manager.runner
+        now_ns = time.monotonic_ns()
+
+        samples = dropped = depth = 0
+        rate_hz = 0.0
+        health = Health.OK
+        if runner is not None:
+            queue = runner.source.output_queue
+            samples, dropped, depth = queue.enqueued, queue.dropped, queue.depth
+            if samples >= self._last_samples and now_ns > self._last_ns:
+                rate_hz = (samples - self._last_samples) * 1e9 / (now_ns - self._last_ns)
+            if runner.watchdog is not None:
+                health = runner.watchdog.health
+
+        self._last_samples, self._last_ns = samples, now_ns
+        self.status.write(EngineStatus(
+            manager.current_state, manager.is_recording, manager.is_calibrated, health,
+            now_ns, samples, dropped, depth, rate_hz,
+        ))
+
+    async def _publish_periodically(self) -> None:
+        while True:
+            self.publish_status()
+            await asyncio.sleep(self.interval_s)
+
+def run_engine_process(
+    conn: Connection,
+    status_name: str,
+    settings: AppSettings,
+    nats_connect: NatsConnect | None,
+) -> None:
+    """Engine process entry point: finds the tracker itself and serves the UI until shutdown."""
+    from ..controllers import DummyController, TobiiController
+
+    logging.basicConfig(level=settings.logging.level, format=settings.logging.format)
+    logging.getLogger("nats").setLevel(logging.ERROR)
+
+    loop = start_engine(settings.engine)
+    nc = asyncio.run_coroutine_threadsafe(nats_connect(settings.nats_host), loop).result() if nats_connect else None
+
+    controller = TobiiController() if not settings.use_dummy_mode else DummyController()
+    manager = EyeTrackingManager(controller, settings, loop, nc)
+
+    status = StatusBlock.attach(status_name)
+    bridge = _EngineBridge(conn, manager, status, settings.engine.status_interval_ms / 1_000)
+    asyncio.run_coroutine_threadsafe(bridge.start(), loop).result()
+
+    try:
+        bridge.serve()
+    finally:
+        asyncio.run_coroutine_threadsafe(bridge.close(), loop).result()
+        manager.shutdown()
+        if nc is not None:
+            asyncio.run_coroutine_threadsafe(nc.drain(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        status.close()
+        conn.close()
@@ -1,25 +1,74 @@
 import asyncio
 import logging
-from typing import Sequence
+import time
+from collections import deque
+from typing import Any, Callable, Sequence
 
+import numpy as np
+
+from .fanout import SinkChannel
+from .watchdog import Health, Watchdog
 from ..acquisition import GazeSource
+from ..configs import RunnerConfig
+from ..models import GazeBatch
+from ..processing import GazeStage, Pipeline
 from ..sinks import GazeSink
+from ..utils.queues import sample_count
+from ..utils.tracing import LatencyTracer
 from ..utils.types import _END
 
 logger = logging.getLogger(__name__)
 
 class GazeRunner:
     """
-    Orchestrates the 120Hz data flow from Source -> Sinks.
+    Orchestrates the 120Hz data flow from Source -> Stages -> Sinks.
+    Each sink sits behind its own `SinkChannel`, so sinks never wait on each other.
+    Sinks can be attached and detached while running, see `attach_sink`.
+    When the source ends on its own (a finished replay), the watchdog stops
+    and `on_end` is called, the owner is expected to `stop` the runner.
     Created fresh for every recording session.
     """
-    def __init__(self, source: GazeSource, sinks: Sequence[GazeSink]):
+    def __init__(
+        self,
+        source: GazeSource,
+        sinks: Sequence[GazeSink],
+        cfg: RunnerConfig | None = None,
+        stages: Sequence[GazeStage] = (),
+        on_health: Callable[[Health, list[str]], None] | None = None,
+        on_end: Callable[[], None] | None = None,
+    ):
         self.source = source
-        self.sinks = sinks
+        self.sinks = list(sinks)
+        self.cfg = cfg or RunnerConfig()
+        self.pipeline = Pipeline(stages)
+        self.on_end = on_end
+        self.channels = [SinkChannel(s, name) for s, name in zip(sinks, _unique_names(sinks))]
+        self.watchdog = (
+            Watchdog(source, self.channels, self.cfg.watchdog, on_health)
+            if self.cfg.watchdog.enabled else None
+        )
+
+        # Latency tracing needs the clock the tracker stamps samples with
+        self.tracer: LatencyTracer | None = None
+        if self.cfg.tracing.enabled and source.now_us is not None:
+            self.tracer = LatencyTracer(source.now_us)
+            for target in (source, *self.channels, *sinks):
+                target.tracer = self.tracer
+        self._trace_log_task: asyncio.Task | None = None
         self._running = False
         self._loop_task: asyncio.Task | None = None
         self._source_task: asyncio.Task | None = None
 
+        # Processed batches of the last `history_ms`, to backfill attached sinks
+        self._history: deque[GazeBatch] = deque()
+        self._history_us = int(self.cfg.history_ms * 1_000)
+        self._detached: dict[str, dict[str, Any]] = {}
+
+        # Stats
+        self._batches = 0
+        self._rows = 0
+        self._max_batch_rows = 0
+
     async def start(self) -> None:
         if self._running:
             return
@@ -27,14 +76,22 @@ class GazeRunner:
         logger.info("Starting GazeRunner...")
         self._running = True
 
-        # Start sinks
+        # Start sinks, then stages (stages may publish through sinks' connections)
         await asyncio.gather(*(s.start() for s in self.sinks))
+        for channel in self.channels:
+            channel.start()
+        await self.pipeline.start()
         
         # Start source
         self._source_task = asyncio.create_task(self.source.run())
         
         # Start data loop
         self._loop_task = asyncio.create_task(self._process_loop())
+
+        if self.watchdog is not None:
+            self.watchdog.start()
+        if self.tracer is not None and self.cfg.tracing.log_interval_s > 0:
+            self._trace_log_task = asyncio.create_task(self._log_latency())
         logger.info("GazeRunner active.")
 
     async def stop(self) -> None:
@@ -43,6 +100,13 @@ class GazeRunner:
             
         logger.info("Stopping GazeRunner...")
         self._running = False
+
+        # A deliberate stop is not a stall
+        if self.watchdog is not None:
+            await self.watchdog.stop()
+        if self._trace_log_task is not None:
+            self._trace_log_task.cancel()
+            await asyncio.gather(self._trace_log_task, return_exceptions=True)
         
         # Stop source
         await self.source.stop()
@@ -53,23 +117,161 @@ class GazeRunner:
         if self._loop_task:
             await self._loop_task
         
-        # Close sinks
+        # Flush stages, drain inboxes, then close sinks
+        await self.pipeline.close()
+        await asyncio.gather(*(c.close() for c in self.channels))
         await asyncio.gather(*(s.close() for s in self.sinks))
         
         logger.info("GazeRunner stopped.")
 
+    def stats(self) -> dict[str, Any]:
+        """Session counters, safe to call while running or after stop."""
+        return {
+            "source": self.source.stats(),
+            "batches": {
+                "count": self._batches,
+                "rows_mean": self._rows / self._batches if self._batches else None,
+                "rows_max": self._max_batch_rows,
+            },
+            "stages": self.pipeline.stats(),
+            "sinks": {**self._detached, **{c.name: c.stats() for c in self.channels}},
+            "watchdog": self.watchdog.stats() if self.watchdog is not None else None,
+            "latency": self.tracer.stats() if self.tracer is not None else None,
+        }
+
+    async def attach_sink(self, sink: GazeSink, name: str | None = None, backfill_ms: float = 0.0) -> str:
+        """
+        Starts `sink` and fans out to it from the next batch on, without pausing acquisition.
+        With `backfill_ms` > 0 it first receives up to that much recent history
+        (bounded by `history_ms`). Returns the sink's unique name.
+        """
+        if not self._running:
+            raise RuntimeError("GazeRunner is not running.")
+
+        names = {c.name for c in self.channels} | self._detached.keys()
+        base = name or type(sink).__name__
+        name = base if base not in names else next(f"{base}#{i}" for i in range(1, len(names) + 2) if f"{base}#{i}" not in names)
+
+        await sink.start()
+        channel = SinkChannel(sink, name)
+        if self.tracer is not None:
+            sink.tracer = channel.tracer = self.tracer
+        channel.start()
+
+        # No await from here on: the backfill ends exactly where live batches begin
+        backfill = self._backfill(backfill_ms) if backfill_ms > 0 else None
+        if backfill is not None:
+            channel.offer(backfill)
+        self.channels.append(channel)
+        self.sinks.append(sink)
+
+        logger.info(f"Sink {name} attached (backfill: {len(backfill) if backfill is not None else 0:,} samples).")
+        return name
+
+    async def detach_sink(self, name: str) -> None:
+        """Stops fanning out to sink `name`, delivers its backlog and closes it. Its stats are kept."""
+        channel = next((c for c in self.channels if c.name == name), None)
+        if channel is None:
+            raise KeyError(f"No sink named {name!r}")
+
+        self.channels.remove(channel)
+        self.sinks.remove(channel.sink)
+        await channel.close()
+        await channel.sink.close()
+
+        self._detached[name] = {**channel.stats(), "detached": True}
+        logger.info(f"Sink {name} detached.")
+
+    def _remember(self, batch: GazeBatch) -> None:
+        history = self._history
+        history.append(batch)
+        newest = int(batch.system_timestamp_us[-1])
+        while newest - int(history[0].system_timestamp_us[-1]) > self._history_us:
+            history.popleft()
+
+    def _backfill(self, backfill_ms: float) -> GazeBatch | None:
+        """The last `backfill_ms` of processed samples, as one batch."""
+        if not self._history:
+            return None
+        cutoff = int(self._history[-1].system_timestamp_us[-1] - backfill_ms * 1_000)
+        batches = [b for b in self._history if b.system_timestamp_us[-1] >= cutoff]
+        batch = GazeBatch.concat(batches)
+        return batch.slice(int(np.argmax(batch.system_timestamp_us >= cutoff)), len(batch))
+
+    async def _log_latency(self) -> None:
+        while True:
+            await asyncio.sleep(self.cfg.tracing.log_interval_s)
+            self.tracer.log_interval()
+
     async def _process_loop(self) -> None:
-        """Hot loop."""
+        """Hot loop. Drains everything queued into one batch per iteration."""
         queue = self.source.output_queue
+        channels = self.channels
+        pipeline = self.pipeline
+        tracer = self.tracer
+        max_rows = self.cfg.batch_max_rows
+        budget_s = self.cfg.batch_budget_ms / 1_000
+        keep_history = self._history_us > 0
 
         try:
-            while True:
+            ended = False
+            while not ended:
                 item = await queue.get()
-
                 if item is _END:
                     break
 
-                await asyncio.gather(*(s.send(item) for s in self.sinks))
+                # Greedy drain, bounded by rows and time spent collecting
+                items = [item]
+                rows = sample_count(item)
+                deadline = time.perf_counter() + budget_s
+                while rows < max_rows and not queue.empty() and time.perf_counter() < deadline:
+                    item = queue.get_nowait()
+                    if item is _END:
+                        ended = True
+                        break
+                    items.append(item)
+                    rows += sample_count(item)
+
+                batch = items[0] if len(items) == 1 and isinstance(items[0], GazeBatch) else GazeBatch.merge(items)
+                if tracer is not None:
+                    tracer.record("dequeue", batch)
+                if pipeline:
+                    batch = await pipeline.process(batch)
+                    if tracer is not None:
+                        tracer.record("processed", batch)
+
+                for channel in channels:
+                    channel.offer(batch)
+                if keep_history and len(batch):
+                    self._remember(batch)
+
+                self._batches += 1
+                self._rows += rows
+                if rows > self._max_batch_rows:
+                    self._max_batch_rows = rows
+
+                # get() does not suspend while items are queued, let the sink consumers run
+                await asyncio.sleep(0)
 
         except asyncio.CancelledError:
-            logger.info("Runner loop cancelled unexpectedly.")
\ No newline at end of file
+            logger.info("Runner loop cancelled unexpectedly.")
+            return
+
+        if self._running:
+            await self._source_ended()
+
+    async def _source_ended(self) -> None:
+        """End of stream without `stop`: nothing more will arrive, which is not a stall."""
+        logger.info("Source ended, waiting for the runner to be stopped.")
+        if self.watchdog is not None:
+            await self.watchdog.stop()
+        if self.on_end is not None:
+            try:
+                self.on_end()
+            except Exception as e:
+                logger.error(f"End-of-stream listener failed: {e}")
+
+def _unique_names(sinks: Sequence[GazeSink]) -> list[str]:
+    """Sink class names, suffixed with an index when a class appears more than once."""
+    names = [type(s).__name__ for s in sinks]
+    return [f"{n}#{i}" if names.count(n) > 1 else n for i, n in enumerate(names)]
\ No newline at end of file
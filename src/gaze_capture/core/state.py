@@ -13,4 +13,9 @@ class AppState(Enum):
     IDLE = auto() # Tracker found, ready for calibration or recording.
     CALIBRATING = auto() # The calibration window is active.
     RECORDING = auto() # The data pipeline is active and recording data.
-    TRACKER_LOST = auto() # Eye tracker failed during recording
\ No newline at end of file
+    DEGRADED = auto() # Recording, but below the sample-rate SLO or a sink lags behind.
+    STALLED = auto() # Recording, but no samples arrive or a sink stopped making progress.
+    TRACKER_LOST = auto() # Eye tracker failed during recording
+
+# States in which the recording pipeline is running
+RECORDING_STATES: frozenset[AppState] = frozenset({AppState.RECORDING, AppState.DEGRADED, AppState.STALLED})
\ No newline at end of file
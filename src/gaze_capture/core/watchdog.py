@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, Callable, Sequence
+
+from .fanout import SinkChannel
+from ..acquisition import GazeSource
+from ..configs import WatchdogConfig
+
+logger = logging.getLogger(__name__)
+
+class Health(IntEnum):
+    """Pipeline health, ordered by severity."""
+    OK = 0
+    DEGRADED = 1 # Data flows, but below the rate SLO or a sink lags behind
+    STALLED = 2 # No samples from the source, or a sink makes no progress
+
+class Watchdog:
+    """
+    Periodically checks the running pipeline against sample-rate and lag SLOs.
+
+    Reads counters the pipeline keeps anyway (source queue admissions, sink
+    inbox depth and deliveries), so a check is a handful of attribute reads.
+    `on_change(health, reasons)` is called on every health transition.
+    """
+    def __init__(
+        self,
+        source: GazeSource,
+        channels: Sequence[SinkChannel],
+        cfg: WatchdogConfig,
+        on_change: Callable[[Health, list[str]], None] | None = None,
+    ) -> None:
+        self.source = source
+        self.channels = channels
+        self.cfg = cfg
+        self.on_change = on_change
+
+        self.health = Health.OK
+        self.reasons: list[str] = []
+        self._task: asyncio.Task | None = None
+
+        # Progress tracking: (time, samples admitted) history and last change per sink
+        now = time.monotonic()
+        self._arrivals: deque[tuple[float, int]] = deque()
+        self._synced = False # Source SLOs start once `time_sync_ready` is set (device startup can take seconds)
+        self._last_arrival = now
+        self._last_enqueued = 0
+        self._sink_progress = {c: (0, now) for c in channels} # Channels may be attached mid-recording
+
+        # Stats
+        self._checks = 0
+        self._check_total_s = 0.0
+        self._check_max_s = 0.0
+        self._transitions = 0
+        self._since = now
+        self._time_in: dict[Health, float] = {h: 0.0 for h in Health}
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="watchdog")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.cfg.interval_s)
+
+            t0 = time.perf_counter()
+            health, reasons = self.check(time.monotonic())
+            dt = time.perf_counter() - t0
+
+            self._checks += 1
+            self._check_total_s += dt
+            if dt > self._check_max_s:
+                self._check_max_s = dt
+
+            self._update(health, reasons)
+
+    def check(self, now: float) -> tuple[Health, list[str]]:
+        """Evaluates every SLO at `now`, returns the worst health and why."""
+        cfg = self.cfg
+        health, reasons = Health.OK, []
+
+        def flag(level: Health, reason: str) -> None:
+            nonlocal health
+            health = max(health, level)
+            reasons.append(reason)
+
+        # Source: any samples at all, then rate over the window, both timed from time sync
+        queue = self.source.output_queue
+        if not self._synced and self.source.time_sync_ready.is_set():
+            self._synced = True
+            self._last_enqueued, self._last_arrival = queue.enqueued, now
+            self._arrivals.clear()
+        if queue.enqueued != self._last_enqueued:
+            self._last_enqueued, self._last_arrival = queue.enqueued, now
+        elif self._synced and now - self._last_arrival > cfg.stall_timeout_s:
+            flag(Health.STALLED, f"no samples for {now - self._last_arrival:.1f}s")
+
+        arrivals = self._arrivals
+        arrivals.append((now, queue.enqueued))
+        while len(arrivals) > 1 and now - arrivals[1][0] >= cfg.rate_window_s:
+            arrivals.popleft()
+
+        rate_hz = None
+        t_first, n_first = arrivals[0]
+        if now - t_first >= cfg.rate_window_s:
+            rate_hz = (queue.enqueued - n_first) / (now - t_first)
+            expected = self.source.expected_hz
+            if expected and self._synced and rate_hz < cfg.min_rate_ratio * expected:
+                flag(Health.DEGRADED, f"rate {rate_hz:.0f} Hz < {cfg.min_rate_ratio:.0%} of {expected:.0f} Hz")
+
+        # Backlogs are converted to time at the nominal (or observed) rate, an estimate: samples
+        # are counted, not aged, so a burst after a gap reads older than it is
+        nominal_hz = self.source.expected_hz or rate_hz
+        per_sample_ms = 1_000 / nominal_hz if nominal_hz else None
+        if per_sample_ms is not None and queue.depth * per_sample_ms > cfg.max_sink_lag_ms:
+            flag(Health.DEGRADED, f"runner lag {queue.depth * per_sample_ms:.0f} ms")
+
+        # Sinks: progress while they have a backlog, and backlog age (inbox plus the sink's own queue)
+        if len(self._sink_progress) > len(self.channels):
+            self._sink_progress = {c: p for c, p in self._sink_progress.items() if c in self.channels}
+        for channel in self.channels:
+            backlog = channel.inbox.depth
+            delivered, last_change = self._sink_progress.get(channel, (-1, now))
+            if channel.delivered != delivered or backlog == 0:
+                self._sink_progress[channel] = (channel.delivered, now)
+            elif now - last_change > cfg.stall_timeout_s:
+                flag(Health.STALLED, f"sink {channel.name} stuck for {now - last_change:.1f}s")
+                continue
+
+            lag_ms = (backlog + channel.sink.backlog) * per_sample_ms if per_sample_ms is not None else 0.0
+            if lag_ms > cfg.max_sink_lag_ms:
+                flag(Health.DEGRADED, f"sink {channel.name} lag {lag_ms:.0f} ms")
+
+        return health, reasons
+
+    def _update(self, health: Health, reasons: list[str]) -> None:
+        self.reasons = reasons
+        if health is self.health:
+            return
+
+        now = time.monotonic()
+        self._time_in[self.health] += now - self._since
+        self._since = now
+        self._transitions += 1
+
+        log = logger.info if health is Health.OK else logger.warning
+        log(f"Pipeline {self.health.name} -> {health.name}{': ' + '; '.join(reasons) if reasons else ''}")
+        self.health = health
+
+        if self.on_change is not None:
+            try:
+                self.on_change(health, reasons)
+            except Exception as e:
+                logger.error(f"Watchdog listener failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        time_in = dict(self._time_in)
+        time_in[self.health] += time.monotonic() - self._since
+        return {
+            "health": self.health.name,
+            "reasons": self.reasons,
+            "transitions": self._transitions,
+            "time_in_s": {h.name: round(t, 3) for h, t in time_in.items()},
+            "checks": self._checks,
+            "check_us_mean": 1e6 * self._check_total_s / self._checks if self._checks else None,
+            "check_us_max": 1e6 * self._check_max_s,
+        }
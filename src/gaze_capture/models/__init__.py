@@ -1 +1,2 @@
-from .gaze import GazeData
\ No newline at end of file
+from .gaze import GazeData
+from .batch import GazeBatch
\ No newline at end of file
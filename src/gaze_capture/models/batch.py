@@ -0,0 +1,173 @@
+from dataclasses import dataclass, field, fields, replace
+from typing import ClassVar, Iterator, Sequence
+
+import numpy as np
+
+from .gaze import GazeData
+
+_VEC3_FIELDS: tuple[str, ...] = ("left_3d_mm", "right_3d_mm", "left_origin_mm", "right_origin_mm")
+_FLOAT_FIELDS: tuple[str, ...] = (
+    "gaze_x_norm", "gaze_y_norm",
+    "left_x_norm", "left_y_norm", "right_x_norm", "right_y_norm",
+    "left_pupil_mm", "right_pupil_mm",
+)
+
+@dataclass(frozen=True, slots=True)
+class GazeBatch:
+    """
+    Columnar (struct-of-arrays) block of gaze frames.
+    Missing floats are NaN, missing pixels are flagged by `gaze_px_valid`
+    and missing 3D vectors are rows of NaN in the (n, 3) arrays.
+    """
+    # Timestamps (int64)
+    timestamp_ms: np.ndarray
+    device_timestamp_us: np.ndarray
+    system_timestamp_us: np.ndarray
+
+    # Calculated Midpoint (int32 pixels + validity, float64 normalized)
+    gaze_x_px: np.ndarray
+    gaze_y_px: np.ndarray
+    gaze_px_valid: np.ndarray
+    gaze_x_norm: np.ndarray
+    gaze_y_norm: np.ndarray
+
+    # Raw Sensor Data (float64)
+    left_x_norm: np.ndarray
+    left_y_norm: np.ndarray
+    right_x_norm: np.ndarray
+    right_y_norm: np.ndarray
+    left_pupil_mm: np.ndarray
+    right_pupil_mm: np.ndarray
+
+    # 3D Position and Origin, shape (n, 3) float64
+    left_3d_mm: np.ndarray
+    right_3d_mm: np.ndarray
+    left_origin_mm: np.ndarray
+    right_origin_mm: np.ndarray
+
+    # Derived per-row columns added by processing stages, keyed by name
+    extras: dict[str, np.ndarray] = field(default_factory=dict, compare=False)
+
+    COLUMNS: ClassVar[tuple[str, ...]]
+
+    def __len__(self) -> int:
+        return len(self.timestamp_ms)
+
+    @classmethod
+    def empty(cls, size: int = 0) -> "GazeBatch":
+        """Allocates a batch with every value missing, ready to be filled in place."""
+        ints = {name: np.zeros(size, dtype=np.int64) for name in ("timestamp_ms", "device_timestamp_us", "system_timestamp_us")}
+        floats = {name: np.full(size, np.nan) for name in _FLOAT_FIELDS}
+        vecs = {name: np.full((size, 3), np.nan) for name in _VEC3_FIELDS}
+        return cls(
+            **ints,
+            gaze_x_px=np.zeros(size, dtype=np.int32),
+            gaze_y_px=np.zeros(size, dtype=np.int32),
+            gaze_px_valid=np.zeros(size, dtype=bool),
+            **floats,
+            **vecs,
+        )
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[GazeData]) -> "GazeBatch":
+        """Packs per-row `GazeData` objects into columns."""
+        batch = cls.empty(len(samples))
+        if not samples:
+            return batch
+
+        for name in ("timestamp_ms", "device_timestamp_us", "system_timestamp_us"):
+            getattr(batch, name)[:] = [getattr(s, name) for s in samples]
+
+        for name in _FLOAT_FIELDS:
+            getattr(batch, name)[:] = [np.nan if (v := getattr(s, name)) is None else v for s in samples]
+
+        for name in _VEC3_FIELDS:
+            col = getattr(batch, name)
+            for i, s in enumerate(samples):
+                if (v := getattr(s, name)) is not None:
+                    col[i] = v
+
+        batch.gaze_px_valid[:] = [s.gaze_x_px is not None and s.gaze_y_px is not None for s in samples]
+        batch.gaze_x_px[:] = [s.gaze_x_px or 0 for s in samples]
+        batch.gaze_y_px[:] = [s.gaze_y_px or 0 for s in samples]
+        return batch
+
+    @classmethod
+    def concat(cls, batches: Sequence["GazeBatch"]) -> "GazeBatch":
+        if len(batches) == 1:
+            return batches[0]
+        # Derived columns survive only if every batch carries them
+        shared = set.intersection(*(set(b.extras) for b in batches))
+        return cls(
+            **{name: np.concatenate([getattr(b, name) for b in batches]) for name in cls.COLUMNS},
+            extras={name: np.concatenate([b.extras[name] for b in batches]) for name in shared},
+        )
+
+    @classmethod
+    def merge(cls, items: Sequence["GazeData | GazeBatch"]) -> "GazeBatch":
+        """Merges frames and batches in order, packing runs of single frames together."""
+        batches: list[GazeBatch] = []
+        frames: list[GazeData] = []
+        for item in items:
+            if isinstance(item, GazeBatch):
+                if frames:
+                    batches.append(cls.from_samples(frames))
+                    frames = []
+                batches.append(item)
+            else:
+                frames.append(item)
+        if frames:
+            batches.append(cls.from_samples(frames))
+        return cls.concat(batches) if batches else cls.empty()
+
+    def slice(self, start: int, stop: int) -> "GazeBatch":
+        """Zero-copy view over rows [start, stop)."""
+        return type(self)(
+            **{name: getattr(self, name)[start:stop] for name in self.COLUMNS},
+            extras={name: col[start:stop] for name, col in self.extras.items()},
+        )
+
+    def with_extras(self, **columns: np.ndarray) -> "GazeBatch":
+        """Same rows (arrays are shared) with derived columns added or replaced."""
+        return replace(self, extras={**self.extras, **columns})
+
+    def row(self, i: int) -> GazeData:
+        return self.slice(i, i + 1).rows()[0]
+
+    def rows(self) -> list[GazeData]:
+        """Per-row `GazeData` view, kept for consumers that are not batch-aware."""
+        valid = self.gaze_px_valid.tolist()
+        x_px = [x if v else None for x, v in zip(self.gaze_x_px.tolist(), valid)]
+        y_px = [y if v else None for y, v in zip(self.gaze_y_px.tolist(), valid)]
+        floats = {name: _nan_to_none(getattr(self, name).tolist()) for name in _FLOAT_FIELDS}
+        vecs = {name: _vec3_to_tuples(getattr(self, name)) for name in _VEC3_FIELDS}
+
+        return [
+            GazeData(
+                timestamp_ms=ts,
+                device_timestamp_us=dev,
+                system_timestamp_us=sys,
+                gaze_x_px=x_px[i],
+                gaze_y_px=y_px[i],
+                **{name: col[i] for name, col in floats.items()},
+                **{name: col[i] for name, col in vecs.items()},
+            )
+            for i, (ts, dev, sys) in enumerate(zip(
+                self.timestamp_ms.tolist(),
+                self.device_timestamp_us.tolist(),
+                self.system_timestamp_us.tolist(),
+            ))
+        ]
+
+    def __iter__(self) -> Iterator[GazeData]:
+        return iter(self.rows())
+
+GazeBatch.COLUMNS = tuple(f.name for f in fields(GazeBatch) if f.name != "extras")
+
+def _nan_to_none(values: list[float]) -> list[float | None]:
+    # NaN is the only float not equal to itself
+    return [v if v == v else None for v in values]
+
+def _vec3_to_tuples(values: np.ndarray) -> list[tuple[float, float, float] | None]:
+    missing = np.isnan(values[:, 0]).tolist()
+    return [None if m else tuple(v) for v, m in zip(values.tolist(), missing)]
@@ -0,0 +1,4 @@
+from .base import GazeStage
+from .pipeline import Pipeline
+from .ivt import IVTClassifier
+from .smoothing import OneEuroSmoother
\ No newline at end of file
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from ..models import GazeBatch
+
+class GazeStage(ABC):
+    """
+    Abstract Base Class for processing stages between source and sinks.
+    A stage receives every batch in order and returns the batch handed to the
+    next stage, usually the same rows with derived columns in `extras`.
+    """
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    async def start(self) -> None:
+        """Initialize stage resources."""
+        pass
+
+    @abstractmethod
+    async def process(self, batch: GazeBatch) -> GazeBatch:
+        """
+        Transform one batch. Runs on the runner's hot loop,
+        heavy work should be vectorized or offloaded.
+        """
+        pass
+
+    async def close(self) -> None:
+        """Flush state and clean up stage resources."""
+        pass
+
+    def stats(self) -> dict:
+        """Stage specific counters, merged into the pipeline stats."""
+        return {}
@@ -0,0 +1,253 @@
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Final, Optional
+
+import nats
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .base import GazeStage
+from ..configs import DisplayAreaSettings, IVTConfig
+from ..models import GazeBatch
+
+logger = logging.getLogger(__name__)
+
+# Per-sample labels (extras["ivt_class"])
+FIXATION: Final[int] = 0
+SACCADE: Final[int] = 1
+BLINK: Final[int] = 2 # Gaze lost, both eyes invalid
+UNDEFINED: Final[int] = 3 # Gaze seen but no velocity yet (stream start, right after a blink, equal timestamps)
+
+class _Fixation:
+    __slots__ = ("start_ms", "start_us", "end_ms", "end_us", "sum_x", "sum_y", "n", "announced")
+
+    def __init__(self, start_ms: int, start_us: int) -> None:
+        self.start_ms, self.start_us = start_ms, start_us
+        self.end_ms, self.end_us = start_ms, start_us
+        self.sum_x = self.sum_y = 0.0
+        self.n = 0
+        self.announced = False
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_us - self.start_us) / 1_000
+
+class IVTClassifier(GazeStage):
+    """
+    Streaming I-VT classifier.
+
+    Angular velocity comes from the screen displacement of the midpoint gaze
+    (normalized -> mm) seen from the eyes' distance (3D origin z), over the
+    device clock and a short window to keep sensor noise below threshold.
+    Labels and velocity are added to the batch as extras, and fixations
+    lasting `min_fixation_ms` are published as compact start/end events and
+    appended to a sidecar parquet.
+    """
+    _SCHEMA: Final[pa.Schema] = pa.schema([
+        ("start_ms", pa.timestamp('ms')),
+        ("end_ms", pa.timestamp('ms')),
+        ("start_device_ts_us", pa.int64()),
+        ("end_device_ts_us", pa.int64()),
+        ("duration_ms", pa.float32()),
+        ("x_norm", pa.float32()),
+        ("y_norm", pa.float32()),
+        ("samples", pa.int32()),
+    ])
+    _FLUSH_ROWS: Final[int] = 256
+
+    def __init__(
+        self,
+        cfg: IVTConfig,
+        display: DisplayAreaSettings,
+        output_dir: Path | None = None,
+        nc: nats.NATS | None = None,
+    ) -> None:
+        self.cfg = cfg
+        self.nc = nc
+        self._screen_mm = np.array([display.width_mm, display.height_mm])
+
+        self.output_path = (
+            output_dir / f"fixations__{datetime.now(timezone.utc):%Y%m%d_%H%M%S}.parquet"
+            if output_dir is not None and cfg.sidecar else None
+        )
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._pending: list[dict[str, Any]] = []
+
+        # Streaming state carried across batches
+        self._tail = (np.zeros(0), np.zeros(0), np.zeros(0, dtype=np.int64)) # Last (x_mm, y_mm, device_us) samples
+        self._distance_mm = cfg.default_distance_mm
+        self._fix: _Fixation | None = None
+
+        # Stats
+        self._fixations = 0
+        self._published = 0
+        self._publish_errors = 0
+
+    async def start(self) -> None:
+        if self.output_path is not None:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    async def process(self, batch: GazeBatch) -> GazeBatch:
+        n = len(batch)
+        if n == 0:
+            return batch
+
+        labels, velocity = self._classify(batch)
+        await self._track_fixations(batch, labels)
+        return batch.with_extras(ivt_class=labels, ivt_velocity_deg_s=velocity)
+
+    def _classify(self, batch: GazeBatch) -> tuple[np.ndarray, np.ndarray]:
+        x = batch.gaze_x_norm * self._screen_mm[0]
+        y = batch.gaze_y_norm * self._screen_mm[1]
+        t = batch.device_timestamp_us
+
+        # Viewing distance: mean eye z, held over samples without head position
+        lz, rz = batch.left_origin_mm[:, 2], batch.right_origin_mm[:, 2]
+        z = np.where(np.isnan(lz), rz, np.where(np.isnan(rz), lz, (lz + rz) / 2))
+        z = _forward_fill(z, self._distance_mm)
+        self._distance_mm = float(z[-1])
+
+        # Differences over the velocity window, reaching back into the previous batch
+        hx, hy, ht = self._tail
+        h, n = len(ht), len(t)
+        xs, ys, ts = np.concatenate([hx, x]), np.concatenate([hy, y]), np.concatenate([ht, t])
+        k = self._window_samples(ts)
+        cur = np.arange(h, h + n)
+        ref = np.maximum(cur - k, 0)
+        self._tail = (xs[-k:], ys[-k:], ts[-k:])
+
+        dt_s = (ts[cur] - ts[ref]) / 1e6
+        with np.errstate(divide="ignore", invalid="ignore"):
+            angle = np.degrees(2 * np.arctan2(np.hypot(xs[cur] - xs[ref], ys[cur] - ys[ref]) / 2, z))
+            velocity = np.where(dt_s > 0, angle / dt_s, np.nan)
+
+        lost = np.isnan(x) | np.isnan(y)
+        labels = np.full(len(batch), FIXATION, dtype=np.int8)
+        labels[velocity > self.cfg.velocity_threshold_deg_s] = SACCADE
+        labels[np.isnan(velocity)] = UNDEFINED
+        labels[lost] = BLINK
+        return labels, velocity
+
+    def _window_samples(self, t: np.ndarray) -> int:
+        """Samples spanning the velocity window at the current rate (at least one)."""
+        if len(t) < 2 or self.cfg.velocity_window_ms <= 0:
+            return 1
+        period_us = float(np.median(np.diff(t)))
+        return max(1, int(round(self.cfg.velocity_window_ms * 1_000 / period_us))) if period_us > 0 else 1
+
+    async def _track_fixations(self, batch: GazeBatch, labels: np.ndarray) -> None:
+        """
+        Walks label runs (a handful per batch), not samples.
+        UNDEFINED runs neither open, extend nor end a fixation.
+        """
+        bounds = [0, *(np.flatnonzero(np.diff(labels)) + 1).tolist(), len(labels)]
+        ts_ms, dev_us = batch.timestamp_ms, batch.device_timestamp_us
+
+        for a, b in zip(bounds, bounds[1:]):
+            if labels[a] == UNDEFINED:
+                continue
+            if labels[a] != FIXATION:
+                await self._end_fixation()
+                continue
+
+            fix = self._fix
+            if fix is None:
+                fix = self._fix = _Fixation(int(ts_ms[a]), int(dev_us[a]))
+            fix.end_ms, fix.end_us = int(ts_ms[b - 1]), int(dev_us[b - 1])
+            fix.sum_x += float(batch.gaze_x_norm[a:b].sum())
+            fix.sum_y += float(batch.gaze_y_norm[a:b].sum())
+            fix.n += b - a
+
+            if not fix.announced and fix.duration_ms >= self.cfg.min_fixation_ms:
+                fix.announced = True
+                await self._publish({
+                    "type": "fixation_start",
+                    "timestamp_ms": fix.start_ms,
+                    "device_ts_us": fix.start_us,
+                    "x_norm": round(fix.sum_x / fix.n, 5),
+                    "y_norm": round(fix.sum_y / fix.n, 5),
+                })
+
+    async def _end_fixation(self) -> None:
+        fix, self._fix = self._fix, None
+        if fix is None or not fix.announced:
+            return
+
+        self._fixations += 1
+        x, y = fix.sum_x / fix.n, fix.sum_y / fix.n
+        await self._publish({
+            "type": "fixation_end",
+            "timestamp_ms": fix.end_ms,
+            "device_ts_us": fix.end_us,
+            "start_timestamp_ms": fix.start_ms,
+            "duration_ms": round(fix.duration_ms, 1),
+            "x_norm": round(x, 5),
+            "y_norm": round(y, 5),
+            "samples": fix.n,
+        })
+
+        if self.output_path is not None:
+            self._pending.append({
+                "start_ms": fix.start_ms,
+                "end_ms": fix.end_ms,
+                "start_device_ts_us": fix.start_us,
+                "end_device_ts_us": fix.end_us,
+                "duration_ms": fix.duration_ms,
+                "x_norm": x,
+                "y_norm": y,
+                "samples": fix.n,
+            })
+            if len(self._pending) >= self._FLUSH_ROWS:
+                await self._flush()
+
+    async def _publish(self, event: dict[str, Any]) -> None:
+        if self.nc is None or not self.nc.is_connected:
+            return
+        try:
+            await self.nc.publish(self.cfg.subject, json.dumps(event, separators=(",", ":")).encode())
+            self._published += 1
+        except Exception as e:
+            self._publish_errors += 1
+            logger.debug(f"Failed to publish fixation event: {e}")
+
+    async def _flush(self) -> None:
+        rows, self._pending = self._pending, []
+        if rows:
+            try:
+                await asyncio.to_thread(self._write_sync, rows)
+            except Exception as e:
+                logger.error(f"Fixation sidecar write failed: {e}")
+
+    def _write_sync(self, rows: list[dict[str, Any]]) -> None:
+        table = pa.Table.from_pylist(rows, schema=self._SCHEMA)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.output_path, schema=self._SCHEMA, compression="zstd")
+        self._writer.write_table(table)
+
+    async def close(self) -> None:
+        await self._end_fixation()
+        await self._flush()
+        if self._writer is not None:
+            await asyncio.to_thread(self._writer.close)
+            self._writer = None
+            logger.info(f"Fixations closed. Written: {self._fixations:,} to {self.output_path}")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "fixations": self._fixations,
+            "events_published": self._published,
+            "publish_errors": self._publish_errors,
+        }
+
+def _forward_fill(values: np.ndarray, initial: float) -> np.ndarray:
+    """Replaces NaN with the last finite value before it (or `initial`)."""
+    valid = np.isfinite(values)
+    if valid.all():
+        return values
+    idx = np.where(valid, np.arange(len(values)), -1)
+    np.maximum.accumulate(idx, out=idx)
+    return np.where(idx >= 0, values[np.maximum(idx, 0)], initial)
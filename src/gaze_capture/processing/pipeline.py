@@ -0,0 +1,83 @@
+import logging
+import time
+from typing import Any, Sequence
+
+from .base import GazeStage
+from ..models import GazeBatch
+from ..utils.logging import ThrottledLogger
+
+logger = logging.getLogger(__name__)
+
+class _StageTimer:
+    __slots__ = ("calls", "errors", "rows", "total_s", "max_s")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def add(self, rows: int, dt: float) -> None:
+        self.calls += 1
+        self.rows += rows
+        self.total_s += dt
+        if dt > self.max_s:
+            self.max_s = dt
+
+class Pipeline:
+    """
+    Ordered chain of `GazeStage`s with per-stage timing.
+    An empty pipeline passes batches through untouched, and a failing stage
+    passes its input on, so a processing bug never costs recorded data.
+    """
+    def __init__(self, stages: Sequence[GazeStage] = ()) -> None:
+        self.stages = list(stages)
+        self.names = _unique_names(self.stages)
+        self._timers = [_StageTimer() for _ in self.stages]
+        self._error_logger = ThrottledLogger(logger, interval_sec=1)
+
+    def __bool__(self) -> bool:
+        return bool(self.stages)
+
+    async def start(self) -> None:
+        for stage in self.stages:
+            await stage.start()
+
+    async def process(self, batch: GazeBatch) -> GazeBatch:
+        for stage, name, timer in zip(self.stages, self.names, self._timers):
+            t0 = time.perf_counter()
+            try:
+                batch = await stage.process(batch)
+            except Exception as e:
+                timer.errors += 1
+                self._error_logger.warning(f"Stage {name} failed, batch passed on unprocessed: {e}")
+            timer.add(len(batch), time.perf_counter() - t0)
+        return batch
+
+    async def close(self) -> None:
+        # Reverse order, later stages may still hold output of earlier ones
+        for stage, name in reversed(list(zip(self.stages, self.names))):
+            try:
+                await stage.close()
+            except Exception as e:
+                logger.error(f"Failed to close stage {name}: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            name: {
+                "calls": t.calls,
+                "errors": t.errors,
+                "rows": t.rows,
+                "ms_total": 1_000 * t.total_s,
+                "ms_max": 1_000 * t.max_s,
+                "us_per_row": 1e6 * t.total_s / t.rows if t.rows else None,
+                **stage.stats(),
+            }
+            for stage, name, t in zip(self.stages, self.names, self._timers)
+        }
+
+def _unique_names(stages: Sequence[GazeStage]) -> list[str]:
+    """Stage names, suffixed with an index when a name appears more than once (like the runner's sink names)."""
+    names = [s.name for s in stages]
+    return [f"{n}#{i}" if names.count(n) > 1 else n for i, n in enumerate(names)]
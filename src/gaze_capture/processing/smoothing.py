@@ -0,0 +1,98 @@
+import math
+from typing import Any
+
+import numpy as np
+
+from .base import GazeStage
+from ..acquisition.kernels import gaze_midpoint
+from ..configs import OneEuroConfig
+from ..models import GazeBatch
+
+class OneEuroSmoother(GazeStage):
+    """
+    One-Euro filter on each eye's normalized gaze, then the usual midpoint.
+
+    Adaptive low-pass: the cutoff rises with gaze speed, so fixations are
+    steadied while saccades pass with little lag. Each eye keeps its own state
+    and restarts from the raw value after a blink or a gap longer than
+    `reset_gap_ms`. The raw columns are untouched, results go to extras
+    (`smooth_x_norm`, `smooth_y_norm`, `smooth_x_px`, `smooth_y_px`, `smooth_px_valid`).
+    """
+    _EYES = (("left_x_norm", "left_y_norm"), ("right_x_norm", "right_y_norm"))
+
+    def __init__(self, cfg: OneEuroConfig, screen_width: int, screen_height: int) -> None:
+        self.cfg = cfg
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+
+        # Per eye state: filtered x/y, filtered x/y derivatives, device time of last valid sample
+        self._x = [(0.0, 0.0)] * 2
+        self._dx = [(0.0, 0.0)] * 2
+        self._t: list[int | None] = [None] * 2
+
+        # Stats
+        self._resets = 0 # One per eye and gap (or blink)
+
+    async def process(self, batch: GazeBatch) -> GazeBatch:
+        if len(batch) == 0:
+            return batch
+
+        t = batch.device_timestamp_us.tolist()
+        (lx, ly), (rx, ry) = (
+            self._filter(e, getattr(batch, x).tolist(), getattr(batch, y).tolist(), t)
+            for e, (x, y) in enumerate(self._EYES)
+        )
+        l_valid, r_valid = ~np.isnan(lx), ~np.isnan(rx)
+
+        mid_x, mid_y, x_px, y_px, px_valid = gaze_midpoint(
+            lx, ly, rx, ry, l_valid, r_valid, self.screen_width, self.screen_height
+        )
+        return batch.with_extras(
+            smooth_x_norm=mid_x,
+            smooth_y_norm=mid_y,
+            smooth_x_px=x_px,
+            smooth_y_px=y_px,
+            smooth_px_valid=px_valid,
+        )
+
+    def _filter(self, e: int, xs: list[float], ys: list[float], t: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The recursion is inherently sequential, so it runs as a tight scalar
+        loop over Python floats, x and y of one eye per step: they share the
+        time step and the reset. Stepping all four channels as a numpy vector
+        is slower, per-call overhead dominates arrays of four.
+        """
+        min_cutoff, beta = self.cfg.min_cutoff_hz, self.cfg.beta
+        tau_d = 1 / (2 * math.pi * self.cfg.d_cutoff_hz)
+        gap_us = self.cfg.reset_gap_ms * 1_000
+        two_pi = 2 * math.pi
+
+        (x_hat, y_hat), (dx_hat, dy_hat), last_t = self._x[e], self._dx[e], self._t[e]
+        out_x = [math.nan] * len(xs)
+        out_y = [math.nan] * len(xs)
+
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            if x != x or y != y: # NaN, eye not tracked
+                continue
+
+            ti = t[i]
+            if last_t is None or not 0 < ti - last_t <= gap_us:
+                x_hat, y_hat, dx_hat, dy_hat = x, y, 0.0, 0.0
+                self._resets += 1
+            else:
+                dt = (ti - last_t) / 1e6
+                smooth_d = 1 + tau_d / dt
+                dx_hat += ((x - x_hat) / dt - dx_hat) / smooth_d
+                dy_hat += ((y - y_hat) / dt - dy_hat) / smooth_d
+                x_hat += (x - x_hat) / (1 + 1 / (two_pi * (min_cutoff + beta * abs(dx_hat)) * dt))
+                y_hat += (y - y_hat) / (1 + 1 / (two_pi * (min_cutoff + beta * abs(dy_hat)) * dt))
+
+            last_t = ti
+            out_x[i] = x_hat
+            out_y[i] = y_hat
+
+        self._x[e], self._dx[e], self._t[e] = (x_hat, y_hat), (dx_hat, dy_hat), last_t
+        return np.array(out_x), np.array(out_y)
+
+    def stats(self) -> dict[str, Any]:
+        return {"resets": self._resets}
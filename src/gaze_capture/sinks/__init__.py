@@ -1,3 +1,4 @@
 from .base import GazeSink
 from .parquet import ParquetSink
+from .journal import JournalSink
 from .nats import NATSSink
\ No newline at end of file
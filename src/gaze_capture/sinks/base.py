@@ -1,11 +1,18 @@
 from abc import ABC, abstractmethod
-from ..models import GazeData
+from typing import Any
+from ..configs import SinkInboxConfig
+from ..models import GazeData, GazeBatch
+from ..utils.tracing import LatencyTracer
 
 class GazeSink(ABC):
     """
     Abstract Base Class for all data sinks.
     Provides common context manager logic for simplified lifecycle management.
     """
+    # Inbox the runner puts in front of this sink, subclasses may override per instance
+    inbox: SinkInboxConfig = SinkInboxConfig()
+    # Set by the runner when latency tracing is on, for checkpoints inside the sink
+    tracer: LatencyTracer | None = None
 
     async def start(self) -> None:
         """Initialize sink resources."""
@@ -14,15 +21,35 @@ class GazeSink(ABC):
     @abstractmethod
     async def send(self, data: GazeData) -> None:
         """
-        Push data to the sink. 
+        Push a single frame to the sink.
         Must be non-blocking to the caller.
         """
         pass
 
+    async def send_batch(self, samples: GazeBatch) -> None:
+        """
+        Push a columnar batch to the sink.
+        Falls back to one `send` per row, sinks that can batch should override it.
+        """
+        for sample in samples:
+            await self.send(sample)
+
     async def close(self) -> None:
         """Clean up sink resources."""
         pass
 
+    @property
+    def backlog(self) -> int:
+        """
+        Samples accepted by `send` that wait in the sink's own queue, added to
+        the inbox depth for the watchdog's lag SLO. Sinks without one have none.
+        """
+        return 0
+
+    def stats(self) -> dict[str, Any]:
+        """Sink-specific counters, reported next to the runner's inbox counters."""
+        return {}
+
     async def __aenter__(self):
         await self.start()
         return self
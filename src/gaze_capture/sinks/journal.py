@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Final, Iterator, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .parquet import ParquetSink, batch_to_table, writer_options, _fsync, _fsync_dir
+from ..configs import ParquetWriterConfig
+from ..models import GazeBatch
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX: Final[str] = ".arrows"
+
+# A single worker, so compactions (at close and orphan recovery) never run side by side
+_compactor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="JournalCompactor")
+
+class JournalSink(ParquetSink):
+    """
+    Parquet sink that records into an append-only Arrow IPC stream first.
+
+    Each flush appends one record batch to `<output>.arrows` (no Parquet
+    encoding or compression while recording). The stream is readable after a
+    crash up to the last complete batch. On close the journal is compacted
+    into the usual `output_path` by the background compactor and deleted,
+    journals left behind by a crash are compacted by `recover_journals`.
+    """
+    def __init__(self, output_dir: Path, *, compaction_rows: int = 65_536, **kwargs: Any) -> None:
+        super().__init__(output_dir, **kwargs)
+        self.journal_path = self.output_path.with_suffix(JOURNAL_SUFFIX)
+        self.compaction_rows = compaction_rows
+        self._file: Optional[pa.NativeFile] = None
+        self._compacted: Optional[Path] = None
+
+    def _write_sync(self, batch: GazeBatch) -> int:
+        """Arrow conversion and one IPC record batch appended to the journal."""
+        table = batch_to_table(batch, self.schema_version)
+
+        if self._writer is None:
+            self._file = pa.OSFile(str(self.journal_path), "wb")
+            self._writer = pa.ipc.new_stream(self._file, self._schema)
+
+        self._writer.write_table(table)
+        if self.tracer is not None:
+            self.tracer.record("journal:write", batch)
+        return len(batch)
+
+    def _close_writer(self) -> None:
+        self._writer.close()
+        self._writer = None
+        self._file.close()
+        self._file = None
+
+    async def close(self) -> None:
+        await super().close()
+        if self.journal_path.exists():
+            self._compacted = await asyncio.wrap_future(
+                compact_in_background(self.journal_path, self.output_path, self.compaction_rows, self.writer_config)
+            )
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), "compacted": self._compacted is not None}
+
+def read_journal(path: Path) -> Iterator[pa.RecordBatch]:
+    """Record batches of a journal up to the last complete one, a torn tail (crash mid-write) is dropped."""
+    with pa.OSFile(str(path)) as source:
+        try:
+            reader = pa.ipc.open_stream(source)
+        except (pa.ArrowInvalid, OSError):
+            return # Empty, or the crash hit before the schema was written
+        while True:
+            try:
+                yield reader.read_next_batch()
+            except StopIteration:
+                return
+            except (pa.ArrowInvalid, OSError) as e:
+                logger.warning(f"{path.name}: torn record batch at the end, recovered up to the previous one ({e})")
+                return
+
+def compact_journal(
+    journal: Path,
+    output: Path | None = None,
+    row_group_rows: int = 65_536,
+    writer_config: ParquetWriterConfig | None = None,
+) -> Path | None:
+    """
+    Rewrites a journal as Parquet (`writer_config` codec and encodings, ~`row_group_rows`
+    per row group) through `.tmp` + rename, then deletes it. Returns the Parquet path,
+    or None when the journal held no complete batch.
+    """
+    journal = Path(journal)
+    output = Path(output) if output is not None else journal.with_suffix(".parquet")
+    tmp = output.with_suffix(".parquet.tmp")
+
+    writer: Optional[pq.ParquetWriter] = None
+    pending: list[pa.RecordBatch] = []
+    pending_rows = rows = 0
+    try:
+        for batch in read_journal(journal):
+            if writer is None:
+                options = writer_options(writer_config or ParquetWriterConfig(), batch.schema)
+                writer = pq.ParquetWriter(tmp, schema=batch.schema, version="2.6", **options)
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            if pending_rows >= row_group_rows:
+                writer.write_table(pa.Table.from_batches(pending), row_group_size=pending_rows)
+                rows += pending_rows
+                pending, pending_rows = [], 0
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending), row_group_size=pending_rows)
+            rows += pending_rows
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        tmp.unlink(missing_ok=True)
+        raise
+
+    if writer is None:
+        logger.warning(f"{journal.name}: no complete record batch, nothing to compact.")
+        journal.unlink()
+        return None
+
+    writer.close()
+    _fsync(tmp)
+    os.replace(tmp, output)
+    _fsync_dir(output.parent)
+    journal.unlink()
+    logger.info(f"Compacted {journal.name} into {output.name} ({rows:,} rows).")
+    return output
+
+def _compact_or_keep(
+    journal: Path, output: Path | None, row_group_rows: int, writer_config: ParquetWriterConfig | None
+) -> Path | None:
+    try:
+        return compact_journal(journal, output, row_group_rows, writer_config)
+    except Exception as e:
+        logger.error(f"Compacting {journal} failed, kept for the next startup: {e}")
+        return None
+
+def compact_in_background(
+    journal: Path,
+    output: Path | None = None,
+    row_group_rows: int = 65_536,
+    writer_config: ParquetWriterConfig | None = None,
+) -> Future:
+    """Queues a compaction on the compactor thread. Failures are logged and leave the journal in place."""
+    return _compactor.submit(_compact_or_keep, journal, output, row_group_rows, writer_config)
+
+def recover_journals(
+    directory: Path, row_group_rows: int = 65_536, writer_config: ParquetWriterConfig | None = None
+) -> list[Future]:
+    """Queues compaction of every journal under `directory`, left behind by a crash. Call before recording starts."""
+    journals = sorted(Path(directory).rglob(f"*{JOURNAL_SUFFIX}"))
+    if journals:
+        logger.warning(f"Found {len(journals)} orphaned journal(s) in {directory}, compacting in the background.")
+    return [compact_in_background(journal, None, row_group_rows, writer_config) for journal in journals]
@@ -1,9 +1,12 @@
 import logging
+from typing import Any
+
 import nats
 from nats.errors import OutboundBufferLimitError
 
 from .base import GazeSink
-from ..models import GazeData
+from ..configs import SinkInboxConfig
+from ..models import GazeData, GazeBatch
 
 from aware_protos.zhaw.protobuf import gaze_pb2
 
@@ -13,33 +16,85 @@ class NATSSink(GazeSink):
     def __init__(
         self,
         nc: nats.NATS,
-        subject: str = "intent.gaze"
+        subject: str = "intent.gaze",
+        use_smoothed: bool = True,
+        inbox: SinkInboxConfig | None = None,
     ):
         self.nc = nc
         self.subject = subject
+        self.use_smoothed = use_smoothed
+        if inbox is not None:
+            self.inbox = inbox
 
         self._proto = gaze_pb2.GazeScreenPosition()
 
+        # Stats
+        self._published = 0
+        self._dropped = 0 # Disconnected or outbound buffer full
+
     async def send(self, data: GazeData) -> None:
         if not self.nc.is_connected:
+            self._dropped += 1
             return
 
         try:
             is_valid = data.gaze_x_px is not None and data.gaze_y_px is not None
-            
-            p = self._proto
-            p.Clear()
-
-            p.timestamp.FromMilliseconds(data.timestamp_ms)
-            p.x = data.gaze_x_px if is_valid else -1
-            p.y = data.gaze_y_px if is_valid else -1
-            p.is_valid = is_valid
-            
-            # Serialize and publish
-            await self.nc.publish(self.subject, p.SerializeToString())
-            
+            await self._publish(data.timestamp_ms, data.gaze_x_px, data.gaze_y_px, is_valid)
+            self._published += 1
+
+        except OutboundBufferLimitError:
+            self._dropped += 1 # Drop frame gracefully if NATS is offline
+
+        except Exception as e:
+            logger.error("Failed to publish prediction to NATS: %s", e)
+
+    async def send_batch(self, samples: GazeBatch) -> None:
+        """
+        One message per row (subscribers expect single positions), columns converted once.
+        Publishes the smoothed position when a smoothing stage provided one.
+        """
+        if not self.nc.is_connected:
+            self._dropped += len(samples)
+            return
+
+        if self.use_smoothed and "smooth_x_px" in samples.extras:
+            extras = samples.extras
+            x_px, y_px, px_valid = extras["smooth_x_px"], extras["smooth_y_px"], extras["smooth_px_valid"]
+        else:
+            x_px, y_px, px_valid = samples.gaze_x_px, samples.gaze_y_px, samples.gaze_px_valid
+
+        rows = zip(
+            samples.timestamp_ms.tolist(),
+            x_px.tolist(),
+            y_px.tolist(),
+            px_valid.tolist(),
+        )
+        published = 0
+        try:
+            for timestamp_ms, x, y, is_valid in rows:
+                await self._publish(timestamp_ms, x, y, is_valid)
+                published += 1
+
         except OutboundBufferLimitError:
-            pass # Drop frame gracefully if NATS is offline
+            self._dropped += len(samples) - published # Drop the rest of the batch gracefully if NATS is offline
 
         except Exception as e:
-            logger.error("Failed to publish prediction to NATS: %s", e)
\ No newline at end of file
+            logger.error("Failed to publish prediction to NATS: %s", e)
+
+        finally:
+            self._published += published
+
+    async def _publish(self, timestamp_ms: int, x: int | None, y: int | None, is_valid: bool) -> None:
+        p = self._proto
+        p.Clear()
+
+        p.timestamp.FromMilliseconds(timestamp_ms)
+        p.x = x if is_valid else -1
+        p.y = y if is_valid else -1
+        p.is_valid = is_valid
+
+        # Serialize and publish
+        await self.nc.publish(self.subject, p.SerializeToString())
+
+    def stats(self) -> dict[str, Any]:
+        return {"published": self._published, "dropped": self._dropped}
\ No newline at end of file
@@ -1,22 +1,50 @@
 import asyncio
 import logging
+import os
+import time
+import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Final, Optional
+from typing import Any, Final, Optional
 
 from .base import GazeSink
-from ..models import GazeData
+from ..configs import SinkInboxConfig, ParquetWriterConfig
+from ..models import GazeData, GazeBatch
 from ..utils.logging import ThrottledLogger
+from ..utils.queues import RowBoundedQueue
 from ..utils.types import EndToken, _END
 
 logger = logging.getLogger(__name__)
 
+# File metadata key holding the schema version, files written before v2 existed have none (v1)
+SCHEMA_VERSION_KEY: Final[bytes] = b"gaze_capture.schema_version"
+
+# Monotonic integer columns, candidates for DELTA_BINARY_PACKED
+_TIMESTAMP_COLUMNS: Final[frozenset[str]] = frozenset({"timestamp_ms", "device_ts_us", "system_ts_us"})
+
+def _flatten_vec3(schema: pa.Schema) -> pa.Schema:
+    """v2: every 3D `list<float32>` column becomes flat `<name>_x/_y/_z` float32 columns."""
+    flat = []
+    for f in schema:
+        if pa.types.is_list(f.type):
+            flat.extend(pa.field(f"{f.name}_{axis}", pa.float32()) for axis in "xyz")
+        else:
+            flat.append(f)
+    return pa.schema(flat)
+
 class ParquetSink(GazeSink):
     """
     Optimized Parquet Sink for constant 120Hz Gaze Data.
     Flushes to disk based on buffer size.
+
+    With `segment_s` or `segment_rows` set, `output_path` is a dataset directory
+    of `part-NNNNN.parquet` segments. Each segment is written as `.tmp`, closed
+    (footer), fsynced and renamed, then `_metadata` (all row groups of all
+    closed segments) is rewritten the same way. A crash loses at most the open
+    segment, and readers open the session from `_metadata` without touching
+    every footer.
     """
     _SCHEMA: Final[pa.Schema] = pa.schema([
         # Unix Epoch
@@ -46,6 +74,7 @@ class ParquetSink(GazeSink):
         ("left_origin_mm", pa.list_(pa.float32())),
         ("right_origin_mm", pa.list_(pa.float32())),
     ])
+    _SCHEMA_V2: Final[pa.Schema] = _flatten_vec3(_SCHEMA)
 
     def __init__(
         self,
@@ -53,43 +82,72 @@ class ParquetSink(GazeSink):
         drop_when_full: bool,
         max_buffer_size: int,
         queue_size: int,
+        inbox: SinkInboxConfig | None = None,
+        schema_version: int = 1,
+        segment_s: float = 0.0,
+        segment_rows: int = 0,
+        writer: ParquetWriterConfig | None = None,
     ) -> None:
         self.max_buffer_size = max_buffer_size
+        self.schema_version = schema_version
+        self._schema = schema_for(schema_version).with_metadata({SCHEMA_VERSION_KEY: str(schema_version)})
+        self.writer_config = writer or ParquetWriterConfig()
+        self._writer_options = writer_options(self.writer_config, self._schema)
         self.drop_when_full = drop_when_full
+        self.segment_s = segment_s
+        self.segment_rows = segment_rows
+        self.segmented = segment_s > 0 or segment_rows > 0
+        if inbox is not None:
+            self.inbox = inbox
         
-        # Setup file with UTC timestamp
+        # Setup file (or segment directory) with UTC timestamp
         output_dir.mkdir(parents=True, exist_ok=True)
         self.output_path = output_dir / f"eye_tracker__{datetime.now(timezone.utc):%Y%m%d_%H%M%S}.parquet"
         
-        # Internal state
-        self._queue: asyncio.Queue[GazeData | EndToken] = asyncio.Queue(maxsize=queue_size)
+        # Internal state (items are frames or batches, queue_size bounds their samples)
+        self._queue: RowBoundedQueue = RowBoundedQueue(maxsize=queue_size)
         self._worker_task: Optional[asyncio.Task] = None
         self._writer: Optional[pq.ParquetWriter] = None
+        self._collector: list[pq.FileMetaData] = []
+
+        # Segments
+        self._segment_index = 0
+        self._segment_rows = 0
+        self._segment_t0 = 0.0
+        self._segments: list[pq.FileMetaData] = []
 
         # Stats
         self._total_rows = 0
         self._total_preds_dropped = 0
+        self._flushes = 0
+        self._flush_total_s = 0.0
+        self._flush_max_s = 0.0
         self._drop_logger = ThrottledLogger(logger, interval_sec=1)
 
         logger.info(f"ParquetSink initialized. Writing to: {self.output_path}")
     
-    async def send(self, data: GazeData) -> None:
+    async def send(self, data: GazeData | GazeBatch) -> None:
         """Push data to the queue. Handles backpressure or dropping."""
         if self.drop_when_full:
             try:
                 self._queue.put_nowait(data)
             except asyncio.QueueFull:
-                self._total_preds_dropped += 1
+                self._total_preds_dropped += len(data) if isinstance(data, GazeBatch) else 1
                 self._drop_logger.warning("Queue is full, dropping gaze sample.")
         else:
             await self._queue.put(data)
+
+    async def send_batch(self, samples: GazeBatch) -> None:
+        """Batches are queued as one item, the worker buffers by rows."""
+        await self.send(samples)
     
     async def _worker(self) -> None:
         """
         Simplified high-throughput worker.
-        Drains queue and flushes when buffer is full.
+        Drains queue and flushes when buffer holds `max_buffer_size` rows.
         """
-        buffer: list[GazeData] = []
+        buffer: list[GazeData | GazeBatch] = []
+        buffered_rows = 0
         
         # Localize variables for tight-loop performance
         queue = self._queue
@@ -101,111 +159,114 @@ class ParquetSink(GazeSink):
             if item is _END:
                 break
             buffer.append(item)
+            buffered_rows += len(item) if isinstance(item, GazeBatch) else 1
 
             # 2. Greedy Drain (Grab all currently in queue up to limit)
-            while not queue.empty() and len(buffer) < max_buf:
+            while not queue.empty() and buffered_rows < max_buf:
                 try:
                     next_item = queue.get_nowait()
                     if next_item is _END:
                         await self._flush(buffer)
                         return 
                     buffer.append(next_item)
+                    buffered_rows += len(next_item) if isinstance(next_item, GazeBatch) else 1
                 except asyncio.QueueEmpty:
                     break
 
             # 3. Buffer Full Check
-            if len(buffer) >= max_buf:
+            if buffered_rows >= max_buf:
                 await self._flush(buffer)
                 buffer.clear()
+                buffered_rows = 0
         
         # Final cleanup on closure
         await self._flush(buffer)
 
-    async def _flush(self, batch: list[GazeData]) -> None:
+    async def _flush(self, items: list[GazeData | GazeBatch]) -> None:
         """Offloads Columnar conversion and IO to a background thread."""
-        if not batch:
+        if not items:
             return
         
+        t0 = time.perf_counter()
         try:
-            self._total_rows += await asyncio.to_thread(self._write_sync, batch)
+            self._total_rows += await asyncio.to_thread(self._write_sync, GazeBatch.merge(items))
         except Exception as e:
             logger.error(f"Parquet flush failed: {e}")
-            self._total_preds_dropped += len(batch)
+            self._total_preds_dropped += sum(len(i) if isinstance(i, GazeBatch) else 1 for i in items)
 
-    def _write_sync(self, batch: list[GazeData]) -> int:
-        """
-        Synchronous Arrow conversion and Parquet write.
-        Pre-allocates lists for peak performance.
-        """
-        size = len(batch)
-        
-        # Pre-allocate flat columns
-        timestamp_ms, device_ts, system_ts = [None] * size, [None] * size, [None] * size
-        m_x_px, m_y_px, m_x, m_y = [None] * size, [None] * size, [None] * size, [None] * size
-        l_x, l_y, r_x, r_y = [None] * size, [None] * size, [None] * size, [None] * size
-        l_pup, r_pup = [None] * size, [None] * size
-        l_3d, r_3d = [None] * size, [None] * size
-        l_origin, r_origin = [None] * size, [None] * size
-
-        for i, d in enumerate(batch):
-            timestamp_ms[i] = d.timestamp_ms
-            device_ts[i] = d.device_timestamp_us
-            system_ts[i] = d.system_timestamp_us
-            
-            m_x_px[i] = d.gaze_x_px
-            m_y_px[i] = d.gaze_y_px
-            m_x[i] = d.gaze_x_norm
-            m_y[i] = d.gaze_y_norm
-            
-            l_x[i], l_y[i] = d.left_x_norm, d.left_y_norm
-            r_x[i], r_y[i] = d.right_x_norm, d.right_y_norm
-            
-            l_pup[i], r_pup[i] = d.left_pupil_mm, d.right_pupil_mm
-            
-            # Convert tuples to lists for Arrow FixedSizeList compatibility
-            if d.left_3d_mm is not None:
-                l_3d[i] = list(d.left_3d_mm)
-            if d.right_3d_mm is not None:
-                r_3d[i] = list(d.right_3d_mm)
-            if d.left_origin_mm is not None:
-                l_origin[i] = list(d.left_origin_mm)
-            if d.right_origin_mm is not None:
-                r_origin[i] = list(d.right_origin_mm)
-            
-        table = pa.Table.from_arrays(
-            [
-                pa.array(timestamp_ms, type=pa.timestamp('ms')),
-                pa.array(m_x_px, type=pa.int16()),
-                pa.array(m_y_px, type=pa.int16()),
-                pa.array(m_x, type=pa.float32()),
-                pa.array(m_y, type=pa.float32()),
-                pa.array(device_ts, type=pa.int64()),
-                pa.array(system_ts, type=pa.int64()),
-                pa.array(l_x, type=pa.float32()),
-                pa.array(l_y, type=pa.float32()),
-                pa.array(r_x, type=pa.float32()),
-                pa.array(r_y, type=pa.float32()),
-                pa.array(l_pup, type=pa.float32()),
-                pa.array(r_pup, type=pa.float32()),
-                pa.array(l_3d, type=pa.list_(pa.float32())),
-                pa.array(r_3d, type=pa.list_(pa.float32())),
-                pa.array(l_origin, type=pa.list_(pa.float32())),
-                pa.array(r_origin, type=pa.list_(pa.float32())),
-            ],
-            schema=self._SCHEMA
-        )
+        dt = time.perf_counter() - t0
+        self._flushes += 1
+        self._flush_total_s += dt
+        if dt > self._flush_max_s:
+            self._flush_max_s = dt
+
+    def _write_sync(self, batch: GazeBatch) -> int:
+        """Synchronous Arrow conversion and Parquet write."""
+        table = batch_to_table(batch, self.schema_version)
         
         if self._writer is None:
+            self._collector = []
             self._writer = pq.ParquetWriter(
-                self.output_path, 
-                schema=self._SCHEMA, 
-                compression="zstd",
+                self._open_segment() if self.segmented else self.output_path, 
+                schema=self._schema, 
                 version="2.6",
-                metadata_collector=[]
+                metadata_collector=self._collector,
+                **self._writer_options
             )
         
         self._writer.write_table(table)
-        return size
+        if self.tracer is not None:
+            self.tracer.record("parquet:write", batch)
+
+        if self.segmented:
+            self._segment_rows += len(batch)
+            if (
+                (self.segment_rows and self._segment_rows >= self.segment_rows)
+                or (self.segment_s and time.monotonic() - self._segment_t0 >= self.segment_s)
+            ):
+                self._close_segment()
+        return len(batch)
+
+    # --- Segments ---
+
+    def _segment_path(self, index: int) -> Path:
+        return self.output_path / f"part-{index:05d}.parquet"
+
+    def _open_segment(self) -> Path:
+        """Starts the next segment, written under a `.tmp` name until it is complete."""
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        self._segment_rows = 0
+        self._segment_t0 = time.monotonic()
+        return self._segment_path(self._segment_index).with_suffix(".parquet.tmp")
+
+    def _close_segment(self) -> None:
+        """Writes the footer, publishes the segment atomically and rewrites `_metadata`."""
+        self._writer.close()
+        self._writer = None
+
+        path = self._segment_path(self._segment_index)
+        tmp = path.with_suffix(".parquet.tmp")
+        _fsync(tmp)
+        os.replace(tmp, path)
+
+        metadata = self._collector[-1]
+        metadata.set_file_path(path.name)
+        self._segments.append(metadata)
+        self._segment_index += 1
+
+        summary = self.output_path / "_metadata"
+        summary_tmp = summary.with_suffix(".tmp")
+        pq.write_metadata(self._schema, summary_tmp, metadata_collector=self._segments)
+        _fsync(summary_tmp)
+        os.replace(summary_tmp, summary)
+        _fsync_dir(self.output_path)
+
+    def _close_writer(self) -> None:
+        if self.segmented:
+            self._close_segment()
+        else:
+            self._writer.close()
+            self._writer = None
 
     async def start(self) -> None:
         if self._worker_task is None:
@@ -218,6 +279,128 @@ class ParquetSink(GazeSink):
             self._worker_task = None
         
         if self._writer:
-            await asyncio.to_thread(self._writer.close)
-            self._writer = None
-            logger.info(f"Parquet closed. Written: {self._total_rows:,}, Dropped: {self._total_preds_dropped:,}")
\ No newline at end of file
+            await asyncio.to_thread(self._close_writer)
+            segments = f", Segments: {self._segment_index}" if self.segmented else ""
+            logger.info(f"Parquet closed. Written: {self._total_rows:,}, Dropped: {self._total_preds_dropped:,}{segments}")
+
+    @property
+    def backlog(self) -> int:
+        """Queued samples, the flush buffer (`max_buffer_size` rows, batching by design) is not lag."""
+        return self._queue.depth
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "rows_written": self._total_rows,
+            "dropped": self._total_preds_dropped,
+            "queue_depth": self._queue.qsize(),
+            "flushes": self._flushes,
+            "flush_s_total": self._flush_total_s,
+            "flush_s_max": self._flush_max_s,
+            "segments": self._segment_index,
+        }
+
+def schema_for(version: int) -> pa.Schema:
+    if version not in (1, 2):
+        raise ValueError(f"Unknown gaze schema version: {version}")
+    return ParquetSink._SCHEMA if version == 1 else ParquetSink._SCHEMA_V2
+
+def writer_options(cfg: ParquetWriterConfig, schema: pa.Schema) -> dict[str, Any]:
+    """`pq.ParquetWriter` keyword arguments for `cfg`: codec, level, dictionary and per-column encodings."""
+    encodings: dict[str, str] = {}
+    paths: list[str] = []
+    for f in schema:
+        if pa.types.is_list(f.type) or pa.types.is_fixed_size_list(f.type):
+            path, leaf = f"{f.name}.list.element", f.type.value_type
+        else:
+            path, leaf = f.name, f.type
+        paths.append(path)
+
+        if cfg.delta_timestamps and f.name in _TIMESTAMP_COLUMNS:
+            encodings[path] = "DELTA_BINARY_PACKED"
+        elif cfg.byte_stream_split and pa.types.is_float32(leaf):
+            encodings[path] = "BYTE_STREAM_SPLIT"
+
+    # pyarrow refuses explicit encodings on dictionary encoded columns, so those opt out of the dictionary
+    if not cfg.use_dictionary:
+        use_dictionary: bool | list[str] = False
+    elif encodings:
+        use_dictionary = [p for p in paths if p not in encodings]
+    else:
+        use_dictionary = True
+
+    options: dict[str, Any] = {
+        "compression": None if cfg.compression == "none" else cfg.compression,
+        "compression_level": cfg.compression_level,
+        "use_dictionary": use_dictionary,
+    }
+    if encodings:
+        options["column_encoding"] = encodings
+    return options
+
+def batch_to_table(batch: GazeBatch, schema_version: int = 1) -> pa.Table:
+    """
+    Converts a batch to a table of the given schema version.
+    Arrays are built straight from the column buffers, NaN/invalid become nulls
+    through validity bitmaps, so no per-row Python work is involved.
+    """
+    px_valid = batch.gaze_px_valid
+    arrays = [
+        _primitive(batch.timestamp_ms, pa.timestamp('ms'), np.int64),
+        _primitive(batch.gaze_x_px, pa.int16(), np.int16, px_valid),
+        _primitive(batch.gaze_y_px, pa.int16(), np.int16, px_valid),
+        _float32(batch.gaze_x_norm),
+        _float32(batch.gaze_y_norm),
+        _primitive(batch.device_timestamp_us, pa.int64(), np.int64),
+        _primitive(batch.system_timestamp_us, pa.int64(), np.int64),
+        _float32(batch.left_x_norm),
+        _float32(batch.left_y_norm),
+        _float32(batch.right_x_norm),
+        _float32(batch.right_y_norm),
+        _float32(batch.left_pupil_mm),
+        _float32(batch.right_pupil_mm),
+    ]
+    for values in (batch.left_3d_mm, batch.right_3d_mm, batch.left_origin_mm, batch.right_origin_mm):
+        if schema_version == 1:
+            arrays.append(_vec3_list(values))
+        else:
+            arrays.extend(_float32(values[:, axis]) for axis in range(3))
+    return pa.Table.from_arrays(arrays, schema=schema_for(schema_version))
+
+def _validity(valid: np.ndarray) -> tuple[pa.Buffer | None, int]:
+    """Arrow validity bitmap (LSB first) and null count, no bitmap when all rows are valid."""
+    null_count = len(valid) - int(np.count_nonzero(valid))
+    if null_count == 0:
+        return None, 0
+    return pa.py_buffer(np.packbits(valid, bitorder="little")), null_count
+
+def _primitive(values: np.ndarray, type: pa.DataType, dtype: type, valid: np.ndarray | None = None) -> pa.Array:
+    """Arrow array over the numpy buffer (no copy when the dtype already matches)."""
+    data = np.ascontiguousarray(values, dtype=dtype)
+    validity, null_count = _validity(valid) if valid is not None else (None, 0)
+    return pa.Array.from_buffers(type, len(data), [validity, pa.py_buffer(data)], null_count=null_count)
+
+def _float32(values: np.ndarray) -> pa.Array:
+    return _primitive(values, pa.float32(), np.float32, ~np.isnan(values))
+
+def _vec3_list(values: np.ndarray) -> pa.Array:
+    """(n, 3) array to `list<float32>`, rows of NaN become null lists."""
+    n = len(values)
+    child = _primitive(values.ravel(), pa.float32(), np.float32)
+    offsets = pa.py_buffer(np.arange(0, 3 * n + 1, 3, dtype=np.int32))
+    validity, null_count = _validity(~np.isnan(values[:, 0]))
+    return pa.Array.from_buffers(pa.list_(pa.float32()), n, [validity, offsets], null_count=null_count, children=[child])
+
+def _fsync(path: Path) -> None:
+    """Flushes `path` to disk. Opened for writing, FlushFileBuffers fails on a read-only handle on Windows."""
+    with open(path, "r+b") as f:
+        os.fsync(f.fileno())
+
+def _fsync_dir(path: Path) -> None:
+    """Makes renames in `path` durable (POSIX only, directories cannot be opened on Windows)."""
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
\ No newline at end of file
@@ -7,7 +7,7 @@ from typing import Callable, Any
 
 from .calibration import CalibrationWindow 
 from ..core.manager import EyeTrackingManager
-from ..core.state import AppState
+from ..core.state import AppState, RECORDING_STATES
 
 logger = logging.getLogger(__name__)
 
@@ -95,7 +95,7 @@ class GazeCaptureApp(tk.Tk):
         is_recording = self.manager.is_recording
 
         # Disable buttons during recording, calibration, or missing hardware
-        hardware_ok = state in (AppState.IDLE, AppState.RECORDING)
+        hardware_ok = state is AppState.IDLE or state in RECORDING_STATES
         
         self.lbl_status.config(text=f"System State: {state.name}")
         self.lbl_calib_status.config(
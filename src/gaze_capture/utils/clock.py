@@ -1,8 +1,15 @@
+import asyncio
+import logging
 import time
-from typing import Callable
+from collections import deque
+from typing import Any, Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 class TimeProbe:
-    __slots__ = ("latency", "offset")
+    __slots__ = ("latency", "offset", "system_us")
 
     def __init__(self, now_us_func: Callable[[], int]):
         before: int = now_us_func()
@@ -14,10 +21,13 @@ class TimeProbe:
 
         # Latency in us
         self.latency: int = after - before
+        # Device clock reading the offset refers to
+        self.system_us: int = system_timestamp_at_utc
         # Offset is ns - (us * 1000), result is ns (int)
         self.offset: int = utc - (system_timestamp_at_utc * 1_000)
 
     def to_utc_ms(self, system_timestamp_us: int) -> int:
+        # Also works element-wise on int64 arrays (offset fits in int64)
         # Convert timestamp from us to ns to apply offset, then final timestamp from ns to ms
         return (system_timestamp_us * 1_000 + self.offset) // 1_000_000
 
@@ -26,4 +36,128 @@ class TimeProbe:
         return self.latency < other.latency
 
     def __eq__(self, other: "TimeProbe") -> bool:
-        return self.latency == other.latency
\ No newline at end of file
+        return self.latency == other.latency
+
+class ClockModel:
+    """
+    Immutable linear mapping from a device clock (us) to UTC.
+    utc_ns = system_us * 1000 + offset_ns + (system_us - ref_us) * drift_ppm / 1000
+    """
+    __slots__ = ("ref_us", "offset_ns", "drift_ppm")
+
+    def __init__(self, ref_us: int, offset_ns: int, drift_ppm: float = 0.0):
+        self.ref_us = ref_us
+        self.offset_ns = offset_ns
+        self.drift_ppm = drift_ppm
+
+    def to_utc_ms(self, system_timestamp_us: int | np.ndarray) -> int | np.ndarray:
+        # Keep the large terms in integers, only the drift correction is floating point
+        base_ns = system_timestamp_us * 1_000 + self.offset_ns
+        if not self.drift_ppm:
+            return base_ns // 1_000_000
+
+        # ppm of elapsed us, expressed in ns
+        drift_ns = (system_timestamp_us - self.ref_us) * self.drift_ppm / 1_000
+        if isinstance(drift_ns, np.ndarray):
+            return (base_ns + np.rint(drift_ns).astype(np.int64)) // 1_000_000
+        return (base_ns + round(drift_ns)) // 1_000_000
+
+class ClockSync:
+    """
+    Continuous device-clock -> UTC synchronisation.
+
+    Takes the best (lowest latency) probe out of a burst every `interval_s`,
+    off the event loop, and fits offset and drift over the last `window`
+    bursts with a Theil-Sen estimator, which ignores the occasional probe
+    delayed by scheduling. Readers always see a complete `ClockModel`.
+    """
+    def __init__(
+        self,
+        now_us_func: Callable[[], int],
+        burst_size: int = 50,
+        interval_s: float = 10.0,
+        window: int = 60,
+    ) -> None:
+        self._now_us = now_us_func
+        self.burst_size = burst_size
+        self.interval_s = interval_s
+
+        self._points: deque[TimeProbe] = deque(maxlen=window)
+        self._model: ClockModel | None = None
+        self._residuals_us = np.zeros(0)
+        self._refits = 0
+
+    @property
+    def model(self) -> ClockModel:
+        if self._model is None:
+            raise RuntimeError("ClockSync used before calibrate().")
+        return self._model
+
+    def to_utc_ms(self, system_timestamp_us: int | np.ndarray) -> int | np.ndarray:
+        return self.model.to_utc_ms(system_timestamp_us)
+
+    def probe(self, n: int | None = None) -> TimeProbe:
+        """Blocking burst, returns the lowest latency probe."""
+        return min(TimeProbe(self._now_us) for _ in range(n or self.burst_size))
+
+    def calibrate(self, n_probes: int = 500) -> None:
+        """Blocking initial sync, the model starts as a pure offset."""
+        self._points.clear()
+        self.add_probe(self.probe(n_probes))
+
+    def add_probe(self, probe: TimeProbe) -> None:
+        self._points.append(probe)
+        self._model = self._fit()
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """Re-probes periodically until `stop_event` is set."""
+        if self.interval_s <= 0:
+            return
+
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.interval_s)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                self.add_probe(await asyncio.to_thread(self.probe))
+            except Exception as e:
+                logger.warning(f"Clock re-sync failed, keeping previous model: {e}")
+
+    def _fit(self) -> ClockModel:
+        last = self._points[-1]
+        if len(self._points) < 3:
+            self._residuals_us = np.zeros(len(self._points))
+            return ClockModel(last.system_us, last.offset)
+
+        # Offsets relative to the newest probe keep the fit well conditioned
+        x = np.array([p.system_us - last.system_us for p in self._points], dtype=np.float64)
+        y = np.array([p.offset - last.offset for p in self._points], dtype=np.float64)
+
+        # Theil-Sen: median of all pairwise slopes (ns per us), then median intercept
+        i, j = np.triu_indices(len(x), k=1)
+        dx = x[j] - x[i]
+        keep = dx != 0
+        slope = float(np.median((y[j] - y[i])[keep] / dx[keep])) if keep.any() else 0.0
+        intercept = float(np.median(y - slope * x))
+
+        self._residuals_us = (y - (intercept + slope * x)) / 1_000
+        self._refits += 1
+
+        # slope is ns/us, i.e. 1e-3 ppm per unit -> ppm = slope * 1e3
+        return ClockModel(last.system_us, last.offset + round(intercept), slope * 1_000)
+
+    def stats(self) -> dict[str, Any]:
+        model, residuals = self._model, np.abs(self._residuals_us)
+        return {
+            "probes": len(self._points),
+            "refits": self._refits,
+            "ref_us": model.ref_us if model else None,
+            "offset_ns": model.offset_ns if model else None,
+            "drift_ppm": model.drift_ppm if model else None,
+            "residual_median_us": float(np.median(residuals)) if len(residuals) else None,
+            "residual_max_us": float(residuals.max()) if len(residuals) else None,
+            "last_probe_latency_us": self._points[-1].latency if self._points else None,
+        }
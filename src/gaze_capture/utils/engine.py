@@ -0,0 +1,28 @@
+import asyncio
+import logging
+import threading
+
+from ..configs import EngineConfig
+
+logger = logging.getLogger(__name__)
+
+def new_event_loop(kind: str = "asyncio") -> asyncio.AbstractEventLoop:
+    """
+    A fresh event loop of the requested kind.
+    "uvloop" falls back to the stock loop when uvloop is not installed (e.g. on Windows).
+    """
+    if kind == "uvloop":
+        try:
+            import uvloop
+        except ImportError:
+            logger.warning("uvloop is not installed, falling back to the asyncio event loop.")
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+def start_engine(cfg: EngineConfig) -> asyncio.AbstractEventLoop:
+    """Creates the engine loop and runs it forever in the dedicated "AsyncioEngine" daemon thread."""
+    loop = new_event_loop(cfg.loop)
+    threading.Thread(target=loop.run_forever, name="AsyncioEngine", daemon=True).start()
+    logger.info(f"Engine loop: {type(loop).__module__}.{type(loop).__name__}")
+    return loop
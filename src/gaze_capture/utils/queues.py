@@ -0,0 +1,155 @@
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any
+
+from ..models import GazeBatch
+from .types import EndToken
+
+class OverflowPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest" # Evict queued samples to make room
+    DROP_NEWEST = "drop_newest" # Reject the incoming samples
+    BLOCK = "block" # Hold incoming samples until there is room or the timeout expires
+
+def sample_count(item: Any) -> int:
+    """Rows carried by a queue item, batches count their rows and sentinels count zero."""
+    if isinstance(item, GazeBatch):
+        return len(item)
+    if isinstance(item, EndToken):
+        return 0
+    return 1
+
+class SampleQueue(asyncio.Queue):
+    """
+    asyncio.Queue bounded by sample count rather than item count.
+
+    `put_nowait` (and therefore `put`) never raises QueueFull: overflow is resolved
+    by the policy and accounted in `dropped`. With BLOCK, overflowing items are
+    staged (up to another `capacity` samples) and admitted in order as the
+    consumer makes room, or dropped once `block_timeout_s` expires.
+    A capacity of 0 means unbounded. End-of-stream tokens are always accepted.
+    """
+    def __init__(
+        self,
+        capacity: int = 0,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        block_timeout_s: float = 1.0,
+    ) -> None:
+        super().__init__()
+        self.capacity = capacity
+        self.policy = OverflowPolicy(policy)
+        self.block_timeout_s = block_timeout_s
+
+        self._staged: deque[tuple[Any, float]] = deque()
+        self._staged_depth = 0
+
+        # Stats
+        self.depth = 0
+        self.peak_depth = 0
+        self.enqueued = 0
+        self.dropped = 0
+
+    # --- asyncio.Queue storage hooks ---
+
+    def _put(self, item: Any) -> None:
+        self._queue.append(item)
+        self.depth += sample_count(item)
+        if self.depth > self.peak_depth:
+            self.peak_depth = self.depth
+
+    def _get(self) -> Any:
+        item = self._queue.popleft()
+        self.depth -= sample_count(item)
+        if self._staged:
+            self._admit_staged()
+        return item
+
+    # --- Overflow handling ---
+
+    def put_nowait(self, item: Any) -> None:
+        n = sample_count(item)
+
+        if n == 0:
+            # Never strand staged samples behind the end of the stream
+            self._admit_staged(force=True)
+        elif self.capacity and (self._staged or self.depth + n > self.capacity):
+            if not self._overflow(item, n):
+                return
+
+        self.enqueued += n
+        super().put_nowait(item)
+
+    def _overflow(self, item: Any, n: int) -> bool:
+        """Applies the policy. Returns True if `item` should still be enqueued now."""
+        if self.policy is OverflowPolicy.DROP_NEWEST:
+            self.dropped += n
+            return False
+
+        if self.policy is OverflowPolicy.DROP_OLDEST:
+            while self._queue and self.depth + n > self.capacity:
+                self.dropped += sample_count(self._queue[0])
+                self._get()
+            return True
+
+        # BLOCK: stage it, bounded by one extra capacity worth of samples
+        self._expire_staged(time.monotonic())
+        if self._staged_depth + n > self.capacity:
+            self.dropped += n
+        else:
+            self._staged.append((item, time.monotonic() + self.block_timeout_s))
+            self._staged_depth += n
+        return False
+
+    def _expire_staged(self, now: float) -> None:
+        while self._staged and self._staged[0][1] < now:
+            item, _ = self._staged.popleft()
+            n = sample_count(item)
+            self._staged_depth -= n
+            self.dropped += n
+
+    def _admit_staged(self, force: bool = False) -> None:
+        self._expire_staged(time.monotonic())
+        while self._staged:
+            item, _ = self._staged[0]
+            n = sample_count(item)
+            if not force and self.depth + n > self.capacity:
+                break
+            self._staged.popleft()
+            self._staged_depth -= n
+            self.enqueued += n
+            self._put(item)
+            self._wakeup_next(self._getters)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "policy": self.policy.value,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "depth": self.depth,
+            "peak_depth": self.peak_depth,
+        }
+
+class RowBoundedQueue(asyncio.Queue):
+    """
+    asyncio.Queue whose `maxsize` counts samples (`sample_count`) rather than items.
+    `put` still waits and `put_nowait` still raises QueueFull while the queue is
+    full, an item is admitted while the depth is below `maxsize`, so the last
+    admitted batch may overshoot it.
+    """
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self.depth = 0
+
+    def _put(self, item: Any) -> None:
+        self._queue.append(item)
+        self.depth += sample_count(item)
+
+    def _get(self) -> Any:
+        item = self._queue.popleft()
+        self.depth -= sample_count(item)
+        return item
+
+    def qsize(self) -> int:
+        return self.depth
\ No newline at end of file
@@ -0,0 +1,58 @@
+import logging
+import threading
+from typing import Any, Callable
+
+import numpy as np
+
+from .histogram import LatencyHistogram
+from ..models import GazeData, GazeBatch
+
+logger = logging.getLogger(__name__)
+
+class LatencyTracer:
+    """
+    Per-checkpoint histograms of sample age, i.e. the time since the tracker
+    stamped `system_timestamp_us`, measured on the same clock (`now_us`).
+
+    Each checkpoint ("callback", "enqueue", "dequeue", "sink:<name>", ...) has
+    its own histogram and a single writer thread, so recording takes no lock.
+    """
+    def __init__(self, now_us: Callable[[], int]) -> None:
+        self.now_us = now_us
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._last_counts: dict[str, np.ndarray] = {}
+        self._lock = threading.Lock() # Only guards checkpoint creation
+
+    def _histogram(self, checkpoint: str) -> LatencyHistogram:
+        hist = self._histograms.get(checkpoint)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(checkpoint, LatencyHistogram())
+        return hist
+
+    def record(self, checkpoint: str, item: GazeData | GazeBatch) -> None:
+        """Records the age of every sample in `item` at this checkpoint."""
+        if isinstance(item, GazeBatch):
+            self._histogram(checkpoint).record(self.now_us() - item.system_timestamp_us)
+        else:
+            self._histogram(checkpoint).record_value(self.now_us() - item.system_timestamp_us)
+
+    def record_timestamp(self, checkpoint: str, system_timestamp_us: int) -> None:
+        """Single raw timestamp, for hot paths that have no frame yet (SDK callback)."""
+        self._histogram(checkpoint).record_value(self.now_us() - system_timestamp_us)
+
+    def log_interval(self) -> None:
+        """Logs the percentiles of everything recorded since the previous call."""
+        parts = []
+        for name, hist in list(self._histograms.items()):
+            counts = hist.counts()
+            delta = counts - self._last_counts.get(name, 0)
+            self._last_counts[name] = counts
+            s = hist.summary(delta)
+            if s["count"]:
+                parts.append(f"{name} p50={s['p50_ms']}ms p99={s['p99_ms']}ms (n={s['count']:,})")
+        if parts:
+            logger.info("Latency: " + " | ".join(parts))
+
+    def stats(self) -> dict[str, Any]:
+        return {name: hist.stats() for name, hist in list(self._histograms.items())}